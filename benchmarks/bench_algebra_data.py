@@ -0,0 +1,76 @@
+"""
+Accumulation of terms in AlgebraData: rescanning for zeros after each insert vs pruning once
+
+run with `python benchmarks/bench_algebra_data.py > bench_output.txt`
+"""
+
+import timeit
+
+from algebrant.algebra.algebra_data import AlgebraData, algebra_mul
+from algebrant.clifford.clalg import ClAlg
+
+
+def rescan_accumulate(terms) -> AlgebraData:
+    """
+    previous AlgebraData.add behaviour: scan the whole dict after every insert
+    """
+    result = AlgebraData()
+
+    for basis, factor in terms:
+        if basis in result.basis_factor:
+            result.basis_factor[basis] += factor
+        else:
+            result.basis_factor[basis] = factor
+
+        if any(factor == 0 for factor in result.basis_factor.values()):
+            result.basis_factor = {
+                basis: factor for basis, factor in result.basis_factor.items() if factor != 0
+            }
+
+    return result
+
+
+def time_it(func, repeat=3) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def bench_accumulate() -> None:
+    print("accumulate n distinct terms")
+    print(f"{'n':>8} {'rescan [ms]':>12} {'deferred [ms]':>14} {'ratio':>8}")
+
+    alg = ClAlg.from_dim(16, bitmask=True)
+
+    for n in [100, 300, 1000, 3000]:
+        terms = [(alg.blade(mask), 1.0) for mask in range(1, n + 1)]
+
+        t_rescan = time_it(lambda: rescan_accumulate(terms))
+        t_deferred = time_it(lambda: AlgebraData.from_seq(terms))
+
+        print(f"{n:8} {t_rescan * 1e3:12.3f} {t_deferred * 1e3:14.3f} {t_rescan / t_deferred:8.1f}")
+
+
+def bench_mul() -> None:
+    print("\nproduct of two full multivectors of Cl(dim) (4**dim terms into 2**dim blades)")
+    print(f"{'dim':>8} {'rescan [ms]':>12} {'deferred [ms]':>14} {'ratio':>8}")
+
+    for dim in [4, 5, 6, 7]:
+        alg = ClAlg.from_dim(dim, bitmask=True)
+        x = alg.rand().basis_factor
+        y = alg.rand().basis_factor
+
+        def terms():
+            return (term for b1, f1 in x for b2, f2 in y for term in algebra_mul(b1, f1, b2, f2))
+
+        t_rescan = time_it(lambda: rescan_accumulate(terms()), repeat=1)
+        t_deferred = time_it(lambda: x * y, repeat=1)
+
+        print(
+            f"{dim:8} {t_rescan * 1e3:12.3f} {t_deferred * 1e3:14.3f} {t_rescan / t_deferred:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    bench_accumulate()
+    bench_mul()
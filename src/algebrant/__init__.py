@@ -13,8 +13,9 @@ try:
 
     colorful.use_true_colors()  # type: ignore
 
-    text_printer = get_ipython().display_formatter.formatters["text/plain"]  # type: ignore
-    text_printer.for_type(colorful.core.ColorfulString, color_print)
+    if (ipython := get_ipython()) is not None:  # None outside of IPython (e.g. pytest)
+        text_printer = ipython.display_formatter.formatters["text/plain"]  # type: ignore
+        text_printer.for_type(colorful.core.ColorfulString, color_print)
 
 except ImportError:
     pass
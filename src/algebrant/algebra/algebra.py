@@ -1,12 +1,14 @@
-import math
+import itertools
 import numbers
 from collections.abc import Callable, Iterable
 from types import NotImplementedType
 from typing import Any, Self
 
 import numpy as np
-from algebrant.algebra.algebra_data import AlgebraData, algebra_mul
+from algebrant.algebra.algebra_data import MUL_CACHE, AlgebraData
 from algebrant.algebra.basis import BasisProtocol
+from algebrant.algebra.ownership import link_version, record_undo, reroot
+from algebrant.algebra.zero_prune import EXACT_PRUNING, PRUNE_CONFIG, ZeroPruning
 
 # from algebrant.algebra.operations import (
 #     algebra_add,
@@ -28,9 +30,6 @@ Note:
 """
 
 
-ZERO_FLOAT_TOLERANCE = 1e-9
-
-
 def dot_product(a, b) -> Any:  # TODO: complex return?
     if isinstance(a, Algebra) and isinstance(b, Algebra):  # TODO: `b` needs to be Algebra?
         return a.dot(b)
@@ -118,6 +117,7 @@ class Algebra[Basis: BasisProtocol](PlainReprMixin):
                 )
 
         self.basis_factor = basis_factor
+        basis_factor._claims += 1
         self.basis_class = basis_class
         self.unity_basis = basis_class.unity()
         self.op_prio = op_prio
@@ -132,6 +132,23 @@ class Algebra[Basis: BasisProtocol](PlainReprMixin):
             op_prio=self.op_prio,
         )
 
+    @property
+    def _zero_pruning(self) -> ZeroPruning:
+        """
+        rule for in-place operators; should match the pruning of _new
+        """
+        return EXACT_PRUNING
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        only called for missing attributes: basis_factor was given to a newer version by +=
+        """
+        if name == "basis_factor" and "_newer" in self.__dict__:
+            reroot(self)
+            return self.__dict__["basis_factor"]
+
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
     def _factor_algebradata(self, factor: Factor) -> AlgebraData[Basis]:
         return AlgebraData.make_single(self.unity_basis, factor)
 
@@ -185,6 +202,116 @@ class Algebra[Basis: BasisProtocol](PlainReprMixin):
     def __radd__(self, first: Any) -> Self:
         return self + first
 
+    def _can_merge(self, other: Any) -> bool:
+        return (
+            type(other) is type(self)
+            and other.op_prio == self.op_prio
+            and other.basis_class == self.basis_class
+        )
+
+    @staticmethod
+    def sum(elems: Iterable[Any]) -> Any:
+        """
+        single pass sum: all elements of the same algebra as the first one are merged into one
+        AlgebraData (one validation, one prune); numbers are collected into the scalar part
+        any other summands (other algebras, arrays, ...) are added with `+` at the end
+        """
+        return Algebra.linear_combination(itertools.repeat(1), elems, strict=False)
+
+    @staticmethod
+    def linear_combination(coefs: Iterable[Any], elems: Iterable[Any], *, strict=True) -> Any:
+        """
+        sum(coef * elem) in a single pass like Algebra.sum; coefs are left-multiplied
+        non-number coefs (e.g. symbols) are multiplied with `*`
+        strict: raise ValueError if coefs and elems have different lengths (as zip)
+        """
+        template: Algebra | None = None
+        data: list[AlgebraData] = []
+        scalar: Any = 0
+        rest: Any = 0
+
+        for coef, elem in zip(coefs, elems, strict=strict):
+            if isinstance(coef, numbers.Number):
+                if coef == 0:
+                    continue
+
+                if isinstance(elem, numbers.Number):
+                    scalar += coef * elem
+                    continue
+
+                if isinstance(elem, Algebra) and (template is None or template._can_merge(elem)):
+                    template = elem if template is None else template
+                    data.append(
+                        elem.basis_factor if coef == 1 else elem.basis_factor.left_mul(coef)
+                    )
+                    continue
+
+            rest = rest + coef * elem
+
+        if template is None:
+            return rest + scalar
+
+        if scalar != 0:
+            data.append(template._factor_algebradata(scalar))
+
+        result = template._new(
+            AlgebraData.from_seq(itertools.chain.from_iterable(data), prune=template._zero_pruning)
+        )
+
+        if isinstance(rest, numbers.Number) and rest == 0:
+            return result
+
+        return result + rest
+
+    def __iadd__(self, other: Any) -> Self:
+        """
+        linear in the size of other; returns a new element and self is kept (see ownership.py)
+        """
+        return self._add_in_place(other, negate=False)
+
+    def __isub__(self, other: Any) -> Self:
+        return self._add_in_place(other, negate=True)
+
+    def _add_in_place(self, other: Any, *, negate: bool) -> Self:
+        if isinstance(other, numbers.Number) and other == 0:
+            return self
+
+        other_wrapped = self._ensure_prio(other)
+
+        if other_wrapped is NotImplemented:
+            return self - other if negate else self + other
+
+        data = self.basis_factor
+        other_data = other_wrapped.basis_factor
+
+        if data._claims > 1 or other_data is data:  # held by other elements
+            data = AlgebraData(data.basis_factor.copy())
+            data.add_in_place(other_data, negate=negate, prune=self._zero_pruning)
+            return self._successor(data)
+
+        undo = record_undo(data.basis_factor, other_data.basis_factor)
+        data.add_in_place(other_data, negate=negate, prune=self._zero_pruning)
+
+        data._claims -= 1
+        result = self._successor(data)
+        link_version(self, result, undo)
+
+        return result
+
+    def _successor(self, basis_factor: AlgebraData[Basis]) -> Self:
+        """
+        element with the properties of self for data which is already checked and pruned
+        (skips the checks of _new, which would make += linear in the size of self)
+        """
+        result = object.__new__(self.__class__)
+        result.basis_factor = basis_factor
+        basis_factor._claims += 1
+        result.basis_class = self.basis_class
+        result.unity_basis = self.unity_basis
+        result.op_prio = self.op_prio
+
+        return result
+
     def __neg__(self) -> Self:
         return self._new(-self.basis_factor)
 
@@ -196,12 +323,7 @@ class Algebra[Basis: BasisProtocol](PlainReprMixin):
 
     def __eq__(self, other) -> bool:  # TODO: check
         if other == 0:
-            return all(
-                math.isclose(factor, 0, abs_tol=ZERO_FLOAT_TOLERANCE)
-                if isinstance(factor, numbers.Real)
-                else factor == 0
-                for _basis, factor in self.basis_factor
-            )
+            return all(PRUNE_CONFIG.compare.is_zero(factor) for _basis, factor in self.basis_factor)
 
         other = self._ensure_prio(other)
 
@@ -323,7 +445,13 @@ class Algebra[Basis: BasisProtocol](PlainReprMixin):
         """
         Implement algebradata.algebra_mul for basis to define multiplication
         """
-        return self._mul(other, algebra_mul)
+        if isinstance(other, numbers.Number) and other != 0 and other != 1:
+            # scale directly, since a wrapped small number would already be pruned like a result
+            return self._new(
+                AlgebraData({basis: factor * other for basis, factor in self.basis_factor})
+            )
+
+        return self._mul(other, MUL_CACHE)
 
     def __rmul__(self, first: Factor) -> Self:
         """
@@ -339,6 +467,22 @@ class Algebra[Basis: BasisProtocol](PlainReprMixin):
         # TODO: infinite recursion possible?
         return self._new(self._factor_algebradata(first) * self.basis_factor)
 
+    def __imul__(self, other: Any) -> Self:
+        """
+        a scalar factor changes every term anyway, so this is the same as self * other
+        """
+        return self * other
+
+    def _mul_data(
+        self,
+        other: Self,
+        basis_mul: Callable[[Basis, Factor, Basis, Factor], Iterable[tuple[Basis, Factor]]],
+    ) -> AlgebraData[Basis]:
+        """
+        all term pairs; subclasses may skip pairs which basis_mul would drop anyway
+        """
+        return self.basis_factor.mul(other.basis_factor, basis_mul)
+
     def _mul(
         self,
         other: Any,
@@ -361,7 +505,7 @@ class Algebra[Basis: BasisProtocol](PlainReprMixin):
             return NotImplemented
 
         try:
-            result = self._new(self.basis_factor.mul(other_wrapped.basis_factor, basis_mul))
+            result = self._new(self._mul_data(other_wrapped, basis_mul))
 
             return result
         except NotImplementedError:
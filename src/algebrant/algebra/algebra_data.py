@@ -5,6 +5,9 @@ from types import NotImplementedType
 from typing import Any, Iterator, Self
 
 from algebrant.algebra.basis import BasisProtocol
+from algebrant.algebra.mul_cache import BasisMulCache
+from algebrant.algebra.zero_prune import EXACT_PRUNING, ZeroPruning
+from algebrant.common import is_zero
 
 Factor = Any
 
@@ -20,6 +23,10 @@ def algebra_mul[Basis](  # TODO: correct?
     )
 
 
+# optional memoization of algebra_mul; enable with MUL_CACHE.resize(maxsize)
+MUL_CACHE = BasisMulCache(algebra_mul)
+
+
 @dataclass
 class AlgebraData[Basis: BasisProtocol]:
     """
@@ -28,6 +35,8 @@ class AlgebraData[Basis: BasisProtocol]:
     """
 
     basis_factor: dict[Basis, Factor] = field(default_factory=dict)
+    # number of Algebra elements holding this data; in-place operators only mutate unclaimed data
+    _claims: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.basis_factor = {
@@ -35,28 +44,26 @@ class AlgebraData[Basis: BasisProtocol]:
         }
 
     @classmethod
-    def from_seq(cls, seq: Iterable[tuple[Basis, Factor]]) -> Self:
-        basis_factor: dict[Basis, Factor] = {}
-
-        for basis, factor in seq:
-            if basis in basis_factor:
-                basis_factor[basis] += factor
-            else:
-                basis_factor[basis] = factor
-
-        return cls(basis_factor)
+    def from_seq(
+        cls, seq: Iterable[tuple[Basis, Factor]], *, prune: ZeroPruning = EXACT_PRUNING
+    ) -> Self:
+        """
+        accumulates all terms first and prunes zeros only once (linear in the number of terms)
+        """
+        return cls(prune.accumulate(seq))
 
     def add(self, basis: Basis, factor: Factor) -> None:
+        """
+        for single terms; bulk operations should use from_seq
+        """
         if basis in self.basis_factor:
-            self.basis_factor[basis] += factor
+            factor = self.basis_factor[basis] + factor
+
+        if is_zero(factor):
+            self.basis_factor.pop(basis, None)
         else:
             self.basis_factor[basis] = factor
 
-        if any(factor == 0 for factor in self.basis_factor.values()):
-            self.basis_factor = {
-                basis: factor for basis, factor in self.basis_factor.items() if factor != 0
-            }
-
     def __repr__(self) -> str:
         return (
             "{ "
@@ -85,6 +92,64 @@ class AlgebraData[Basis: BasisProtocol]:
 
         return self.__class__(new_basis_factor)
 
+    def add_in_place(
+        self, other: Self, *, negate: bool = False, prune: ZeroPruning = EXACT_PRUNING
+    ) -> None:
+        """
+        only the touched entries are checked for zeros
+        """
+        basis_factor = self.basis_factor
+
+        for basis, factor in other.basis_factor.items():
+            if negate:
+                factor = -factor
+
+            if basis in basis_factor:
+                factor = basis_factor[basis] + factor
+
+            if prune.is_zero(factor):
+                basis_factor.pop(basis, None)
+            else:
+                basis_factor[basis] = factor
+
+    def left_mul_in_place(self, factor: Factor, *, prune: ZeroPruning = EXACT_PRUNING) -> None:
+        self.basis_factor = prune.prune(
+            {basis: factor * prev_factor for basis, prev_factor in self.basis_factor.items()}
+        )
+
+    def __iadd__(self, other: Self) -> Self:
+        if not isinstance(other, AlgebraData):
+            return NotImplemented
+
+        if self._claims:
+            return self + other
+
+        self.add_in_place(other)
+        return self
+
+    def __isub__(self, other: Self) -> Self:
+        if not isinstance(other, AlgebraData):
+            return NotImplemented
+
+        if self._claims:
+            return self - other
+
+        self.add_in_place(other, negate=True)
+        return self
+
+    def __imul__(self, factor: Factor) -> Self:
+        """
+        only scalar factors; AlgebraData products fall back to __mul__
+        """
+        if isinstance(factor, AlgebraData):
+            return NotImplemented
+
+        if self._claims:
+            return self.left_mul(factor)
+
+        self.left_mul_in_place(factor)
+        return self
+
     def __neg__(self) -> Self:
         return self.__class__({basis: -factor for basis, factor in self.basis_factor.items()})
 
@@ -104,21 +169,19 @@ class AlgebraData[Basis: BasisProtocol]:
         """
         general bilinear multiplication
         """
-        result = self.__class__()
-
-        for b1, f1 in self.basis_factor.items():
-            for b2, f2 in other.basis_factor.items():
-                for new_b, new_f in mul_func(b1, f1, b2, f2):
-                    result.add(new_b, new_f)
-
-        return result
+        return self.from_seq(
+            term
+            for b1, f1 in self.basis_factor.items()
+            for b2, f2 in other.basis_factor.items()
+            for term in mul_func(b1, f1, b2, f2)
+        )
 
     def __mul__(self, other: Self) -> Self | NotImplementedType:
         """
         defaults to algebra_mul
         """
         try:
-            return self.mul(other, algebra_mul)
+            return self.mul(other, MUL_CACHE)
         except NotImplementedError:
             return NotImplemented
 
@@ -132,35 +195,31 @@ class AlgebraData[Basis: BasisProtocol]:
         """
         replaces basis and factor separately
         """
-        result = self.__class__()
 
-        for basis, factor in self.basis_factor.items():
-            new_basis_data = func(basis)
+        def terms() -> Iterator[tuple[Basis, Factor]]:
+            for basis, factor in self.basis_factor.items():
+                new_basis_data = func(basis)
 
-            if recursive and isinstance(factor, AlgebraData):
-                factor = factor.replace(func)  # TODO: type correct if Basis different?
-            elif func_factor is not None:
-                factor = func_factor(factor)
+                if recursive and isinstance(factor, AlgebraData):
+                    factor = factor.replace(func)  # TODO: type correct if Basis different?
+                elif func_factor is not None:
+                    factor = func_factor(factor)
 
-            if new_basis_data is None:
-                result.add(basis, factor)
-            else:
-                for new_basis, new_basis_factor in new_basis_data:
-                    result.add(new_basis, factor * new_basis_factor)
+                if new_basis_data is None:
+                    yield basis, factor
+                else:
+                    for new_basis, new_basis_factor in new_basis_data:
+                        yield new_basis, factor * new_basis_factor
 
-        return result
+        return self.from_seq(terms())
 
     def map(self, func: Callable[[Basis, Factor], Iterable[tuple[Basis, Factor]]]) -> Self:
         """
         maps a basis-factor pair by a function
         """
-        result = self.__class__()
-
-        for basis, factor in self.basis_factor.items():
-            for new_basis, new_factor in func(basis, factor):
-                result.add(new_basis, new_factor)
-
-        return result
+        return self.from_seq(
+            term for basis, factor in self.basis_factor.items() for term in func(basis, factor)
+        )
 
     def __iter__(self) -> Iterator[tuple[Basis, Any]]:
         return iter(self.basis_factor.items())
@@ -1,7 +1,5 @@
-import itertools
 import numbers
-import operator
-from functools import reduce, singledispatch
+from functools import singledispatch
 from typing import Any, Self
 
 from algebrant.algebra.algebra import BasisProtocol, Factor
@@ -18,17 +16,39 @@ class MultiplicationMixin:
     # TODO: need to declare that __mul__ and __add__ are required?
 
     def __pow__(self, power: int) -> Self:
+        """
+        exponentiation by squaring; negative powers invert only once
+        """
         if not isinstance(power, int):
             raise ValueError(f"Cannot pow by {power}. Only integers implemented.")
 
         if power == 0:
             return self._unity(1)
-        elif power >= 1:
-            result = reduce(operator.mul, itertools.repeat(self, power))
-        elif power <= -1:
-            result = reduce(operator.mul, itertools.repeat(1 / self, abs(power)))
-        else:
-            raise ValueError(f"Power {power} not recognized")
+
+        base = self if power > 0 else 1 / self
+        power = abs(power)
+
+        result = None
+        while True:
+            if power & 1:
+                result = base if result is None else result * base
+
+            power >>= 1
+            if not power:
+                return result
+
+            base = base * base
+
+    def powers(self, max_power: int) -> list[Self]:
+        """
+        [x, x**2, ..., x**max_power] with one product per power (e.g. for series)
+        """
+        if not isinstance(max_power, int) or max_power < 1:
+            raise ValueError(f"Cannot create powers up to {max_power}. Needs positive integer.")
+
+        result = [self]
+        for _ in range(max_power - 1):
+            result.append(result[-1] * self)
 
         return result
 
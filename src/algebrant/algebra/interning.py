@@ -0,0 +1,57 @@
+import dataclasses
+import weakref
+from typing import Any
+
+"""
+Interning (hash-consing) of basis objects
+
+each distinct basis exists only once while it is referenced, so that
+* equality is identity and the hash is computed only once
+* calculated fields (sort_key, grade, ...) are computed only once per distinct basis
+
+subclasses implement `_intern_key` which maps the constructor arguments to a hashable key
+the key must determine the object completely (i.e. equal keys <=> previously equal objects)
+"""
+
+
+class InternedMeta(type):
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        key = cls._intern_key(*args, **kwargs)  # type: ignore
+
+        instances = cls.__dict__.get("_instances")
+        if instances is None:  # one table per class, so that subclasses stay distinct
+            instances = weakref.WeakValueDictionary()
+            cls._instances = instances  # type: ignore
+
+        obj = instances.get(key)
+        if obj is None:
+            obj = super().__call__(*args, **kwargs)
+            obj._intern_hash = hash(key)
+            instances[key] = obj
+
+        return obj
+
+
+class Interned(metaclass=InternedMeta):
+    """
+    use with `@dataclass(eq=False)` so that the identity __eq__ and the cached __hash__ are kept
+    """
+
+    _intern_hash: int
+
+    @classmethod
+    def _intern_key(cls, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError(f"_intern_key not implemented for {cls}")
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return self._intern_hash
+
+    def __reduce__(self) -> tuple:
+        """
+        pickle and copy through the constructor to keep instances unique
+        """
+        args = tuple(getattr(self, f.name) for f in dataclasses.fields(self) if f.init)  # type: ignore
+        return (self.__class__, args)
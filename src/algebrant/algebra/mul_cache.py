@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+"""
+LRU cache for basis products
+
+a basis product is a pure function of (basis1, basis2) up to the factors:
+
+    basis_mul(b1, f1, b2, f2) = [(b, f1 * c * T(f2)) for b, c in basis_mul(b1, 1, b2, 1)]
+
+where T(f2) commutes the factor past b1 (vector_conjugate for odd b1; as in graded.commute)
+so only the factor-free terms are cached
+"""
+
+BasisMulFunc = Callable[[Any, Any, Any, Any], Iterable[tuple[Any, Any]]]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class BasisMulCache:
+    """
+    wraps a basis multiplication function; disabled (pass-through) while maxsize is 0
+    """
+
+    def __init__(self, func: BasisMulFunc, maxsize: int = 0) -> None:
+        self.func = func
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._terms: OrderedDict[tuple[Any, Any], list[tuple[Any, Any]]] = OrderedDict()
+        self._excluded: set[type] = set()
+
+    def exclude(self, basis_class: type) -> None:
+        """
+        products with a first basis of this class are always passed through
+        (e.g. if the algebra does not commute its factors as above)
+        """
+        self._excluded.add(basis_class)
+
+    def __call__(
+        self, basis1: Any, factor1: Any, basis2: Any, factor2: Any
+    ) -> Iterable[tuple[Any, Any]]:
+        if not self.maxsize or type(basis1) in self._excluded:
+            return self.func(basis1, factor1, basis2, factor2)
+
+        key = (basis1, basis2)
+        terms = self._terms.get(key)
+
+        if terms is None:
+            self.misses += 1
+            terms = list(self.func(basis1, 1, basis2, 1))
+            self._terms[key] = terms
+
+            if len(self._terms) > self.maxsize:
+                self._terms.popitem(last=False)
+        else:
+            self.hits += 1
+            self._terms.move_to_end(key)
+
+        if getattr(basis1, "is_odd", False):
+            factor2 = getattr(factor2, "vector_conjugate", factor2)
+
+        factor = factor1 * factor2
+
+        return [(basis, factor * coef) for basis, coef in terms]
+
+    def resize(self, maxsize: int) -> None:
+        """
+        maxsize 0 disables the cache
+        """
+        self.maxsize = maxsize
+
+        while len(self._terms) > maxsize:
+            self._terms.popitem(last=False)
+
+    def clear(self) -> None:
+        self._terms.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits, misses=self.misses, size=len(self._terms), maxsize=self.maxsize
+        )
+
+    def __repr__(self) -> str:
+        return f"BasisMulCache({self.stats})"
@@ -0,0 +1,69 @@
+from typing import Any
+
+"""
+In-place operators (+=, -=) of Algebra elements in linear time while keeping value semantics
+
+`x += y` returns a new element which takes over the dict of x and updates only the terms of y
+x keeps a link to the new element and the previous factors of these terms; when x is used again,
+the changes are undone along the links and the dict moves back to x (rerooting of versions)
+in accumulation loops the old element is dropped right away, so its link is freed as well
+
+elements therefore never change: `b = a; a += x` leaves b unchanged and elements in sets or dicts
+keep their hash
+
+the dict of an AlgebraData held by several elements (see AlgebraData._claims) is copied first
+"""
+
+_MISSING = object()  # marks terms which did not exist in an undo record
+
+
+def record_undo(factors: dict, bases: Any) -> dict:
+    """
+    previous factors of bases, to be called before bases are updated
+    """
+    return {basis: factors.get(basis, _MISSING) for basis in bases}
+
+
+def link_version(old: Any, new: Any, undo: dict) -> None:
+    """
+    old gives its basis_factor to new; undo restores the factors of old
+    """
+    del old.basis_factor
+    old._newer = new
+    old._undo = undo
+
+
+def reroot(elem: Any) -> None:
+    """
+    moves the basis_factor back to elem by undoing the changes of the newer versions
+    """
+    path = []
+    node = elem
+
+    while "basis_factor" not in node.__dict__:
+        path.append(node)
+        node = node._newer
+
+    for older in reversed(path):
+        data = node.basis_factor
+        link_version(node, older, _apply(data.basis_factor, older._undo))
+
+        older.basis_factor = data
+        del older._newer, older._undo
+
+        node = older
+
+
+def _apply(factors: dict, undo: dict) -> dict:
+    """
+    returns the record which reverts this undo
+    """
+    redo = record_undo(factors, undo)
+
+    for basis, factor in undo.items():
+        if factor is _MISSING:
+            factors.pop(basis, None)
+        else:
+            factors[basis] = factor
+
+    return redo
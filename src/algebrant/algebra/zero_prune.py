@@ -0,0 +1,81 @@
+import contextlib
+import numbers
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
+from typing import Any
+
+from algebrant.common import is_zero
+
+"""
+Rules which factors count as zero and are dropped from results
+
+numeric factors are compared by absolute value, everything else (symbols, arrays) only by `== 0`
+"""
+
+
+@dataclass(frozen=True)
+class ZeroPruning:
+    abs_tol: float = 0.0
+
+    def is_zero(self, factor: Any) -> bool:
+        if isinstance(factor, numbers.Complex):
+            if not self.abs_tol:  # exact (e.g. Fraction); no abs() needed
+                return factor == 0
+
+            return abs(factor) <= self.abs_tol
+
+        return bool(is_zero(factor))
+
+    def prune[Basis](self, basis_factor: dict[Basis, Any]) -> dict[Basis, Any]:
+        return {basis: factor for basis, factor in basis_factor.items() if not self.is_zero(factor)}
+
+    def accumulate[Basis](self, terms: Iterable[tuple[Basis, Any]]) -> dict[Basis, Any]:
+        """
+        sums terms with equal basis and prunes only once at the end
+        """
+        basis_factor: dict[Basis, Any] = {}
+
+        for basis, factor in terms:
+            if basis in basis_factor:
+                basis_factor[basis] += factor
+            else:
+                basis_factor[basis] = factor
+
+        return self.prune(basis_factor)
+
+
+EXACT_PRUNING = ZeroPruning()
+
+
+@dataclass
+class PruneConfig:
+    """
+    clip: applied when creating numeric results (e.g. CliffordAlgebra products)
+    compare: applied for comparisons `elem == 0`
+    """
+
+    clip: ZeroPruning = ZeroPruning(abs_tol=1e-10)
+    compare: ZeroPruning = ZeroPruning(abs_tol=1e-9)
+
+
+PRUNE_CONFIG = PruneConfig()
+
+
+@contextlib.contextmanager
+def prune_rules(*, clip: float | None = None, compare: float | None = None) -> Iterator[None]:
+    """
+    temporarily change the tolerances, e.g. `with prune_rules(clip=0):` for exact results
+    """
+    previous = replace(PRUNE_CONFIG)
+
+    if clip is not None:
+        PRUNE_CONFIG.clip = ZeroPruning(abs_tol=clip)
+
+    if compare is not None:
+        PRUNE_CONFIG.compare = ZeroPruning(abs_tol=compare)
+
+    try:
+        yield
+    finally:
+        PRUNE_CONFIG.clip = previous.clip
+        PRUNE_CONFIG.compare = previous.compare
@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from algebrant.clifford.clifford_bit_basis import CliffordBitBasis
+
+if TYPE_CHECKING:
+    from algebrant.clifford.clalg import ClAlg
+
+"""
+Precomputed product table of all blades of a ClAlg
+
+blade index is the bitmask of CliffordBitBasis
+only products of CliffordBitBasis blades (ClAlg with bitmask, dense or dtype) use the table;
+CliffordBasis tuples (the default elements) are not tied to a ClAlg and multiply by ga_basis_mul
+"""
+
+CAYLEY_MAX_DIM = 10  # table has 4**dim entries
+
+
+def reorder_signs(size: int) -> np.ndarray:
+    """
+    vectorized clifford_bit_basis.reorder_sign for all pairs of masks below size
+    """
+    masks = np.arange(size)
+    mask1 = masks[:, None]
+    mask2 = masks[None, :]
+
+    swaps = np.zeros((size, size), dtype=np.int64)
+
+    for shift in range(1, max(size.bit_length() - 1, 1)):
+        swaps += np.bitwise_count((mask1 >> shift) & mask2)
+
+    return np.where(swaps % 2 == 1, -1, 1).astype(np.int8)
+
+
+class CayleyTable:
+    """
+    blade(a) * blade(b) = sign[a, b] * blade(index[a, b])
+
+    sign includes the metric of the generators and is 0 for degenerate products
+    """
+
+    def __init__(self, alg: "ClAlg") -> None:
+        self.dim = len(alg.bases)
+        self.size = 1 << self.dim
+
+        masks = np.arange(self.size)
+
+        metric = np.array([alg.metric(mask) for mask in range(self.size)])
+        if metric.dtype.kind in "iu":
+            metric = metric.astype(np.int8)
+
+        self.index: np.ndarray = masks[:, None] ^ masks[None, :]
+        self.sign: np.ndarray = reorder_signs(self.size) * metric[masks[:, None] & masks[None, :]]
+
+        # Python objects for the term-by-term products (numpy scalars would leak into factors)
+        self.sign_rows: list[list[Any]] = self.sign.tolist()
+        self.blades: list[CliffordBitBasis] = [alg.blade(mask) for mask in range(self.size)]
+
+    def __repr__(self) -> str:
+        return f"CayleyTable(dim={self.dim})"
@@ -0,0 +1,537 @@
+import math
+import numbers
+from typing import Any
+
+import numpy as np
+
+from algebrant.algebra.algebra_data import AlgebraData
+from algebrant.algebra.zero_prune import PRUNE_CONFIG, prune_rules
+
+"""
+Exponential, logarithm and square root of Clifford algebra elements
+
+bivectors B are split by the invariant decomposition into k commuting simple bivectors
+
+    B = B_1 + ... + B_k,   B_i * B_j = B_j * B_i,   B_i**2 = l_i (scalar)
+
+with the wedge powers W_m = B^m / m! (W_m = sum of the products of m different B_i):
+  * <W_m * W_m> are the elementary symmetric polynomials of the l_i, so the l_i are the roots of
+    sum_m (-1)**m <W_m * W_m> x**(k-m)
+  * B_i = (sum_j even l_i**(j/2) W_k-j) * (sum_j odd l_i**((j-1)/2) W_k-j)^-1
+
+and exp(B) = prod_i (cosh(sqrt(l_i)) + B_i sinh(sqrt(l_i)) / sqrt(l_i))
+
+for k <= 2 (e.g. up to dimension 5) the B_i are not needed explicitly, since with W_2 = B_1 * B_2
+
+    f_1 B_1 + f_2 B_2 = (f_1 l_1 - f_2 l_2) / (l_1 - l_2) B - (f_1 - f_2) / (l_1 - l_2) W_2 * B
+
+which stays finite for l_1 = l_2 and is real for complex conjugate l_i (e.g. Cl(3,1)); these
+closed forms are also evaluated for batches (MultivectorArray)
+
+rotors R = l prod_i (c_i + s_i B_i) have the bivector part V = <R>_2 = sum_i V_i in the same planes and
+with c = <R>_0 each c + V_i = (c / c_i) (c_i + s_i B_i), so with the normalized simple rotors
+U_i = (c_i / c) (c + V_i) (taken with c_i >= 0 except for the plane with the smallest |c_i| if the
+sign of c requires it)
+
+    log(R) = log(l) + sum_i log(U_i)      l = c / prod_i c_i
+
+each plane is therefore taken relative to its own c_i, which keeps the angles principal for c < 0
+
+other elements use scaling and squaring of a Pade approximant (exp) and inverse scaling and
+squaring with Denman-Beavers square roots (log, sqrt)
+"""
+
+PADE_ORDER = 6
+PADE_COEFS = [
+    math.factorial(2 * PADE_ORDER - j)
+    * math.factorial(PADE_ORDER)
+    / (math.factorial(2 * PADE_ORDER) * math.factorial(j) * math.factorial(PADE_ORDER - j))
+    for j in range(PADE_ORDER + 1)
+]
+PADE_MAX_NORM = 0.5  # coefficient 1-norm after scaling; error below 1e-16
+
+ITERATION_TOL = 1e-13
+ROTOR_TOL = 1e-7  # relative; the split of nearly equal plane squares is ill-conditioned
+MAX_ITERATIONS = 100
+
+
+def cl_exp(elem: Any) -> Any:
+    unity = elem**0
+    scalar = elem.scalar
+    non_scalar = elem.take_grades(lambda g: g > 0)
+
+    if not non_scalar.basis_factor:
+        return unity * _exp(scalar)
+
+    real = _is_real(elem)
+
+    if (sqr := _scalar_sqr(non_scalar)) is not None:  # e.g. simple bivectors and vectors
+        cosh, sinhc = _cosh_sinhc(sqr)
+        return (unity * _scalar(cosh, real) + non_scalar * _scalar(sinhc, real)) * _exp(scalar)
+
+    if non_scalar.grades == {2}:
+        wedge_powers = _wedge_powers(non_scalar)
+
+        if len(wedge_powers) == 3:
+            return _exp_two_planes(non_scalar, wedge_powers[2], unity, real=real) * _exp(scalar)
+
+        try:
+            planes = bivector_split(non_scalar)
+        except (ValueError, ZeroDivisionError):
+            pass
+        else:
+            result = unity * _exp(scalar)
+
+            for plane, sqr in planes:
+                cosh, sinhc = _cosh_sinhc(sqr)
+                result = result * (unity * _scalar(cosh, False) + plane * _scalar(sinhc, False))
+
+            return _real_elem(result) if real else result
+
+    return _pade_exp(elem)
+
+
+def cl_log(elem: Any) -> Any:
+    """
+    principal logarithm for rotors (R = exp(B) with B a bivector); raises ValueError if no
+    logarithm is found
+    """
+    if not elem.basis_factor:
+        raise ValueError("Logarithm of zero")
+
+    unity = elem**0
+    scalar = elem.scalar
+    non_scalar = elem.take_grades(lambda g: g > 0)
+    real = _is_real(elem)
+
+    if not non_scalar.basis_factor:
+        return unity * _scalar(np.log(complex(scalar)), real)
+
+    if (sqr := _scalar_sqr(non_scalar)) is not None:
+        a, t = _log_simple(scalar, sqr)
+        return unity * _scalar(a, real) + non_scalar * _scalar(t, real)
+
+    if scalar != 0 and elem.grades <= {0, 2, 4, 6, 8} and 2 in elem.grades:
+        if (result := _rotor_log(elem, scalar, real)) is not None:
+            return result
+
+    return _iterative_log(elem)
+
+
+def cl_sqrt(elem: Any) -> Any:
+    """
+    principal square root
+    """
+    unity = elem**0
+    scalar = elem.scalar
+    non_scalar = elem.take_grades(lambda g: g > 0)
+    real = _is_real(elem)
+
+    if not non_scalar.basis_factor:
+        return unity * _scalar(np.sqrt(complex(scalar)), real)
+
+    if (sqr := _scalar_sqr(non_scalar)) is not None:
+        # (c + N)**2 = c**2 + sqr / (4 c**2) + N with c**2 = (scalar + sqrt(scalar**2 - sqr)) / 2
+        c = np.sqrt((scalar + np.sqrt(complex(scalar) ** 2 - sqr)) / 2)
+
+        if c != 0:
+            return unity * _scalar(c, real) + non_scalar * _scalar(1 / (2 * c), real)
+
+    if scalar != 0 and elem.grades <= {0, 2, 4, 6, 8} and 2 in elem.grades:
+        if (log := _rotor_log(elem, scalar, real)) is not None:
+            return cl_exp(log * 0.5)
+
+    return _denman_beavers_sqrt(elem)
+
+
+def bivector_split(bivector: Any) -> list[tuple[Any, Any]]:
+    """
+    invariant decomposition into commuting simple bivectors: [(B_i, B_i**2), ...]
+    raises ValueError if the squares are not distinct (then the split is not unique)
+    """
+    norm = _coef_norm(bivector)
+    real = _is_real(bivector)
+    result = []
+
+    # wedge powers of higher grade have small coefficients, which the clip tolerance would remove
+    with prune_rules(clip=0):
+        wedge_powers = _wedge_powers(bivector * (1 / norm))
+        num_planes = len(wedge_powers) - 1
+
+        symmetric = [power.scalar_product(power) for power in wedge_powers]
+        sqrs = np.roots([(-1) ** m * symmetric[m] for m in range(num_planes + 1)])
+
+        for i in range(num_planes):
+            for j in range(i):
+                if abs(sqrs[i] - sqrs[j]) <= 1e-8:
+                    raise ValueError(f"No unique split of {bivector} for equal squares {sqrs}")
+
+        for sqr in sqrs:
+            even = sum(
+                (
+                    wedge_powers[num_planes - j] * complex(sqr ** (j // 2))
+                    for j in range(0, num_planes + 1, 2)
+                )
+            )
+            odd = sum(
+                (
+                    wedge_powers[num_planes - j] * complex(sqr ** (j // 2))
+                    for j in range(1, num_planes + 1, 2)
+                )
+            )
+            result.append((even * _inverse(odd), sqr))
+
+    planes = []
+
+    for plane, sqr in result:
+        plane = plane * norm
+
+        if real and abs(sqr.imag) <= 1e-12:
+            plane = _real_elem(plane)
+
+        planes.append((plane, _scalar(sqr * norm**2, real)))
+
+    return planes
+
+
+def exp_batch(arr: Any) -> Any:
+    """
+    exp for a MultivectorArray; closed form for scalar plus bivector batches with k <= 2
+    """
+    bivector = arr.take_grades(2)
+    wedge2 = (bivector ^ bivector) * 0.5
+
+    if not arr.grades <= {0, 2} or (wedge2 ^ bivector).grades:
+        return _elementwise(arr, cl_exp)
+
+    real = not np.iscomplexobj(arr.coefs)
+
+    return _exp_two_planes(bivector, wedge2, 1, real=real) * _scalar(np.exp(arr.scalar), real)
+
+
+def log_batch(arr: Any) -> Any:
+    """
+    log for a MultivectorArray; closed form for batches of rotors with k <= 2
+    """
+    scalar = arr.scalar
+    bivector = arr.take_grades(2)
+    wedge2 = (bivector ^ bivector) * 0.5
+
+    if (
+        not arr.grades <= {0, 2, 4}
+        or (wedge2 ^ bivector).grades
+        or np.any(scalar == 0)
+        or np.any((arr - scalar - bivector - wedge2 / scalar).coef_norm > 1e-9)
+    ):
+        return _elementwise(arr, cl_log)
+
+    real = not np.iscomplexobj(arr.coefs)
+
+    return _log_two_planes(scalar, bivector, wedge2, 1, real=real)
+
+
+def sqrt_batch(arr: Any) -> Any:
+    """
+    sqrt for a MultivectorArray; exp(log(R) / 2) for batches of rotors with k <= 2
+    """
+    if np.any(arr.scalar == 0) or not arr.grades <= {0, 2, 4}:
+        return _elementwise(arr, cl_sqrt)
+
+    return exp_batch(log_batch(arr) * 0.5)
+
+
+def _elementwise(arr: Any, func) -> Any:
+    size = arr.coefs.shape[-1]
+    elems = [arr.alg.from_coefs(coefs) for coefs in arr.coefs.reshape(-1, size)]
+    coefs = np.array([arr._elem_coefs(func(elem), arr.alg) for elem in elems])
+
+    return arr._new(coefs.reshape(arr.coefs.shape[:-1] + (size,)))
+
+
+def _wedge_powers(bivector: Any) -> list[Any]:
+    """
+    [1, B, B^B/2, B^B^B/6, ...] up to the last non-zero
+    """
+    result = [bivector**0, bivector]
+
+    while True:
+        power = (result[-1] ^ bivector) * (1 / len(result))
+
+        if not power.basis_factor:
+            return result
+
+        result.append(power)
+
+
+def _exp_two_planes(bivector: Any, wedge2: Any, unity: Any, *, real: bool) -> Any:
+    """
+    exp(B) = c_1 c_2 + s_1 s_2 W_2 + s_1 c_2 B_1 + c_1 s_2 B_2
+    """
+    sqr1, sqr2 = _quadratic_roots(bivector.scalar_product(bivector), wedge2.scalar_product(wedge2))
+    cosh1, sinhc1 = _cosh_sinhc(sqr1)
+    cosh2, sinhc2 = _cosh_sinhc(sqr2)
+    coef_b, coef_wb = _plane_coefs(sinhc1 * cosh2, cosh1 * sinhc2, sqr1, sqr2)
+
+    return (
+        unity * _scalar(cosh1 * cosh2, real)
+        + wedge2 * _scalar(sinhc1 * sinhc2, real)
+        + bivector * _scalar(coef_b, real)
+        - (wedge2 * bivector) * _scalar(coef_wb, real)
+    )
+
+
+def _log_two_planes(scalar: Any, bivector: Any, wedge2: Any, unity: Any, *, real: bool) -> Any:
+    """
+    log(c + V + W_2 / c) = log(c + V_1) + log(c + V_2) - log(c)
+    """
+    sqr1, sqr2 = _quadratic_roots(bivector.scalar_product(bivector), wedge2.scalar_product(wedge2))
+    a1, t1 = _log_simple(scalar, sqr1)
+    a2, t2 = _log_simple(scalar, sqr2)
+    coef_b, coef_wb = _plane_coefs(t1, t2, sqr1, sqr2)
+
+    return (
+        unity * _scalar(a1 + a2 - np.log(np.asarray(scalar, dtype=complex)), real)
+        + bivector * _scalar(coef_b, real)
+        - (wedge2 * bivector) * _scalar(coef_wb, real)
+    )
+
+
+def _rotor_log(rotor: Any, scalar: Any, real: bool) -> Any:
+    """
+    None if rotor is not c**(1-k) * prod_i (c + V_i)
+    """
+    unity = rotor**0
+    bivector = rotor.take_grades(2)
+    wedge_powers = _wedge_powers(bivector)
+
+    if len(wedge_powers) <= 3:
+        wedge2 = wedge_powers[2] if len(wedge_powers) == 3 else bivector * 0
+
+        if not _is_close(rotor, scalar + bivector + wedge2 * (1 / scalar)):
+            return None
+
+        return _log_two_planes(scalar, bivector, wedge2, unity, real=real)
+
+    try:
+        planes = bivector_split(bivector)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+    scalar = complex(scalar)
+    product = unity
+
+    for plane, _ in planes:
+        product = product * (unity * scalar + plane)
+
+    if not _is_close(rotor, product * (scalar ** (1 - len(planes)))):
+        return None
+
+    # c_i / c = 1 / sqrt(c**2 - V_i**2) up to the sign
+    ratios = [1 / np.sqrt(scalar**2 - complex(sqr)) for _, sqr in planes]
+    signs = [1 if (scalar * ratio).real >= 0 else -1 for ratio in ratios]
+    plane_scalars = [sign * scalar * ratio for sign, ratio in zip(signs, ratios)]
+    factor = scalar / math.prod(plane_scalars)
+
+    if factor.real < 0:  # rotate the plane with the largest angle beyond pi / 2
+        i = min(range(len(planes)), key=lambda i: abs(plane_scalars[i]))
+        signs[i] = -signs[i]
+        plane_scalars[i] = -plane_scalars[i]
+        factor = -factor
+
+    result = unity * np.log(factor)
+
+    for (plane, sqr), sign, ratio, plane_scalar in zip(planes, signs, ratios, plane_scalars):
+        a, t = _log_simple(plane_scalar, complex(sqr) * ratio**2)
+        result = result + unity * a.item() + plane * (t.item() * sign * ratio)
+
+    return _real_elem(result) if real else result
+
+
+def _iterative_log(elem: Any) -> Any:
+    """
+    log(A) = 2**s log(A**(1/2**s)) with log(X) = 2 atanh((X - 1) / (X + 1)) as series
+    """
+    unity = elem**0
+    x = elem
+    squarings = 0
+
+    while _coef_norm(x - unity) > 0.25:
+        if squarings >= 64:
+            raise ValueError(f"No logarithm found for {elem}")
+
+        x = _denman_beavers_sqrt(x)
+        squarings += 1
+
+    z = (x - unity) * (1 / (x + unity))
+    z_sqr = z * z
+    power = z
+    result = z
+
+    for j in range(1, 30):
+        power = power * z_sqr
+
+        if _coef_norm(power) < 1e-17:
+            break
+
+        result = result + power * (1 / (2 * j + 1))
+
+    return result * 2 ** (squarings + 1)
+
+
+def _denman_beavers_sqrt(elem: Any) -> Any:
+    """
+    product form of Denman-Beavers (stable, unlike the coupled Y, Z iteration):
+    M_k+1 = (1 + (M_k + M_k^-1) / 2) / 2, Y_k+1 = Y_k (1 + M_k^-1) / 2 converges to (1, sqrt(A))
+    """
+    unity = elem**0
+    m = elem
+    y = elem
+
+    for _ in range(MAX_ITERATIONS):
+        m_inv = _inverse(m)
+        y = y * (unity + m_inv) * 0.5
+        m = (unity + (m + m_inv) * 0.5) * 0.5
+
+        # M - 1 is clipped per coefficient, so it cannot get below the clip tolerance reliably
+        tol = max(ITERATION_TOL, PRUNE_CONFIG.clip.abs_tol * max(1, len(m.basis_factor)))
+
+        if _coef_norm(m - unity) <= tol:
+            return y
+
+    raise ValueError(f"No square root found for {elem}")
+
+
+def _pade_exp(elem: Any) -> Any:
+    unity = elem**0
+    norm = _coef_norm(elem)
+    squarings = max(0, math.ceil(math.log2(norm / PADE_MAX_NORM))) if norm > 0 else 0
+
+    x = elem * (0.5**squarings)
+    power = unity
+    numer = unity * PADE_COEFS[0]
+    denom = unity * PADE_COEFS[0]
+
+    for j, coef in enumerate(PADE_COEFS[1:], start=1):
+        power = power * x
+        numer = numer + power * coef
+        denom = denom + power * ((-1) ** j * coef)
+
+    result = numer * (1 / denom)
+
+    for _ in range(squarings):
+        result = result * result
+
+    return result
+
+
+def _scalar_sqr(elem: Any) -> Any:
+    """
+    elem**2 if it is a scalar, else None
+    """
+    sqr = elem * elem
+
+    if not sqr.grades <= {0}:
+        return None
+
+    return sqr.scalar
+
+
+def _quadratic_roots(sum_roots: Any, prod_roots: Any) -> tuple[Any, Any]:
+    disc = np.sqrt(np.asarray(sum_roots, dtype=complex) ** 2 - 4 * prod_roots)
+    return (sum_roots + disc) / 2, (sum_roots - disc) / 2
+
+
+def _plane_coefs(f1: Any, f2: Any, sqr1: Any, sqr2: Any) -> tuple[Any, Any]:
+    """
+    f1 B_1 + f2 B_2 = coef_b B - coef_wb W_2 * B; the difference quotient is 0 for sqr1 == sqr2
+    """
+    diff = sqr1 - sqr2
+    safe_diff = np.where(diff == 0, 1, diff)
+    coef_wb = np.where(diff == 0, 0, (f1 - f2) / safe_diff)
+
+    return f1 + coef_wb * sqr2, coef_wb
+
+
+def _cosh_sinhc(sqr: Any) -> tuple[Any, Any]:
+    """
+    (cosh(sqrt(sqr)), sinh(sqrt(sqr)) / sqrt(sqr)); real for real sqr
+    """
+    root = np.sqrt(np.asarray(sqr, dtype=complex))
+    safe_root = np.where(root == 0, 1, root)
+
+    return np.cosh(root), np.where(root == 0, 1, np.sinh(safe_root) / safe_root)
+
+
+def _log_simple(scalar: Any, sqr: Any) -> tuple[Any, Any]:
+    """
+    log(c + N) = a + t N for N**2 = sqr scalar
+    """
+    root = np.sqrt(np.asarray(sqr, dtype=complex))
+    safe_root = np.where(root == 0, 1, root)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_plus = np.log(scalar + root)
+        log_minus = np.log(scalar - root)
+        a = (log_plus + log_minus) / 2
+        t = np.where(
+            root == 0,
+            1 / np.asarray(scalar, dtype=complex),
+            (log_plus - log_minus) / (2 * safe_root),
+        )
+
+    return a, t
+
+
+def _exp(value: Any) -> Any:
+    if isinstance(value, numbers.Real):
+        return math.exp(value)
+
+    return np.exp(value)
+
+
+def _scalar(value: Any, real: bool) -> Any:
+    """
+    python number (or array for batches); real part if real is True and the imaginary part vanishes
+    """
+    value = np.asarray(value)
+
+    if real and np.all(np.abs(value.imag) <= 1e-12 * (1 + np.abs(value.real))):
+        value = value.real
+
+    return value.item() if value.ndim == 0 else value
+
+
+def _is_real(elem: Any) -> bool:
+    return all(isinstance(factor, numbers.Real) for _, factor in elem.basis_factor)
+
+
+def _real_elem(elem: Any) -> Any:
+    if all(
+        abs(complex(factor).imag) <= 1e-12 * (1 + abs(complex(factor).real))
+        for _, factor in elem.basis_factor
+    ):
+        return elem._new(
+            AlgebraData({basis: complex(factor).real for basis, factor in elem.basis_factor})
+        )
+
+    return elem
+
+
+def _inverse(elem: Any) -> Any:
+    """
+    inverse of the normalized element, since the zero pruning tolerances are absolute
+    """
+    norm = _coef_norm(elem)
+
+    return (1 / (elem * (1 / norm))) * (1 / norm)
+
+
+def _is_close(elem: Any, other: Any) -> bool:
+    """
+    equal up to ROTOR_TOL relative to the size of elem
+    """
+    return _coef_norm(elem - other) <= ROTOR_TOL * max(1, _coef_norm(elem))
+
+
+def _coef_norm(elem: Any) -> float:
+    return sum(abs(factor) for _, factor in elem.basis_factor)
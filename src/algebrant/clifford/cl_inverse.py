@@ -0,0 +1,225 @@
+from dataclasses import dataclass
+from typing import Any
+
+"""
+Inverse of Clifford algebra elements by closed formulas
+
+the dimension n is the number of basis vectors which appear in the element
+
+n <= 5: Hitzer-Sangwine type formulas
+    B = A * A.cl has only grades 4k+{0,3}; multiplying repeatedly by a grade sign flip of itself
+    reduces the grades until a scalar (the determinant) is left
+
+        A^-1 = A.cl * R1 * ... * Rm / det
+
+n = 6, 8: no such involution chain exists, so the characteristic polynomial of degree
+    N = 2**(n/2) is used as in Shirokov's formulas, but evaluated with few full products:
+    the powers A^2, A^3, A^4 and A^4k give all traces <A^i A^j> by scalar products,
+    Newton's identities give the coefficients c_k and the adjugate polynomial is evaluated in
+    blocks of 4 (Paterson-Stockmeyer)
+
+        A^-1 = -(A^N-1 + c_1 A^N-2 + ... + c_N-1) / c_N
+
+    4 full products for n = 6 and 8 for n = 8 (instead of 8 and 16)
+
+n = 7 and n >= 9: Faddeev-LeVerrier (characteristic polynomial) with N = matrix size of the
+    representation
+    for odd n the pseudoscalar is central, so the traces can take values in span(1, I)
+    which halves N (N = 2**((n-1)/2) instead of 2**((n+1)/2)); for n = 7 this is cheaper
+    than power sums with the real N = 16
+
+products whose result grades are known beforehand only compute these grades
+"""
+
+
+@dataclass(frozen=True)
+class InverseReport:
+    path: str
+    dimension: int
+    products: int  # multivector products (including grade-selective products)
+    scalar_products: int  # only the scalar part; linear in the number of terms
+
+
+POWER_SUM_DIMENSIONS = (6, 8)
+POWER_BLOCK = 4
+
+# per dimension: (grades of X, grades to flip for R = flipped X) for each step after B = A * A.cl
+FLIP_CHAINS: dict[int, list[tuple[frozenset[int], frozenset[int]]]] = {
+    0: [],
+    1: [],
+    2: [],
+    3: [(frozenset({0, 3}), frozenset({3}))],
+    4: [(frozenset({0, 3, 4}), frozenset({3, 4}))],
+    5: [
+        (frozenset({0, 3, 4}), frozenset({3})),
+        (frozenset({0, 1, 4}), frozenset({1, 4})),
+    ],
+}
+
+
+class _ProductCounter:
+    def __init__(self) -> None:
+        self.products = 0
+        self.scalar_products = 0
+
+    def product(self, x: Any, y: Any, grades=None) -> Any:
+        self.products += 1
+        return x.product(y, grades=grades)
+
+    def scalar_product(self, x: Any, y: Any) -> Any:
+        self.scalar_products += 1
+        return x.scalar_product(y)
+
+
+def inverse_dimension(elem: Any) -> int:
+    mask = 0
+    for basis, _ in elem.basis_factor:
+        mask |= basis.mask
+
+    return mask.bit_count()
+
+
+def cl_inverse(elem: Any) -> tuple[Any, InverseReport]:
+    """
+    returns (inverse, report of the path taken)
+    raises ZeroDivisionError if elem is not invertible
+    """
+    if not elem.basis_factor:
+        raise ZeroDivisionError("Division by Multivector zero")
+
+    dimension = inverse_dimension(elem)
+
+    if dimension in FLIP_CHAINS:
+        return _flip_chain_inverse(elem, dimension)
+
+    if dimension in POWER_SUM_DIMENSIONS:
+        return _power_sum_inverse(elem, dimension)
+
+    return _faddeev_leverrier_inverse(elem, dimension)
+
+
+def _flip_chain_inverse(elem: Any, dimension: int) -> tuple[Any, InverseReport]:
+    counter = _ProductCounter()
+    chain = FLIP_CHAINS[dimension]
+
+    numer = elem.cl  # reused for B and the numerator
+
+    if not chain:
+        det = counter.scalar_product(elem, numer)
+    else:
+        x = counter.product(elem, numer, grades=chain[0][0])
+
+        for i, (_, flip_grades) in enumerate(chain):
+            flipped = x.flip_grade_signs(lambda g: g in flip_grades)
+            numer = counter.product(numer, flipped)
+
+            if i + 1 < len(chain):
+                x = counter.product(x, flipped, grades=chain[i + 1][0])
+            else:
+                det = counter.scalar_product(x, flipped)
+
+    if det == 0:
+        raise ZeroDivisionError(f"Zero determinant for {elem}")
+
+    path = "cl" + "".join("*m" + "".join(map(str, sorted(flip_grades))) for _, flip_grades in chain)
+
+    return numer * (1 / det), InverseReport(
+        path=path,
+        dimension=dimension,
+        products=counter.products,
+        scalar_products=counter.scalar_products,
+    )
+
+
+def _power_sum_inverse(elem: Any, dimension: int) -> tuple[Any, InverseReport]:
+    """
+    p_k = tr(A^k) = N <A^i A^j> for i + j = k; k c_k = -(p_k + c_1 p_k-1 + ... + c_k-1 p_1)
+    only for even n, where the traces are N times the scalar parts
+    """
+    counter = _ProductCounter()
+    size = 2 ** (dimension // 2)
+
+    powers = [None, elem]  # A^0 is added as a number
+    for _ in range(POWER_BLOCK - 1):
+        powers.append(counter.product(powers[-1], elem))
+
+    block_powers = [None, powers[POWER_BLOCK]]  # block_powers[j] = A^(4j)
+    for _ in range(size // POWER_BLOCK - 2):
+        block_powers.append(counter.product(block_powers[-1], powers[POWER_BLOCK]))
+
+    power_sums = [size]
+    for k in range(1, size + 1):
+        block, rest = divmod(k - 1, POWER_BLOCK)
+
+        if block == 0:
+            trace = powers[rest + 1].scalar
+        else:
+            trace = counter.scalar_product(block_powers[block], powers[rest + 1])
+
+        power_sums.append(size * trace)
+
+    coefs = [1]
+    for k in range(1, size + 1):
+        coefs.append(-sum(coefs[i] * power_sums[k - i] for i in range(k)) / k)
+
+    det = coefs[size]
+
+    if det == 0:
+        raise ZeroDivisionError(f"Zero determinant for {elem}")
+
+    # adjugate polynomial sum_i coefs[N-1-i] A^i in blocks Q_j(A) = sum_r coefs[N-1-4j-r] A^r
+    adj = 0
+    for block in range(size // POWER_BLOCK):
+        start = size - 1 - POWER_BLOCK * block
+        block_adj = coefs[start] + sum(coefs[start - r] * powers[r] for r in range(1, POWER_BLOCK))
+        adj = adj + (block_adj if block == 0 else counter.product(block_powers[block], block_adj))
+
+    return adj * (-1 / det), InverseReport(
+        path=f"power-sums(N={size})",
+        dimension=dimension,
+        products=counter.products,
+        scalar_products=counter.scalar_products,
+    )
+
+
+def _faddeev_leverrier_inverse(elem: Any, dimension: int) -> tuple[Any, InverseReport]:
+    """
+    U_1 = A, c_k = N/k <U_k>, A_k = U_k - c_k, U_k+1 = A * A_k; A^-1 = A_N-1 / c_N
+    <.> is the scalar part (even n) or the central part of grades 0 and n (odd n)
+    """
+    counter = _ProductCounter()
+
+    if dimension % 2 == 1:
+        center_grades = frozenset({0, dimension})
+        size = 2 ** ((dimension - 1) // 2)
+    else:
+        center_grades = frozenset({0})
+        size = 2 ** (dimension // 2)
+
+    u = elem
+
+    for k in range(1, size):
+        adj = u - u.take_grades(*center_grades) * (size / k)
+        u = counter.product(elem, adj)
+
+    det = counter.product(elem, adj, grades=center_grades)  # only c_N = <U_N> needed
+
+    if det.grades <= {0}:
+        scalar = det.scalar
+        inverse = adj
+    else:  # central a + b I; (a + b I)(a - b I) = a^2 - b^2 I^2
+        det_flipped = det.flip_grade_signs(lambda g: g == dimension)
+        scalar = counter.scalar_product(det, det_flipped)
+        inverse = counter.product(adj, det_flipped)
+
+    if scalar == 0:
+        raise ZeroDivisionError(f"Zero determinant for {elem}")
+
+    path = "faddeev-leverrier" + ("/center" if dimension % 2 == 1 else "")
+
+    return inverse * (1 / scalar), InverseReport(
+        path=f"{path}(N={size})",
+        dimension=dimension,
+        products=counter.products,
+        scalar_products=counter.scalar_products,
+    )
@@ -25,18 +25,15 @@ def sqr_to_scalar(val: "CliffordAlgebra"):
     """
     non_scalar = val.take_grades(lambda g: g > 0)
 
-    bases, values = zip(*non_scalar)
+    bases = [basis for basis, _ in non_scalar.basis_factor]
     all_anti_commute = not any(
         b1.commutes_with(b2) for b1, b2 in itertools.combinations(bases, r=2)
     )
 
-    non_scalar_sqr = (
-        sum(value**2 * base.sqr() for base, value in zip(bases, values))
-        if all_anti_commute
-        else None
-    )
+    # squares of anti-commuting terms are the only scalar terms
+    non_scalar_sqr = non_scalar.scalar_product(non_scalar) if all_anti_commute else None
 
-    return val.scalar_part**2, non_scalar_sqr
+    return val.scalar**2, non_scalar_sqr
 
 
 def mv_sqrt(A):
@@ -52,7 +49,7 @@ def mv_sqrt(A):
     if non_scalar_sqr is None:
         raise NotImplementedError(f"Cannot take sqrt of {A}")
 
-    scalar = A.scalar_part
+    scalar = A.scalar
 
     if non_scalar_sqr == 0:
         c1 = sqrt(scalar)
@@ -1,12 +1,27 @@
 import functools
 import itertools
-from typing import Self, Sequence
+import math
+import numbers
+from collections.abc import Callable, Iterable
+from typing import Any, Self, Sequence
 
+import numpy as np
+
+from algebrant.algebra.algebra import Algebra
 from algebrant.algebra.algebra_data import AlgebraData
+from algebrant.algebra.zero_prune import PRUNE_CONFIG, ZeroPruning
+from algebrant.clifford.cayley import CAYLEY_MAX_DIM, CayleyTable
 from algebrant.clifford.clifford_algebra import CliffordAlgebra
 from algebrant.clifford.clifford_basis import CliffordBasis
 from algebrant.clifford.clifford_basis_vec import CliffordBasisVec
-from algebrant.random_mv import random_from_basis
+from algebrant.clifford.clifford_bit_basis import CliffordBitBasis, mask_bits, reorder_sign
+from algebrant.clifford.codegen import CompiledProduct, blade_order, generate_product
+from algebrant.clifford.coef_domain import CoefDomain, coef_domain
+from algebrant.clifford.dense_clifford_algebra import DenseCliffordAlgebra
+from algebrant.clifford.dense_kernels import DenseKernels
+from algebrant.random_mv import random_coef, random_from_basis
+
+_REGISTRY: dict[tuple, "ClAlg"] = {}
 
 
 class ClAlg:
@@ -15,54 +30,432 @@ class ClAlg:
         bases: tuple[CliffordBasisVec, ...],
         complex: bool = True,
         name: str | None = None,
+        *,
+        bitmask: bool = False,
+        dense: bool = False,
+        dtype: Any = None,
     ) -> None:
+        """
+        the fast representations are opt-in; by default elements use CliffordBasis tuples
+        bitmask: use CliffordBitBasis (bitmask over `bases`, products from the Cayley table)
+                 instead of CliffordBasis tuples
+        dense: create DenseCliffordAlgebra elements (numpy array of all 2**dim coefficients)
+        dtype: coefficient domain ("float32", "float64", "complex128", "fraction" or a type);
+               None keeps factors as given; implies bitmask, since the pruning of results
+               finds the domain through the ClAlg of the CliffordBitBasis blades
+        """
         self.bases = bases
-        self.is_complex: bool = complex
+        self.coef_domain: CoefDomain | None = coef_domain(dtype) if dtype is not None else None
+        self.is_complex: bool = complex if self.coef_domain is None else self.coef_domain.is_complex
         self.name: str = (
             name
             if name is not None
             else "Cl(" + ",".join(map(str, bases)) + "," + ("C" if complex else "R") + ")"
         )
+        self.bitmask = bitmask or dense or self.coef_domain is not None
+        self.dense = dense
+
+        if dense and len(bases) > CAYLEY_MAX_DIM:
+            raise ValueError(f"Dense elements only supported up to dimension {CAYLEY_MAX_DIM}")
+
+        if dense and self.coef_domain is not None and self.coef_domain.exact:
+            raise ValueError(f"Dense elements need a numeric dtype, not {self.coef_domain}")
+
+        self.basis_index: dict[CliffordBasisVec, int] = {b: i for i, b in enumerate(bases)}
+        self.name_index: dict[str, int] = {b.name: i for i, b in enumerate(bases)}
+
+        if len(self.name_index) != len(bases):
+            raise ValueError(f"Duplicate basis vector names in {bases}")
+
+        self._neg_mask = sum(1 << i for i, b in enumerate(bases) if b.sqr == -1)
+        self._null_mask = sum(1 << i for i, b in enumerate(bases) if b.sqr == 0)
+        self._other_mask = sum(1 << i for i, b in enumerate(bases) if b.sqr not in (1, -1, 0))
+
+        self._compiled: dict[tuple, CompiledProduct] = {}
+        self._shared: dict[Any, Any] = {}
+        self._blade_elements: dict[int, CliffordAlgebra] = {}
+        self._grade_mask_lists: dict[int, list[int]] = {}
+
+    @classmethod
+    def get(
+        cls,
+        bases: Sequence[CliffordBasisVec],
+        complex: bool = True,
+        name: str | None = None,
+        *,
+        bitmask: bool = False,
+        dense: bool = False,
+        dtype: Any = None,
+    ) -> Self:
+        """
+        ClAlg from the registry; identical signatures (bases, name, element type and dtype) give
+        the same object, so blades, tables and representations are built once
+        """
+        domain = coef_domain(dtype) if dtype is not None else None
+        key = (
+            cls,
+            tuple(bases),
+            complex,
+            name,
+            bitmask or dense or domain is not None,
+            dense,
+            domain,
+        )
+
+        if (alg := _REGISTRY.get(key)) is None:
+            alg = _REGISTRY[key] = cls(
+                tuple(bases), complex, name, bitmask=bitmask, dense=dense, dtype=domain
+            )
+
+        return alg  # type: ignore
 
     @classmethod
-    def from_pq(cls, p, q=0, start_idx: int = 1) -> Self:
-        bases = [CliffordBasisVec(f"e{start_idx + i}", sqr=-1) for i in range(q)] + [
-            CliffordBasisVec(f"e{start_idx + q + i}", sqr=1) for i in range(p)
-        ]
+    def from_pq(
+        cls,
+        p,
+        q=0,
+        start_idx: int = 1,
+        *,
+        bitmask: bool = False,
+        dense: bool = False,
+        dtype: Any = None,
+    ) -> Self:
         if q != 0:
             name: str = f"Cl({p},{q},R)"
         else:
             name = f"Cl({p},R)"
-        return cls(tuple(bases), complex=False, name=name)
+        return cls.get(
+            _pq_bases(p, q, start_idx),
+            complex=False,
+            name=name,
+            bitmask=bitmask,
+            dense=dense,
+            dtype=dtype,
+        )
 
     @classmethod
-    def from_dim(cls, dim, *, start_idx: int = 1) -> Self:
-        bases = [CliffordBasisVec(f"e{start_idx + i}", sqr=1) for i in range(dim)]
-        return cls(tuple(bases), complex=True, name=f"Cl({dim},C)")
+    def from_dim(
+        cls,
+        dim,
+        *,
+        start_idx: int = 1,
+        bitmask: bool = False,
+        dense: bool = False,
+        dtype: Any = None,
+    ) -> Self:
+        return cls.get(
+            _pq_bases(dim, 0, start_idx),
+            complex=True,
+            name=f"Cl({dim},C)",
+            bitmask=bitmask,
+            dense=dense,
+            dtype=dtype,
+        )
+
+    @property
+    def zero_pruning(self) -> ZeroPruning:
+        """
+        clip tolerance for results with factors of this algebra
+        """
+        if self.coef_domain is None:
+            return PRUNE_CONFIG.clip
+
+        return self.coef_domain.clip
+
+    def _dtype(self, *factors) -> np.dtype:
+        if self.coef_domain is None:
+            return np.result_type(float, *factors)
+
+        if self.coef_domain.exact:
+            return np.dtype(object)
+
+        return np.result_type(self.coef_domain.dtype, *factors)
+
+    def shared(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """
+        object derived from this algebra (e.g. a matrix representation); built once per key
+        """
+        if key not in self._shared:
+            self._shared[key] = factory()
+
+        return self._shared[key]
+
+    @property
+    def dim(self) -> int:
+        return len(self.bases)
+
+    @functools.cached_property
+    def cayley(self) -> CayleyTable | None:
+        """
+        product table of all blades; built on first use and only up to CAYLEY_MAX_DIM
+        used by CliffordBitBasis products only, i.e. not for the default CliffordBasis elements
+        """
+        if len(self.bases) > CAYLEY_MAX_DIM:
+            return None
+
+        return CayleyTable(self)
+
+    @functools.cached_property
+    def dense_kernels(self) -> DenseKernels:
+        if (table := self.cayley) is None:
+            raise ValueError(f"No dense kernels for dimension {len(self.bases)} of {self}")
+
+        return DenseKernels(table)
+
+    def metric(self, mask: int) -> Any:
+        """
+        product of the squares of the generators in mask
+        """
+        if mask & self._null_mask:
+            return 0
+
+        result = -1 if (mask & self._neg_mask).bit_count() % 2 else 1
+
+        if mask & self._other_mask:
+            result *= math.prod(self.bases[i].sqr for i in mask_bits(mask & self._other_mask))
+
+        return result
+
+    def mask_mul_sign(self, mask1: int, mask2: int) -> Any:
+        """
+        factor of blade(mask1) * blade(mask2) = factor * blade(mask1 ^ mask2)
+        """
+        common = mask1 & mask2
+
+        if not common:
+            return reorder_sign(mask1, mask2)
+
+        return reorder_sign(mask1, mask2) * self.metric(common)
+
+    def blade(self, mask: int) -> CliffordBitBasis:
+        return CliffordBitBasis(mask, self)
+
+    def blade_from_vecs(
+        self, vecs: Iterable[CliffordBasisVec | str]
+    ) -> tuple[CliffordBitBasis, Any]:
+        """
+        product of generators (given by object or name) in the given order
+        :return: (blade, factor) since reordering or squares may give factors
+        """
+        mask = 0
+        factor = 1
+
+        for vec in vecs:
+            try:
+                idx = self.name_index[vec] if isinstance(vec, str) else self.basis_index[vec]
+            except KeyError:
+                raise ValueError(f"Basis vector {vec} not part of {self}") from None
+
+            factor *= self.mask_mul_sign(mask, 1 << idx)
+            mask ^= 1 << idx
+
+        return self.blade(mask), factor
+
+    def _basis(self, mask: int) -> CliffordBasis | CliffordBitBasis:
+        if self.bitmask:
+            return self.blade(mask)
+
+        return CliffordBasis(tuple(self.bases[i] for i in mask_bits(mask)))
+
+    def blade_element(self, mask: int, factor: Any = 1) -> CliffordAlgebra:
+        if self.coef_domain is not None:
+            factor = self.coef_domain.convert(factor)
+
+        if self.dense:
+            coefs = np.zeros(
+                1 << len(self.bases),
+                dtype=np.result_type(factor) if self.coef_domain is None else self._dtype(factor),
+            )
+            coefs[mask] = factor
+            return DenseCliffordAlgebra(coefs, alg=self)
+
+        return CliffordAlgebra(
+            AlgebraData.make_single(self._basis(mask), factor),
+            basis_class=CliffordBitBasis if self.bitmask else CliffordBasis,
+        )
+
+    def from_coefs(self, coefs: np.ndarray) -> CliffordAlgebra:
+        """
+        element from coefficients indexed by blade mask (e.g. a row of a MultivectorArray)
+        """
+        if self.coef_domain is not None:
+            coefs = self.coef_domain.convert_array(np.asarray(coefs))
+
+        if self.dense:
+            return DenseCliffordAlgebra(coefs, alg=self)
+
+        if self.coef_domain is not None:  # .item() would turn float32 into float
+            masks = np.flatnonzero(coefs)
+            factors = self.coef_domain.convert_seq(coefs[masks])
+
+            return CliffordAlgebra(
+                AlgebraData({self._basis(mask): f for mask, f in zip(masks.tolist(), factors)}),
+                basis_class=CliffordBitBasis if self.bitmask else CliffordBasis,
+            )
+
+        return CliffordAlgebra(
+            AlgebraData(
+                {self._basis(mask): coefs[mask].item() for mask in np.flatnonzero(coefs).tolist()}
+            ),
+            basis_class=CliffordBitBasis if self.bitmask else CliffordBasis,
+        )
+
+    def coefs_from_basis_factor(self, basis_factor: AlgebraData) -> np.ndarray | None:
+        """
+        dense coefficients (indexed by blade mask) or None if not numeric or not in this algebra
+        """
+        masks = []
+        factors = []
+
+        for basis, factor in basis_factor:
+            if not isinstance(factor, numbers.Number):
+                return None
+
+            if isinstance(basis, CliffordBitBasis) and (
+                basis.alg is self or basis.mask == 0 or basis.alg.bases == self.bases  # type: ignore
+            ):
+                masks.append(basis.mask)
+                factors.append(factor)
+                continue
+
+            try:
+                blade, sign = self.blade_from_vecs(basis.bases)
+            except ValueError:
+                return None
+
+            masks.append(blade.mask)
+            factors.append(sign * factor)
+
+        coefs = np.zeros(1 << len(self.bases), dtype=self._dtype(*factors))
+        np.add.at(coefs, masks, factors)
+
+        return coefs
+
+    def to_dense(self, elem: CliffordAlgebra) -> DenseCliffordAlgebra:
+        if isinstance(elem, DenseCliffordAlgebra) and elem.alg is self:
+            return elem
+
+        coefs = self.coefs_from_basis_factor(elem.basis_factor)
+
+        if coefs is None:
+            raise ValueError(f"Cannot convert {elem} to dense coefficients of {self}")
+
+        return DenseCliffordAlgebra(coefs, alg=self, op_prio=elem.op_prio)
 
     def get_bases(self, *grades) -> Sequence[CliffordAlgebra]:
+        return [self.blade_of(mask) for mask in self.grade_masks(*grades)]
+
+    def blade_of(self, mask: int) -> CliffordAlgebra:
+        """
+        shared blade element with factor 1
+        """
+        if (elem := self._blade_elements.get(mask)) is None:
+            elem = self._blade_elements[mask] = self.blade_element(mask)
+
+        return elem
+
+    @functools.cached_property
+    def blades(self) -> list[CliffordAlgebra]:
+        """
+        all blade elements in the order of grade_masks()
+        """
+        return [self.blade_of(mask) for mask in self.blade_masks]
+
+    @functools.cached_property
+    def blade_masks(self) -> tuple[int, ...]:
+        """
+        blade index -> mask
+        """
+        return tuple(self.grade_masks())
+
+    @functools.cached_property
+    def blade_position(self) -> dict[int, int]:
+        """
+        mask -> blade index
+        """
+        return {mask: i for i, mask in enumerate(self.blade_masks)}
+
+    def grade_masks(self, *grades) -> list[int]:
+        """
+        blade masks ordered by grade and then like itertools.combinations
+        """
         if not grades:
             grades = range(len(self.bases) + 1)
 
         result = []
 
-        if 0 in grades:
-            result.append(CliffordAlgebra(AlgebraData({}), basis_class=CliffordBasis))
+        for grade in grades:
+            if (masks := self._grade_mask_lists.get(grade)) is None:
+                masks = self._grade_mask_lists[grade] = [
+                    sum(1 << i for i in idxs)
+                    for idxs in itertools.combinations(range(len(self.bases)), r=grade)
+                ]
 
-        result.extend(
-            CliffordAlgebra(
-                AlgebraData.make_single(CliffordBasis(basis)), basis_class=CliffordBasis
-            )
-            for grade in grades
-            for basis in itertools.combinations(self.bases, r=grade)
-            if grade != 0
-        )
+            result.extend(masks)
 
         return result
 
+    def compile(self, op: str, left, right, *, grades=None) -> CompiledProduct:
+        """
+        straight-line function for a product of fixed blade patterns; cached per pattern
+        op: "mul", "xor", "lshift", "rshift" or "sandwich" (left * right * left.r)
+        left, right: grade, iterable of grades or an example element (its blades are the pattern)
+        grades: grades of the result to compute (default: all; for sandwich the grades of right)
+        """
+        masks1 = self._pattern_masks(left)
+        masks2 = self._pattern_masks(right)
+        out_grades = None if grades is None else frozenset(_as_grades(grades))
+
+        key = (op, masks1, masks2, out_grades)
+
+        if key not in self._compiled:
+            self._compiled[key] = generate_product(self, op, masks1, masks2, out_grades)
+
+        return self._compiled[key]
+
+    def _pattern_masks(self, pattern) -> tuple[int, ...]:
+        if not isinstance(pattern, CliffordAlgebra):
+            return tuple(self.grade_masks(*_as_grades(pattern)))
+
+        masks = set()
+
+        for basis, _ in pattern.basis_factor:
+            if isinstance(basis, CliffordBitBasis):
+                masks.add(basis.mask)
+            else:
+                masks.add(self.blade_from_vecs(basis.bases)[0].mask)
+
+        return tuple(sorted(masks, key=blade_order))
+
     def rand(self, *grades, int_only=False, min_int=2, max_int=1000) -> CliffordAlgebra:
+        if self.dense:
+            masks = self.grade_masks(*grades)
+            values = random_coef(
+                len(masks),
+                complex=self.is_complex,
+                int_only=int_only,
+                min_int=min_int,
+                max_int=max_int,
+            )
+            if self.coef_domain is not None:
+                values = self.coef_domain.convert_array(values)
+
+            coefs = np.zeros(1 << len(self.bases), dtype=self._dtype(values))
+            coefs[masks] = values
+            return DenseCliffordAlgebra(coefs, alg=self)
+
         bases = self.get_bases(*grades)
 
+        if self.coef_domain is not None:
+            values = random_coef(
+                len(bases),
+                complex=self.is_complex,
+                int_only=int_only,
+                min_int=min_int,
+                max_int=max_int,
+            )
+            return Algebra.linear_combination(self.coef_domain.convert_seq(values), bases)
+
         return random_from_basis(
             bases,
             complex=self.is_complex,
@@ -76,17 +469,25 @@ class ClAlg:
         result = functools.reduce(lambda x, y: (y << x), vecs, v)
         return result
 
-    @property
+    @functools.cached_property
     def I(self) -> CliffordAlgebra:
-        return CliffordAlgebra(
-            AlgebraData.make_single(CliffordBasis(self.bases)), basis_class=CliffordBasis
-        )
+        return self.blade_of((1 << len(self.bases)) - 1)
 
-    @property
+    @functools.cached_property
     def one(self) -> CliffordAlgebra:
-        return CliffordAlgebra(
-            AlgebraData.make_single(CliffordBasis(tuple())), basis_class=CliffordBasis
-        )
+        return self.blade_of(0)
 
     def __repr__(self) -> str:
         return self.name
+
+
+def _as_grades(grades) -> tuple[int, ...]:
+    return (grades,) if isinstance(grades, int) else tuple(grades)
+
+
+@functools.cache
+def _pq_bases(p: int, q: int, start_idx: int) -> tuple[CliffordBasisVec, ...]:
+    return tuple(
+        [CliffordBasisVec(f"e{start_idx + i}", sqr=-1) for i in range(q)]
+        + [CliffordBasisVec(f"e{start_idx + q + i}", sqr=1) for i in range(p)]
+    )
@@ -1,15 +1,23 @@
+import functools
 import itertools
 import math
-from collections import Counter
-from collections.abc import Iterable
+import types
+from collections.abc import Callable, Iterable
 from types import NotImplementedType
 from typing import Any, Protocol, Self, Sequence, TypeVar
 
 from algebrant.algebra.algebra_utils import MultiplicationMixin
-from algebrant.algebra.algebra_data import AlgebraData, algebra_mul
+from algebrant.algebra.algebra_data import MUL_CACHE, AlgebraData, algebra_mul
+from algebrant.algebra.zero_prune import PRUNE_CONFIG, ZeroPruning
+from algebrant.clifford.cl_exp_log import cl_exp, cl_log, cl_sqrt
+from algebrant.clifford.cl_inverse import cl_inverse
+from algebrant.clifford.cl_utils import sqr_to_scalar
 from algebrant.clifford.clifford_basis import CliffordBasis
 from algebrant.clifford.clifford_basis_vec import CliffordBasisVec
-from algebrant.graded.graded_algebra import GradedAlgebra, commute
+from algebrant.clifford.clifford_bit_basis import CliffordBitBasis
+from algebrant.clifford.outermorphism import Outermorphism
+from algebrant.clifford.sandwich import sandwich, twisted_sandwich
+from algebrant.graded.graded_algebra import GradedAlgebra
 
 Factor = Any
 BasisFactor = tuple[CliffordBasis, Any]
@@ -19,18 +27,52 @@ BasisFactor = tuple[CliffordBasis, Any]
 def _(
     basis1: CliffordBasis, factor1: Any, basis2: CliffordBasis, factor2: Any
 ) -> Iterable[tuple[CliffordBasis, Any]]:
-    result = []
+    if basis1.is_odd:  # same as commute(), but without allocating per pair
+        factor2 = getattr(factor2, "vector_conjugate", factor2)
 
-    for basis1, factor2 in commute(basis1, factor2):
-        result_bases, is_negative = ga_basis_mul(basis1.bases, basis2.bases)
-        sign = [1, -1][is_negative]
+    result_bases, is_negative = ga_basis_mul(basis1.bases, basis2.bases)
+    sign = [1, -1][is_negative]
 
-        common_bases = set(basis1.bases) & set(basis2.bases)
-        sign *= math.prod(b.sqr for b in common_bases)
+    common_bases = set(basis1.bases) & set(basis2.bases)
+    sign *= math.prod(b.sqr for b in common_bases)
 
-        result.append((CliffordBasis(tuple(result_bases)), sign * factor1 * factor2))
+    return [(CliffordBasis(tuple(result_bases)), sign * factor1 * factor2)]
 
-    return result
+
+@algebra_mul.register
+def _(
+    basis1: CliffordBitBasis, factor1: Any, basis2: CliffordBitBasis, factor2: Any
+) -> Iterable[tuple[CliffordBitBasis, Any]]:
+    if basis1.is_odd:
+        factor2 = getattr(factor2, "vector_conjugate", factor2)
+
+    alg = basis1.alg if basis1.alg is not None else basis2.alg
+
+    if alg is None:  # both unity
+        return [(basis1, factor1 * factor2)]
+
+    if (
+        basis1.alg is not basis2.alg
+        and basis1.mask
+        and basis2.mask
+        and basis1.alg.bases != basis2.alg.bases  # type: ignore
+    ):
+        raise ValueError(f"Cannot multiply bases {basis1} and {basis2} of different algebras")
+
+    if (table := alg.cayley) is not None:
+        sign = table.sign_rows[basis1.mask][basis2.mask]
+
+        if sign == 0:
+            return []
+
+        return [(table.blades[basis1.mask ^ basis2.mask], sign * factor1 * factor2)]
+
+    sign = alg.mask_mul_sign(basis1.mask, basis2.mask)
+
+    if sign == 0:
+        return []
+
+    return [(alg.blade(basis1.mask ^ basis2.mask), sign * factor1 * factor2)]
 
 
 class CliffordAlgebra(GradedAlgebra[CliffordBasis], MultiplicationMixin):
@@ -40,24 +82,24 @@ class CliffordAlgebra(GradedAlgebra[CliffordBasis], MultiplicationMixin):
         """
         return self.__class__(  # TODO: generalize?
             basis_factor=AlgebraData(
-                {
-                    basis: factor
-                    for basis, factor in basis_factor
-                    if abs(factor) > 1e-10  # TODO
-                }
+                _data_pruning(basis_factor.basis_factor).prune(basis_factor.basis_factor)
             ),
             basis_class=self.basis_class,
             op_prio=self.op_prio,
         )
 
+    @property
+    def _zero_pruning(self) -> ZeroPruning:
+        return _data_pruning(self.basis_factor.basis_factor)
+
     @staticmethod
     def _xor(
         basis1: CliffordBasis, factor1: Factor, basis2: CliffordBasis, factor2: Factor
     ) -> Iterable[tuple[BasisFactor, Any]]:
-        if set(basis1.bases) & set(basis2.bases):
+        if basis1.mask & basis2.mask:
             return []
 
-        return algebra_mul(basis1, factor1, basis2, factor2)
+        return MUL_CACHE(basis1, factor1, basis2, factor2)
 
     def __xor__(self, other: Any) -> Self | NotImplementedType:
         return self._mul(other, self._xor)
@@ -66,10 +108,10 @@ class CliffordAlgebra(GradedAlgebra[CliffordBasis], MultiplicationMixin):
     def _lshift(
         basis1: CliffordBasis, factor1: Factor, basis2: CliffordBasis, factor2: Factor
     ) -> Iterable[tuple[BasisFactor, Any]]:
-        if not set(basis1.bases) <= set(basis2.bases):
+        if basis1.mask & ~basis2.mask:
             return []
 
-        return algebra_mul(basis1, factor1, basis2, factor2)
+        return MUL_CACHE(basis1, factor1, basis2, factor2)
 
     def __lshift__(self, other: Any) -> Self | NotImplementedType:
         return self._mul(other, self._lshift)
@@ -78,17 +120,151 @@ class CliffordAlgebra(GradedAlgebra[CliffordBasis], MultiplicationMixin):
     def _rshift(
         basis1: CliffordBasis, factor1: Factor, basis2: CliffordBasis, factor2: Factor
     ) -> Iterable[tuple[BasisFactor, Any]]:
-        if not set(basis1.bases) >= set(basis2.bases):
+        if basis2.mask & ~basis1.mask:
             return []
 
-        return algebra_mul(basis1, factor1, basis2, factor2)
+        return MUL_CACHE(basis1, factor1, basis2, factor2)
 
     def __rshift__(self, other: Any) -> Self | NotImplementedType:
         return self._mul(other, self._rshift)
 
+    def _mul_data(self, other: Self, basis_mul) -> AlgebraData[CliffordBasis]:
+        """
+        ^, << and >> first drop grade pairs which cannot contribute and then test single
+        pairs by their masks only
+        """
+        pair_terms = _GRADED_PAIR_TERMS.get(basis_mul)
+
+        if pair_terms is None:
+            return super()._mul_data(other, basis_mul)
+
+        index1 = self.grade_index
+        index2 = other.grade_index
+
+        # a wedge product cannot exceed the number of basis vectors involved
+        max_grade = 0
+        if basis_mul is CliffordAlgebra._xor:
+            max_grade = (_union_mask(self) | _union_mask(other)).bit_count()
+
+        return AlgebraData.from_seq(
+            term
+            for grade1, bucket1 in index1.items()
+            for grade2, bucket2 in index2.items()
+            if not max_grade or grade1 + grade2 <= max_grade
+            for term in pair_terms(bucket1, bucket2, grade1, grade2)
+        )
+
+    def product(self, other: Any, grades=None) -> Self:
+        """
+        (self * other).take_grades(grades) without computing the terms of other grades
+        grades: int, iterable of ints or test function as in take_grades; None for all grades
+        """
+        if grades is None:
+            return self * other
+
+        grade_test_func = _grade_test_func(grades)
+
+        if not isinstance(other, CliffordAlgebra):
+            return (self * other).take_grades(grade_test_func)
+
+        index1 = self.grade_index
+        index2 = other.grade_index
+
+        max_grade = (_union_mask(self) | _union_mask(other)).bit_count()
+        out_grades = frozenset(g for g in range(max_grade + 1) if grade_test_func(g))
+
+        terms: list[tuple[CliffordBasis, Any]] = []
+
+        for grade1, bucket1 in index1.items():
+            for grade2, bucket2 in index2.items():
+                # blade products of grades g1, g2 have grade |g1-g2|, |g1-g2|+2, ..., g1+g2
+                pair_grades = out_grades.intersection(
+                    range(abs(grade1 - grade2), grade1 + grade2 + 1, 2)
+                )
+
+                if not pair_grades:
+                    continue
+
+                if pair_grades == {0}:  # only equal blades contribute
+                    terms.extend(_equal_terms(bucket1, bucket2))
+                    continue
+
+                terms.extend(
+                    term
+                    for basis1, factor1 in bucket1.items()
+                    for basis2, factor2 in bucket2.items()
+                    if (basis1.mask ^ basis2.mask).bit_count() in pair_grades
+                    for term in MUL_CACHE(basis1, factor1, basis2, factor2)
+                )
+
+        return self._new(AlgebraData.from_seq(terms))
+
+    def scalar_product(self, other: Any) -> Any:
+        """
+        scalar part of self * other
+        """
+        return self.product(other, grades=0).scalar
+
+    @property
+    def norm_sqr(self) -> Any:
+        """
+        scalar part of A * A.r (may be negative or zero for non-Euclidean signatures)
+        """
+        return self.scalar_product(self.r)
+
+    @property
+    def norm(self) -> Any:
+        return abs(self.norm_sqr) ** 0.5
+
+    def sandwich(self, other: Any, grades=None) -> Self:
+        """
+        self * other * self.r in one pass; only the grades of other unless grades are given
+        """
+        return sandwich(self, other, grades=grades)
+
+    def twisted_sandwich(self, other: Any, grades=None) -> Self:
+        """
+        self.i * other * self.r in one pass; only the grades of other unless grades are given
+        """
+        return twisted_sandwich(self, other, grades=grades)
+
+    def outermorphism(self, vecs: Sequence["CliffordAlgebra"] | None = None) -> Outermorphism:
+        """
+        versor sandwich X -> self * X * self^-1 as matrices on the blades of vecs
+        vecs: grade 1 elements; by default the generators of the ClAlg of CliffordBitBasis elements
+        """
+        if vecs is None:
+            algs = [basis.alg for basis, _ in self.basis_factor if getattr(basis, "alg", None)]
+
+            if not algs:
+                raise ValueError(f"vecs needed for {self} without ClAlg")
+
+            vecs = algs[0].get_bases(1)
+
+        return Outermorphism.from_versor(self, vecs)
+
+    def exp(self) -> Self:
+        """
+        closed form for bivectors (invariant decomposition) and elements squaring to scalars;
+        scaling and squaring with a Pade approximant otherwise
+        """
+        return cl_exp(self)
+
+    def log(self) -> Self:
+        """
+        principal logarithm; closed form for rotors and elements squaring to scalars
+        """
+        return cl_log(self)
+
+    def sqrt(self) -> Self:
+        """
+        principal square root; closed form for rotors and elements squaring to scalars
+        """
+        return cl_sqrt(self)
+
     @property
     def scalar(self) -> Any:
-        return self.basis_factor.to_dict.get(CliffordBasis(tuple()), 0)  # TODO: why access?
+        return self.basis_factor.basis_factor.get(self.unity_basis, 0)
 
     @property
     def sqr(self) -> Any:
@@ -143,9 +319,7 @@ class CliffordAlgebra(GradedAlgebra[CliffordBasis], MultiplicationMixin):
         #################################### Special rule for grades {0,1,dim-1,dim}
         # this can save 1 step instead of doing Clifford conjugation and also is needed for higher even dim.
 
-        dimension = len(
-            set(itertools.chain.from_iterable(basis.bases for basis in self.basis_factor.keys()))
-        )
+        dimension = _union_mask(self).bit_count()
 
         if grades <= {0, 1, dimension - 1, dimension}:
             # print("Special {0,1,dim-1,dim}")
@@ -165,7 +339,7 @@ class CliffordAlgebra(GradedAlgebra[CliffordBasis], MultiplicationMixin):
                 )
 
             if new_inverse.grades == {0}:
-                inv_of_new_inverse = 1 / new_inverse.scalar_part
+                inv_of_new_inverse = 1 / new_inverse.scalar
             else:
                 # print("Anticommuting")
                 # do the non-scalar-flip inversion right away as it's the next step
@@ -182,62 +356,137 @@ class CliffordAlgebra(GradedAlgebra[CliffordBasis], MultiplicationMixin):
 
             return numer * flipped_sign_mv * inv_of_new_inverse
 
-        #################################### test if grades 4k+{1,2} which I could reduce; only for dimension >= 6
-        grades_mod_4 = Counter(g % 4 for g in self.grades)
+        #################################### closed formulas per dimension (Hitzer-Sangwine, Faddeev-LeVerrier)
+        # replaces the reverse step A*A.r and the general iteration; see cl_inverse for the paths
+        inverse, _report = cl_inverse(self)
 
-        # if dimension >= 6 and grades_mod_4[1] > grades_mod_4[3]:
-        #     # print("Clifford reverse")
-        #     new_inverse = self * self.c
+        return numer * inverse
 
-        #     assert not any(
-        #         g % 4 in (1, 2) for g in new_inverse.grades
-        #     ), f"Grades 1,2 did not reduce with result {new_inverse} (should not happen unless due to floating point uncertainty)"
 
-        #     if new_inverse == 0:
-        #         raise ZeroDivisionError(f"Zero division 1/(A*A.c) for {self}")
+def _union_mask(elem: CliffordAlgebra) -> int:
+    """
+    all basis vectors which appear in elem
+    """
+    mask = 0
+    for basis, _ in elem.basis_factor:
+        mask |= basis.mask
 
-        #     if new_inverse.grades == {0}:
-        #         new_inverse = new_inverse.scalar_part
+    return mask
 
-        #     if all(g % 4 != 3 for g in new_inverse.grades):  # otherwise may be infinite loop with 4k+{2,3} rule
-        #         return numer * self.c * (1 / new_inverse)
 
-        #################################### test if grades 4k+{2,3} which I could reduce
-        if dimension <= 5 and grades_mod_4.keys() & {2, 3}:
-            # print("Reverse")
-            new_inverse = self * self.r
+def _grade_test_func(grades) -> Callable[[int], bool]:
+    if isinstance(grades, types.FunctionType):
+        return grades
 
-            assert not any(g % 4 in (2, 3) for g in new_inverse.grades), (
-                f"Grades 2,3 did not reduce with result {new_inverse} (should not happen unless due to floating point uncertainty)"
-            )
+    if isinstance(grades, int):
+        grades = (grades,)
 
-            if new_inverse == 0:
-                raise ZeroDivisionError(f"Zero division 1/(A*A.r) for {self}")
+    grade_set = frozenset(grades)
 
-            if new_inverse.grades == {0}:
-                new_inverse = new_inverse.scalar
-
-            return numer * self.r * (1 / new_inverse)
-
-        ################################# the following works generally
-        # TODO: replace since numerical issues
-
-        max_steps = 2 ** math.floor((dimension + 1) / 2)
-        inv = self
-        for i in range(1, max_steps + 1):
-            A = inv - max_steps * inv.scalar / i
-            inv = self * A  # will clip small coefficients
-            if inv.grades <= {0}:
-                break
-        else:
-            raise NotImplementedError(
-                f"Iterations of general inversion algorithm failed with {i=} {inv=} {A=}"
-            )
+    return lambda g: g in grade_set
 
-        if inv == 0:
-            raise ZeroDivisionError("Division by zero in general algorithm")
 
-        return A / inv.scalar_part
+def _xor_terms(
+    bucket1: dict[CliffordBasis, Any], bucket2: dict[CliffordBasis, Any], grade1: int, grade2: int
+) -> Iterable[tuple[CliffordBasis, Any]]:
+    """
+    terms of disjoint pairs; grade0 * grade is the full product
+    """
+    if grade1 == 0 or grade2 == 0:
+        return _all_terms(bucket1, bucket2)
+
+    return [
+        term
+        for basis1, factor1 in bucket1.items()
+        for basis2, factor2 in bucket2.items()
+        if not basis1.mask & basis2.mask
+        for term in MUL_CACHE(basis1, factor1, basis2, factor2)
+    ]
+
+
+def _subset_terms(
+    bucket1: dict[CliffordBasis, Any], bucket2: dict[CliffordBasis, Any], grade1: int, grade2: int
+) -> Iterable[tuple[CliffordBasis, Any]]:
+    """
+    terms of pairs with basis1 contained in basis2
+    """
+    if grade1 > grade2:
+        return []
+
+    if grade1 == 0:
+        return _all_terms(bucket1, bucket2)
+
+    if grade1 == grade2:  # only equal bases; direct lookup instead of all pairs
+        return _equal_terms(bucket1, bucket2)
+
+    return [
+        term
+        for basis1, factor1 in bucket1.items()
+        for basis2, factor2 in bucket2.items()
+        if not basis1.mask & ~basis2.mask
+        for term in MUL_CACHE(basis1, factor1, basis2, factor2)
+    ]
+
+
+def _superset_terms(
+    bucket1: dict[CliffordBasis, Any], bucket2: dict[CliffordBasis, Any], grade1: int, grade2: int
+) -> Iterable[tuple[CliffordBasis, Any]]:
+    """
+    terms of pairs with basis2 contained in basis1
+    """
+    if grade1 < grade2:
+        return []
+
+    if grade2 == 0:
+        return _all_terms(bucket1, bucket2)
+
+    if grade1 == grade2:
+        return _equal_terms(bucket1, bucket2)
+
+    return [
+        term
+        for basis1, factor1 in bucket1.items()
+        for basis2, factor2 in bucket2.items()
+        if not basis2.mask & ~basis1.mask
+        for term in MUL_CACHE(basis1, factor1, basis2, factor2)
+    ]
+
+
+def _all_terms(
+    bucket1: dict[CliffordBasis, Any], bucket2: dict[CliffordBasis, Any]
+) -> Iterable[tuple[CliffordBasis, Any]]:
+    return [
+        term
+        for basis1, factor1 in bucket1.items()
+        for basis2, factor2 in bucket2.items()
+        for term in MUL_CACHE(basis1, factor1, basis2, factor2)
+    ]
+
+
+def _equal_terms(
+    bucket1: dict[CliffordBasis, Any], bucket2: dict[CliffordBasis, Any]
+) -> Iterable[tuple[CliffordBasis, Any]]:
+    if len(bucket1) > len(bucket2):
+        return [
+            term
+            for basis2, factor2 in bucket2.items()
+            if (factor1 := bucket1.get(basis2)) is not None
+            for term in MUL_CACHE(basis2, factor1, basis2, factor2)
+        ]
+
+    return [
+        term
+        for basis1, factor1 in bucket1.items()
+        if (factor2 := bucket2.get(basis1)) is not None
+        for term in MUL_CACHE(basis1, factor1, basis1, factor2)
+    ]
+
+
+_GRADED_PAIR_TERMS = {
+    CliffordAlgebra._xor: _xor_terms,
+    CliffordAlgebra._lshift: _subset_terms,
+    CliffordAlgebra._rshift: _superset_terms,
+}
 
 
 class Sortable(Protocol):
@@ -300,20 +549,55 @@ def ga_basis_mul(
     return basis, is_negative
 
 
-def Cl_vec(*names: str | int, sqr: int | list = 1) -> CliffordAlgebra:
-    str_names = [name if isinstance(name, str) else f"e{name}" for name in names]
+def _data_pruning(basis_factor: dict) -> ZeroPruning:
+    """
+    clip tolerance of the coefficient domain of the ClAlg (known from CliffordBitBasis blades)
+    """
+    for basis in itertools.islice(basis_factor, 2):  # the first may be the unity without ClAlg
+        if (alg := getattr(basis, "alg", None)) is not None:
+            return alg.zero_pruning
+
+    return PRUNE_CONFIG.clip
+
+
+def Cl_vec(*names: str | int, sqr: int | list | None = None, alg=None) -> CliffordAlgebra:
+    """
+    alg: ClAlg to create a CliffordBitBasis element; names may be in any order then
+         and the squares are taken from alg
+    elements are shared between calls with the same names and squares
+    """
+    str_names = tuple(name if isinstance(name, str) else f"e{name}" for name in names)
+
+    if alg is not None:
+        if sqr is not None:
+            raise ValueError(f"sqr={sqr} cannot be set when using alg={alg}")
+
+        basis, factor = alg.blade_from_vecs(str_names)
+
+        if factor == 1:
+            return alg.blade_of(basis.mask)
+
+        return alg.blade_element(basis.mask, factor)
+
+    if sqr is None:
+        sqr = 1
 
     if not isinstance(sqr, list):
         sqr = [sqr] * len(str_names)
 
+    if len(sqr) != len(str_names):
+        raise ValueError(f"{len(sqr)} squares given for {len(str_names)} names")
+
+    return _cl_vec_element(str_names, tuple(sqr))
+
+
+@functools.cache
+def _cl_vec_element(names: tuple[str, ...], sqrs: tuple) -> CliffordAlgebra:
     return CliffordAlgebra(
         AlgebraData(
             {
                 CliffordBasis(
-                    tuple(
-                        CliffordBasisVec(name=name, sqr=sqr)
-                        for name, sqr in zip(str_names, sqr, strict=True)
-                    )
+                    tuple(CliffordBasisVec(name=name, sqr=sqr) for name, sqr in zip(names, sqrs))
                 ): 1
             }
         ),
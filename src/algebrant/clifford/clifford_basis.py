@@ -1,9 +1,11 @@
 import math
+import weakref
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Self
+from typing import Any, Self
 
 from algebrant.algebra.basis import BasisSortKey
+from algebrant.algebra.interning import Interned
 from algebrant.clifford.clifford_basis_vec import CliffordBasisVec
 from algebrant.repr_printer import PlainReprMixin
 from algebrant.utils import calculated_field
@@ -15,15 +17,54 @@ Todos (some old?):
 * single element sums unpacked? esp before division
 """
 
+_VEC_BITS: dict[CliffordBasisVec, int] = {}
+_VEC_USES: dict[CliffordBasisVec, int] = {}  # number of live CliffordBasis per basis vector
+_FREE_BITS: list[int] = []
 
-@dataclass(unsafe_hash=True, repr=False)
-class CliffordBasis(PlainReprMixin):
+
+def acquire_mask(vecs: tuple[CliffordBasisVec, ...]) -> int:
+    """
+    each distinct basis vector gets its own bit, so that sets of basis vectors are int masks
+    bits are held while a CliffordBasis uses them (see release_mask), so that the table is bounded
+    by the basis vectors in use and not by all basis vectors ever created
+    """
+    mask = 0
+
+    for vec in vecs:
+        bit = _VEC_BITS.get(vec)
+
+        if bit is None:
+            bit = _VEC_BITS[vec] = _FREE_BITS.pop() if _FREE_BITS else 1 << len(_VEC_BITS)
+            _VEC_USES[vec] = 0
+
+        _VEC_USES[vec] += 1
+        mask |= bit
+
+    return mask
+
+
+def release_mask(vecs: tuple[CliffordBasisVec, ...]) -> None:
+    """
+    called when a CliffordBasis is freed; bits of unused basis vectors are given to new vectors
+    masks are not kept beyond the lifetime of their CliffordBasis, so reused bits cannot collide
+    """
+    for vec in vecs:
+        _VEC_USES[vec] -= 1
+
+        if not _VEC_USES[vec]:
+            del _VEC_USES[vec]
+            _FREE_BITS.append(_VEC_BITS.pop(vec))
+
+
+@dataclass(eq=False, repr=False)
+class CliffordBasis(Interned, PlainReprMixin):
     bases: tuple[CliffordBasisVec, ...]  # needs to be sorted (or will be sorted by force)
     sort_key: BasisSortKey = calculated_field()
     is_unity: bool = calculated_field()
     grade: int = calculated_field()
     sqr: int = calculated_field()
     is_odd: bool = calculated_field()
+    mask: int = calculated_field()  # set of basis vectors, see acquire_mask
 
     def __post_init__(self) -> None:
         if list(self.bases) != sorted(self.bases):
@@ -34,6 +75,14 @@ class CliffordBasis(PlainReprMixin):
         self.grade = len(self.bases)
         self.sqr = [1, -1][len(self.bases) % 4 in (2, 3)] * math.prod(b.sqr for b in self.bases)
         self.is_odd = len(self.bases) % 2 == 1
+        self.mask = acquire_mask(self.bases)
+
+        if self.bases:
+            weakref.finalize(self, release_mask, self.bases)
+
+    @classmethod
+    def _intern_key(cls, bases: tuple[CliffordBasisVec, ...]) -> Any:
+        return tuple(bases)
 
     @classmethod
     def unity(cls) -> Self:
@@ -56,7 +105,7 @@ class CliffordBasis(PlainReprMixin):
     def commutes_with(self, other: Self) -> bool:
         len_self = len(self.bases)
         len_other = len(other.bases)
-        len_common = len(set(self.bases) & set(other.bases))
+        len_common = (self.mask & other.mask).bit_count()
 
         return (len_self * len_other + len_common) % 2 == 0
 
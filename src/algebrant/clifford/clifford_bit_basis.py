@@ -0,0 +1,139 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+from algebrant.algebra.basis import BasisSortKey
+from algebrant.clifford.clifford_basis_vec import CliffordBasisVec
+from algebrant.repr_printer import PlainReprMixin
+from algebrant.utils import calculated_field
+
+if TYPE_CHECKING:
+    from algebrant.clifford.clalg import ClAlg
+
+"""
+Clifford basis blade encoded as integer bitmask over the generator list `ClAlg.bases`
+
+bit i is set if generator `alg.bases[i]` is part of the blade
+generators are always in canonical (ascending bit) order
+"""
+
+
+def reorder_sign(mask1: int, mask2: int) -> int:
+    """
+    sign to bring the generators of blade1 * blade2 into canonical order
+    each generator of mask2 has to pass all generators of mask1 with a higher bit
+    """
+    mask1 >>= 1
+    swaps = 0
+
+    while mask1:
+        swaps += (mask1 & mask2).bit_count()
+        mask1 >>= 1
+
+    return -1 if swaps & 1 else 1
+
+
+def mask_bits(mask: int) -> Iterable[int]:
+    """
+    indices of the set bits in ascending order
+    """
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+@dataclass(eq=False, repr=False)
+class CliffordBitBasis(PlainReprMixin):
+    """
+    drop-in for CliffordBasis which does not allocate tuples in products
+
+    alg is only needed to resolve generators; the unity may have alg=None
+    """
+
+    mask: int
+    alg: "ClAlg | None" = None
+    grade: int = calculated_field()
+    is_unity: bool = calculated_field()
+    is_odd: bool = calculated_field()
+
+    def __post_init__(self) -> None:
+        if self.mask < 0:
+            raise ValueError(f"Negative mask {self.mask}")
+
+        if self.alg is None and self.mask != 0:
+            raise ValueError(f"Need alg for non-unity mask {self.mask:b}")
+
+        self.grade = self.mask.bit_count()
+        self.is_unity = self.mask == 0
+        self.is_odd = self.grade % 2 == 1
+
+    @classmethod
+    def unity(cls) -> Self:
+        return cls(0)
+
+    def __hash__(self) -> int:
+        return hash(self.mask)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CliffordBitBasis):
+            return NotImplemented
+
+        return self.mask == other.mask and (
+            self.alg is other.alg or self.mask == 0 or self.alg.bases == other.alg.bases  # type: ignore
+        )
+
+    @property
+    def bases(self) -> tuple[CliffordBasisVec, ...]:
+        if self.alg is None:
+            return tuple()
+
+        return tuple(self.alg.bases[i] for i in mask_bits(self.mask))
+
+    @property
+    def sort_key(self) -> BasisSortKey:
+        return ((self.grade,), tuple(b.name for b in self.bases))
+
+    @property
+    def sqr(self) -> Any:
+        if self.alg is None:
+            return 1
+
+        return [1, -1][self.grade % 4 in (2, 3)] * self.alg.metric(self.mask)
+
+    def _repr_pretty_(self, printer, cycle):
+        if cycle:
+            return printer.text("...")
+
+        if self.mask == 0:
+            printer.text("(1)")  # should usually not be shown
+            return
+
+        for i, basis in enumerate(self.bases):
+            if i > 0:
+                printer.text(" ")
+
+            printer.pretty(basis)
+
+    def commutes_with(self, other: Self) -> bool:
+        len_common = (self.mask & other.mask).bit_count()
+
+        return (self.grade * other.grade + len_common) % 2 == 0
+
+    @property
+    def r(self) -> Iterable[tuple[Self, int]]:
+        sign = [1, -1][self.grade % 4 in (2, 3)]
+
+        return [(self, sign)]
+
+    @property
+    def i(self) -> Iterable[tuple[Self, int]]:
+        sign = [1, -1][self.is_odd]
+
+        return [(self, sign)]
+
+    @property
+    def cl(self) -> Iterable[tuple[Self, int]]:
+        sign = [1, -1][self.grade % 4 in (1, 2)]
+
+        return [(self, sign)]
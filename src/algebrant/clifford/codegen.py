@@ -0,0 +1,185 @@
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from algebrant.clifford.clifford_bit_basis import mask_bits
+
+if TYPE_CHECKING:
+    from algebrant.clifford.clalg import ClAlg
+
+"""
+Code generation of straight-line product functions for fixed blade patterns
+
+the blade products and signs are unrolled from the product table of the ClAlg, e.g. for
+vector * vector in Cl(2):
+
+    def mul(x, y):
+        x1 = x[0]
+        x2 = x[1]
+        y1 = y[0]
+        y2 = y[1]
+        r0 = x1*y1 + x2*y2
+        r3 = x1*y2 - x2*y1
+        return (r0, r3)
+
+variables are named by blade mask; coefficients are taken along the first axis of the inputs,
+so they may be scalars or numpy arrays (which broadcast)
+"""
+
+PRODUCT_OPS = ("mul", "xor", "lshift", "rshift", "sandwich")
+
+
+class CompiledProduct:
+    def __init__(
+        self,
+        op: str,
+        in_masks: tuple[tuple[int, ...], tuple[int, ...]],
+        out_masks: tuple[int, ...],
+        source: str,
+        blade_names: dict[int, str],
+    ) -> None:
+        self.op = op
+        self.in_masks = in_masks
+        self.out_masks = out_masks
+        self.source = source
+        self.blade_names = blade_names
+
+        namespace: dict[str, Any] = {}
+        exec(compile(source, f"<compiled {op}>", "exec"), namespace)
+        self.func: Callable[..., tuple] = namespace[op]
+
+    def __call__(self, x: Sequence[Any], y: Sequence[Any]) -> tuple:
+        """
+        x, y: coefficients in the order of in_masks; returns coefficients in the order of out_masks
+        """
+        return self.func(x, y)
+
+    def __repr__(self) -> str:
+        def names(masks):
+            return "[" + ", ".join(self.blade_names[mask] for mask in masks) + "]"
+
+        left, right = self.in_masks
+        return (
+            f"CompiledProduct({self.op}: {names(left)}, {names(right)} -> {names(self.out_masks)})"
+        )
+
+
+def blade_order(mask: int) -> tuple[int, list[int]]:
+    """
+    sort key: by grade and then like itertools.combinations (the order of ClAlg.grade_masks)
+    """
+    return mask.bit_count(), list(mask_bits(mask))
+
+
+def _rev_sign(mask: int) -> int:
+    return -1 if mask.bit_count() % 4 in (2, 3) else 1
+
+
+def _op_allows(op: str, mask1: int, mask2: int) -> bool:
+    if op == "xor":
+        return not mask1 & mask2
+    if op == "lshift":
+        return not mask1 & ~mask2
+    if op == "rshift":
+        return not mask2 & ~mask1
+
+    return True
+
+
+def product_terms(
+    alg: "ClAlg", op: str, masks1: Sequence[int], masks2: Sequence[int]
+) -> dict[int, dict[tuple[str, ...], Any]]:
+    """
+    result blade -> {monomial (variable names): integer coefficient}
+    sandwich: masks1 are the blades of the versor R, masks2 of X; result is R * X * R.r
+    """
+    terms: dict[int, dict[tuple[str, ...], Any]] = {}
+
+    def add(mask: int, monomial: tuple[str, ...], coef: Any) -> None:
+        if coef == 0:
+            return
+
+        monomials = terms.setdefault(mask, {})
+        monomials[monomial] = monomials.get(monomial, 0) + coef
+
+    if op == "sandwich":
+        for mask_c in masks2:
+            for mask_a in masks1:
+                sign_ac = alg.mask_mul_sign(mask_a, mask_c)
+
+                for mask_b in masks1:
+                    sign = sign_ac * alg.mask_mul_sign(mask_a ^ mask_c, mask_b) * _rev_sign(mask_b)
+                    # factors commute, so the pairs (a, b) and (b, a) share a monomial
+                    monomial = (f"x{min(mask_a, mask_b)}", f"x{max(mask_a, mask_b)}", f"y{mask_c}")
+                    add(mask_a ^ mask_b ^ mask_c, monomial, sign)
+    else:
+        for mask1 in masks1:
+            for mask2 in masks2:
+                if _op_allows(op, mask1, mask2):
+                    add(mask1 ^ mask2, (f"x{mask1}", f"y{mask2}"), alg.mask_mul_sign(mask1, mask2))
+
+    return {
+        mask: {monomial: coef for monomial, coef in monomials.items() if coef != 0}
+        for mask, monomials in sorted(terms.items(), key=lambda item: blade_order(item[0]))
+        if any(coef != 0 for coef in monomials.values())
+    }
+
+
+def _expression(monomials: dict[tuple[str, ...], Any]) -> str:
+    result = ""
+
+    for monomial, coef in monomials.items():
+        product = "*".join(monomial)
+
+        if coef == 1:
+            term = f" + {product}"
+        elif coef == -1:
+            term = f" - {product}"
+        elif isinstance(coef, (int, float)) and coef < 0:
+            term = f" - {-coef!r}*{product}"
+        else:
+            term = f" + {coef!r}*{product}"
+
+        result += term
+
+    return result[3:] if result.startswith(" + ") else "-" + result[3:]
+
+
+def generate_product(
+    alg: "ClAlg",
+    op: str,
+    masks1: Sequence[int],
+    masks2: Sequence[int],
+    out_grades: frozenset[int] | None = None,
+) -> CompiledProduct:
+    if op not in PRODUCT_OPS:
+        raise ValueError(f"Unknown operation {op}; expected one of {PRODUCT_OPS}")
+
+    terms = product_terms(alg, op, masks1, masks2)
+
+    if out_grades is None and op == "sandwich":
+        out_grades = frozenset(mask.bit_count() for mask in masks2)  # grade preserving
+
+    if out_grades is not None:
+        terms = {
+            mask: monomials for mask, monomials in terms.items() if mask.bit_count() in out_grades
+        }
+
+    blade_names = {
+        mask: "".join(alg.bases[i].name for i in range(alg.dim) if mask >> i & 1) or "1"
+        for mask in set(masks1) | set(masks2) | set(terms)
+    }
+
+    lines = [f"def {op}(x, y):"]
+    lines += [f"    x{mask} = x[{i}]  # {blade_names[mask]}" for i, mask in enumerate(masks1)]
+    lines += [f"    y{mask} = y[{i}]  # {blade_names[mask]}" for i, mask in enumerate(masks2)]
+    lines += [f"    r{mask} = {_expression(monomials)}" for mask, monomials in terms.items()]
+    outputs = ", ".join(f"r{mask}" for mask in terms)
+    lines += [f"    return ({outputs}{',' if len(terms) == 1 else ''})"]
+
+    return CompiledProduct(
+        op=op,
+        in_masks=(tuple(masks1), tuple(masks2)),
+        out_masks=tuple(terms),
+        source="\n".join(lines) + "\n",
+        blade_names=blade_names,
+    )
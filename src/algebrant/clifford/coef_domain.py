@@ -0,0 +1,115 @@
+import functools
+import numbers
+from collections.abc import Callable
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any
+
+import numpy as np
+
+from algebrant.algebra.zero_prune import EXACT_PRUNING, PRUNE_CONFIG, ZeroPruning
+
+"""
+Coefficient domains of a ClAlg
+
+factors entering through the ClAlg (blades, random elements, coefficient arrays) are converted to
+the domain; results of operations keep the domain as long as the operation allows (e.g. products
+of float32 factors stay float32, of Fractions stay exact) and are promoted otherwise
+(e.g. the square root of a negative float64 is complex)
+
+the clip tolerance of results is PRUNE_CONFIG.clip, but at least the resolution of the domain
+(float32) or exactly zero (Fraction)
+"""
+
+
+@dataclass(frozen=True)
+class CoefDomain:
+    name: str
+    dtype: np.dtype  # storage of dense coefficients (object for exact domains)
+    scalar: Callable[[Any], Any]  # conversion of a single real (or complex) factor
+    is_complex: bool
+    exact: bool = False
+    min_abs_tol: float = 0.0
+
+    def convert(self, factor: Any) -> Any:
+        """
+        factor in the domain if it fits, otherwise unchanged (e.g. complex or symbolic factors)
+        """
+        if isinstance(factor, numbers.Real if not self.is_complex else numbers.Complex):
+            if self.exact and not isinstance(factor, numbers.Rational | float):
+                return factor
+
+            return self.scalar(factor)
+
+        return factor
+
+    def convert_seq(self, coefs: Any) -> list[Any]:
+        """
+        scalars of the domain (Python numbers where possible)
+        """
+        return [self.convert(coef) for coef in np.asarray(coefs).tolist()]
+
+    def convert_array(self, coefs: np.ndarray) -> np.ndarray:
+        if self.exact:
+            return np.array(self.convert_seq(coefs), dtype=object)
+
+        if coefs.dtype.kind == "c" and not self.is_complex:  # promotion
+            return coefs.astype(np.result_type(self.dtype, np.complex64), copy=False)
+
+        return coefs.astype(self.dtype, copy=False)
+
+    @property
+    def clip(self) -> ZeroPruning:
+        if self.exact:
+            return EXACT_PRUNING
+
+        if PRUNE_CONFIG.clip.abs_tol >= self.min_abs_tol:
+            return PRUNE_CONFIG.clip
+
+        return _pruning(self.min_abs_tol)
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+@functools.cache
+def _pruning(abs_tol: float) -> ZeroPruning:
+    return ZeroPruning(abs_tol=abs_tol)
+
+
+FLOAT32 = CoefDomain(
+    "float32", np.dtype(np.float32), np.float32, is_complex=False, min_abs_tol=1e-6
+)
+FLOAT64 = CoefDomain("float64", np.dtype(np.float64), float, is_complex=False)
+COMPLEX128 = CoefDomain("complex128", np.dtype(np.complex128), complex, is_complex=True)
+FRACTION = CoefDomain("fraction", np.dtype(object), Fraction, is_complex=False, exact=True)
+
+COEF_DOMAINS: dict[Any, CoefDomain] = {
+    "float32": FLOAT32,
+    np.float32: FLOAT32,
+    "float64": FLOAT64,
+    float: FLOAT64,
+    np.float64: FLOAT64,
+    "complex128": COMPLEX128,
+    complex: COMPLEX128,
+    np.complex128: COMPLEX128,
+    "fraction": FRACTION,
+    Fraction: FRACTION,
+    int: FRACTION,
+}
+
+
+def coef_domain(spec: Any) -> CoefDomain:
+    """
+    domain by name ("float32", "float64", "complex128", "fraction") or type (e.g. np.float32, Fraction)
+    """
+    if isinstance(spec, CoefDomain):
+        return spec
+
+    try:
+        return COEF_DOMAINS[spec]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Unknown coefficient domain {spec}; use one of "
+            + ", ".join(sorted(key for key in COEF_DOMAINS if isinstance(key, str)))
+        ) from None
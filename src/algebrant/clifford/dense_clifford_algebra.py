@@ -0,0 +1,236 @@
+import numbers
+import types
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+
+from algebrant.algebra.algebra_data import AlgebraData
+from algebrant.clifford.clifford_algebra import CliffordAlgebra, _grade_test_func
+from algebrant.clifford.clifford_bit_basis import CliffordBitBasis
+
+if TYPE_CHECKING:
+    from algebrant.clifford.clalg import ClAlg
+
+"""
+CliffordAlgebra storing the coefficients in a numpy array of length 2**dim
+index is the blade mask of CliffordBitBasis (i.e. the CayleyTable order)
+
+only numeric coefficients; other operands fall back to the sparse CliffordAlgebra
+opt-in: only a ClAlg created with dense=True makes these elements
+"""
+
+
+class DenseCliffordAlgebra(CliffordAlgebra):
+    def __init__(self, coefs: np.ndarray, *, alg: "ClAlg", op_prio=1) -> None:
+        """
+        Algebra.__init__ is not called: it would assign basis_factor, which is a view computed
+        from coefs here, and check the basis class of every term
+        """
+        if coefs.shape != (1 << len(alg.bases),):
+            raise ValueError(f"Coefficients of shape {coefs.shape} do not fit {alg}")
+
+        self.coefs = coefs
+        self.alg = alg
+        self.basis_class = CliffordBitBasis
+        self.unity_basis = CliffordBitBasis.unity()
+        self.op_prio = op_prio
+
+    @property
+    def basis_factor(self) -> AlgebraData[CliffordBitBasis]:  # type: ignore
+        """
+        sparse view for all generic Algebra functionality (printing, replace, map, ...)
+        """
+        blades = self.alg.cayley.blades  # type: ignore
+        coefs = self.coefs
+
+        return AlgebraData({blades[mask]: coefs[mask].item() for mask in np.flatnonzero(coefs)})
+
+    def _new_coefs(self, coefs: np.ndarray) -> Self:
+        coefs[np.abs(coefs) <= self.alg.zero_pruning.abs_tol] = 0
+
+        return self.__class__(coefs, alg=self.alg, op_prio=self.op_prio)
+
+    def _new(self, basis_factor: AlgebraData) -> Any:
+        """
+        results of generic Algebra functions
+        """
+        coefs = self.alg.coefs_from_basis_factor(basis_factor)
+
+        if coefs is None:  # e.g. symbolic factors
+            return self.to_sparse()._new(basis_factor)
+
+        return self._new_coefs(coefs)
+
+    def to_sparse(self) -> CliffordAlgebra:
+        return CliffordAlgebra(
+            self.basis_factor, basis_class=CliffordBitBasis, op_prio=self.op_prio
+        )
+
+    def _other_coefs(self, other: Any) -> np.ndarray | None:
+        if isinstance(other, DenseCliffordAlgebra):
+            if other.alg is self.alg or other.alg.bases == self.alg.bases:
+                return other.coefs
+
+            return None
+
+        if isinstance(other, CliffordAlgebra):
+            return self.alg.coefs_from_basis_factor(other.basis_factor)
+
+        if isinstance(other, numbers.Number):
+            coefs = np.zeros(len(self.coefs), dtype=np.result_type(self.coefs, other))
+            coefs[0] = other
+            return coefs
+
+        return None
+
+    def _product(self, other: Any, kind: str, *, reflected=False) -> Any:
+        if isinstance(other, numbers.Number) and kind == "mul":
+            return self._new_coefs(self.coefs * other)
+
+        other_coefs = self._other_coefs(other)
+
+        if other_coefs is None:
+            method = getattr(self.to_sparse(), f"__r{kind}__" if reflected else f"__{kind}__", None)
+
+            if method is None:
+                return NotImplemented
+
+            return method(other)
+
+        kernels = self.alg.dense_kernels
+
+        if reflected:
+            return self._new_coefs(kernels.product(other_coefs, self.coefs, kind))
+
+        return self._new_coefs(kernels.product(self.coefs, other_coefs, kind))
+
+    def __mul__(self, other: Any) -> Any:
+        return self._product(other, "mul")
+
+    def __rmul__(self, first: Any) -> Any:
+        return self._product(first, "mul", reflected=True)
+
+    def __xor__(self, other: Any) -> Any:
+        return self._product(other, "xor")
+
+    def __rxor__(self, first: Any) -> Any:
+        return self._product(first, "xor", reflected=True)
+
+    def __lshift__(self, other: Any) -> Any:
+        return self._product(other, "lshift")
+
+    def __rlshift__(self, first: Any) -> Any:
+        return self._product(first, "lshift", reflected=True)
+
+    def __rshift__(self, other: Any) -> Any:
+        return self._product(other, "rshift")
+
+    def __rrshift__(self, first: Any) -> Any:
+        return self._product(first, "rshift", reflected=True)
+
+    def __add__(self, other: Any) -> Any:
+        other_coefs = self._other_coefs(other)
+
+        if other_coefs is None:
+            return self.to_sparse() + other
+
+        return self._new_coefs(self.coefs + other_coefs)
+
+    def __radd__(self, first: Any) -> Any:
+        return self + first
+
+    # coefficient arrays may be views shared with other elements (e.g. rows of a MultivectorArray)
+    # and the operations are vectorized anyway, so in-place operators do not mutate
+    def __iadd__(self, other: Any) -> Any:
+        return self + other
+
+    def __isub__(self, other: Any) -> Any:
+        return self - other
+
+    def __imul__(self, other: Any) -> Any:
+        return self * other
+
+    def __neg__(self) -> Self:
+        return self.__class__(-self.coefs, alg=self.alg, op_prio=self.op_prio)
+
+    def __sub__(self, other: Any) -> Any:
+        return self + (-other)
+
+    def __rsub__(self, first: Any) -> Any:
+        return first + (-self)
+
+    def __eq__(self, other: object) -> bool:  # type: ignore
+        if isinstance(other, numbers.Number) and other == 0:
+            return not np.any(self.coefs)
+
+        other_coefs = self._other_coefs(other)
+
+        if other_coefs is None:
+            return NotImplemented
+
+        return bool(np.all(np.abs(self.coefs - other_coefs) <= self.alg.zero_pruning.abs_tol))
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.basis_factor))
+
+    def __rtruediv__(self, numer: Any) -> Any:
+        """
+        solves the linear system of left multiplication
+        """
+        kernels = self.alg.dense_kernels
+        unity = np.zeros(len(self.coefs))
+        unity[0] = 1
+
+        try:
+            inverse = np.linalg.solve(kernels.left_matrix(self.coefs), unity)
+        except np.linalg.LinAlgError:
+            raise ZeroDivisionError(f"Multivector {self} is not invertible") from None
+
+        return numer * self._new_coefs(inverse)
+
+    @property
+    def i(self) -> Self:
+        return self._new_coefs(self.alg.dense_kernels.involution(self.coefs, "i"))
+
+    @property
+    def r(self) -> Self:
+        return self._new_coefs(self.alg.dense_kernels.involution(self.coefs, "r"))
+
+    @property
+    def cl(self) -> Self:
+        return self._new_coefs(self.alg.dense_kernels.involution(self.coefs, "cl"))
+
+    def product(self, other: Any, grades=None) -> Any:
+        """
+        the full dense product is a single kernel call, so the grades are selected afterwards
+        """
+        if grades is None or self._other_coefs(other) is None:
+            return super().product(other, grades)
+
+        return (self * other).take_grades(_grade_test_func(grades))
+
+    def scalar_product(self, other: Any) -> Any:
+        other_coefs = self._other_coefs(other)
+
+        if other_coefs is None:
+            return super().scalar_product(other)
+
+        return self.alg.dense_kernels.scalar_product(self.coefs, other_coefs).item()
+
+    @property
+    def scalar(self) -> Any:
+        return self.coefs[0].item()
+
+    def take_grades(self, *grades) -> Self:
+        if grades and isinstance(grades[0], types.FunctionType):
+            grade_test_func = grades[0]
+        else:
+            grade_test_func = lambda g: g in grades
+
+        return self._new_coefs(
+            np.where(self.alg.dense_kernels.grade_mask(grade_test_func), self.coefs, 0)
+        )
+
+    @property
+    def grades(self) -> frozenset[int | None]:
+        return frozenset(self.alg.dense_kernels.grades[np.flatnonzero(self.coefs)].tolist())
@@ -0,0 +1,99 @@
+import numpy as np
+
+from algebrant.clifford.cayley import CayleyTable
+
+"""
+Vectorized products of coefficient arrays whose last axis is indexed by the blade mask
+(i.e. CliffordBitBasis.mask; same order as CayleyTable)
+
+leading axes are broadcast, so the same kernels serve single and batched multivectors
+"""
+
+PRODUCT_KINDS = ("mul", "xor", "lshift", "rshift")
+
+
+class DenseKernels:
+    """
+    product(x, y)[..., k] = sum_a x[..., a] * signs[a, k] * y[..., perm[a, k]]
+
+    i.e. row a lists for every result blade k the sign of blade(a) * blade(a ^ k)
+    """
+
+    def __init__(self, table: CayleyTable) -> None:
+        self.size = table.size
+        self.dim = table.dim
+
+        masks = np.arange(self.size)
+        row_mask = masks[:, None]
+        other_mask = table.index  # blade of y which gives result k from blade a of x
+
+        self.perm: np.ndarray = other_mask
+        self.grades: np.ndarray = np.bitwise_count(masks)
+
+        gp_signs = table.sign[row_mask, other_mask]
+        zero = np.zeros_like(gp_signs)
+
+        self.signs: dict[str, np.ndarray] = {
+            "mul": gp_signs,
+            "xor": np.where(row_mask & other_mask == 0, gp_signs, zero),
+            "lshift": np.where(row_mask & ~other_mask == 0, gp_signs, zero),
+            "rshift": np.where(other_mask & ~row_mask == 0, gp_signs, zero),
+        }
+
+        # <blade(a) * blade(a)>_0; the only blade pairs contributing to scalar parts
+        self.sqr_signs: np.ndarray = np.diagonal(table.sign).copy()
+
+        grades_mod_4 = self.grades % 4
+        self.involution_signs: dict[str, np.ndarray] = {
+            "i": np.where(grades_mod_4 % 2 == 1, -1, 1).astype(np.int8),
+            "r": np.where(grades_mod_4 >= 2, -1, 1).astype(np.int8),
+            "cl": np.where((grades_mod_4 == 1) | (grades_mod_4 == 2), -1, 1).astype(np.int8),
+        }
+
+    def product(self, x: np.ndarray, y: np.ndarray, kind: str = "mul") -> np.ndarray:
+        signs = self.signs[kind]
+
+        if x.ndim == 1 and y.ndim == 1:
+            rows = np.flatnonzero(x)
+            return np.einsum("a,ak,ak->k", x[rows], signs[rows], y[self.perm[rows]])
+
+        # a single multivector against a batch is a linear map -> one matrix product
+        if y.ndim == 1:
+            return x @ (signs * y[self.perm])
+
+        if x.ndim == 1:
+            return y @ self.left_matrix(x, kind).T
+
+        result = np.zeros(np.broadcast_shapes(x.shape, y.shape), dtype=np.result_type(x, y, signs))
+
+        # loop over the blades of x which occur anywhere in the batch
+        for row in np.flatnonzero(np.any(x != 0, axis=tuple(range(x.ndim - 1)))):
+            result += x[..., row, None] * (signs[row] * y[..., self.perm[row]])
+
+        return result
+
+    def scalar_product(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        scalar part of product(x, y) without computing the other grades
+        """
+        return np.sum(x * self.sqr_signs * y, axis=-1)
+
+    def left_matrix(self, x: np.ndarray, kind: str = "mul") -> np.ndarray:
+        """
+        matrix L such that product(x, y, kind) == L @ y (also batched over leading axes of x)
+        """
+        signs = self.signs[kind]
+        result = np.zeros(x.shape + (self.size,), dtype=np.result_type(x, signs))
+
+        cols = np.arange(self.size)
+        for row in np.flatnonzero(np.any(x != 0, axis=tuple(range(x.ndim - 1)))):
+            # blade row times blade b lands in blade row ^ b
+            result[..., row ^ cols, cols] += x[..., row, None] * signs[row, row ^ cols]
+
+        return result
+
+    def involution(self, x: np.ndarray, kind: str) -> np.ndarray:
+        return x * self.involution_signs[kind]
+
+    def grade_mask(self, grade_test) -> np.ndarray:
+        return np.array([grade_test(grade) for grade in range(self.dim + 1)])[self.grades]
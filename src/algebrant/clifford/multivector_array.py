@@ -0,0 +1,278 @@
+import numbers
+import types
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+
+from algebrant.clifford.cl_exp_log import exp_batch, log_batch, sqrt_batch
+from algebrant.clifford.clifford_algebra import CliffordAlgebra
+from algebrant.clifford.dense_clifford_algebra import DenseCliffordAlgebra
+
+if TYPE_CHECKING:
+    from algebrant.clifford.clalg import ClAlg
+
+"""
+Batch of multivectors of one ClAlg stored as array of shape (..., 2**dim)
+
+last axis is indexed by the blade mask (CliffordBitBasis.mask), leading axes broadcast like numpy
+single CliffordAlgebra operands are broadcast to the whole batch
+"""
+
+
+class MultivectorArray:
+    __array_ufunc__ = None  # numpy arrays as left operand should defer to the reflected operators
+
+    def __init__(self, coefs: Any, *, alg: "ClAlg") -> None:
+        coefs = np.asarray(coefs)
+
+        if coefs.ndim == 0 or coefs.shape[-1] != 1 << len(alg.bases):
+            raise ValueError(f"Coefficients of shape {coefs.shape} do not fit {alg}")
+
+        self.coefs = coefs
+        self.alg = alg
+
+    @classmethod
+    def from_list(cls, elems: Iterable[CliffordAlgebra | numbers.Number], *, alg: "ClAlg") -> Self:
+        return cls(np.array([cls._elem_coefs(elem, alg) for elem in elems]), alg=alg)
+
+    @classmethod
+    def zeros(cls, shape: int | tuple[int, ...], *, alg: "ClAlg", dtype=None) -> Self:
+        """
+        dtype: by default the coefficient domain of alg (float if not set)
+        """
+        if isinstance(shape, int):
+            shape = (shape,)
+
+        if dtype is None:
+            dtype = float if alg.coef_domain is None else alg.coef_domain.dtype
+
+        return cls(np.zeros(shape + (1 << len(alg.bases),), dtype=dtype), alg=alg)
+
+    @staticmethod
+    def _elem_coefs(elem: Any, alg: "ClAlg") -> np.ndarray:
+        if isinstance(elem, DenseCliffordAlgebra) and (
+            elem.alg is alg or elem.alg.bases == alg.bases
+        ):
+            return elem.coefs
+
+        if isinstance(elem, numbers.Number):
+            coefs = np.zeros(1 << len(alg.bases), dtype=alg._dtype(elem))
+            coefs[0] = elem
+            return coefs
+
+        coefs = alg.coefs_from_basis_factor(elem.basis_factor)
+
+        if coefs is None:
+            raise ValueError(f"Cannot convert {elem} to numeric coefficients of {alg}")
+
+        return coefs
+
+    def to_list(self) -> list[CliffordAlgebra]:
+        return [
+            self.alg.from_coefs(coefs) for coefs in self.coefs.reshape(-1, self.coefs.shape[-1])
+        ]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        batch shape (without the blade axis)
+        """
+        return self.coefs.shape[:-1]
+
+    def __len__(self) -> int:
+        return self.coefs.shape[0]
+
+    def __getitem__(self, idx: Any) -> Any:
+        if not isinstance(idx, tuple):
+            idx = (idx,)
+
+        coefs = self.coefs[idx + (slice(None),)]
+
+        if coefs.ndim == 1:
+            return self.alg.from_coefs(coefs)
+
+        return self.__class__(coefs, alg=self.alg)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"MultivectorArray(shape={self.shape}, alg={self.alg})"
+
+    def _new(self, coefs: np.ndarray) -> Self:
+        return self.__class__(coefs, alg=self.alg)
+
+    def _other_coefs(self, other: Any) -> np.ndarray | None:
+        """
+        coefficients broadcastable against self.coefs
+        """
+        if isinstance(other, MultivectorArray):
+            if other.alg is not self.alg and other.alg.bases != self.alg.bases:
+                raise ValueError(f"Cannot combine elements of {self.alg} and {other.alg}")
+
+            return other.coefs
+
+        if isinstance(other, np.ndarray):  # scalar per batch element
+            coefs = np.zeros(
+                other.shape + (self.coefs.shape[-1],), dtype=np.result_type(other, float)
+            )
+            coefs[..., 0] = other
+            return coefs
+
+        if isinstance(other, CliffordAlgebra | numbers.Number):
+            return self._elem_coefs(other, self.alg)
+
+        return None
+
+    def _product(self, other: Any, kind: str, *, reflected=False) -> Self:
+        if isinstance(other, numbers.Number) and kind == "mul":
+            return self._new(self.coefs * other)
+
+        if isinstance(other, np.ndarray) and kind == "mul":
+            return self._new(self.coefs * other[..., None])
+
+        other_coefs = self._other_coefs(other)
+
+        if other_coefs is None:
+            return NotImplemented
+
+        kernels = self.alg.dense_kernels
+
+        if reflected:
+            return self._new(kernels.product(other_coefs, self.coefs, kind))
+
+        return self._new(kernels.product(self.coefs, other_coefs, kind))
+
+    def __mul__(self, other: Any) -> Self:
+        return self._product(other, "mul")
+
+    def __rmul__(self, first: Any) -> Self:
+        return self._product(first, "mul", reflected=True)
+
+    def __xor__(self, other: Any) -> Self:
+        return self._product(other, "xor")
+
+    def __rxor__(self, first: Any) -> Self:
+        return self._product(first, "xor", reflected=True)
+
+    def __lshift__(self, other: Any) -> Self:
+        return self._product(other, "lshift")
+
+    def __rlshift__(self, first: Any) -> Self:
+        return self._product(first, "lshift", reflected=True)
+
+    def __rshift__(self, other: Any) -> Self:
+        return self._product(other, "rshift")
+
+    def __rrshift__(self, first: Any) -> Self:
+        return self._product(first, "rshift", reflected=True)
+
+    def __truediv__(self, other: Any) -> Self:
+        if isinstance(other, numbers.Number):
+            return self._new(self.coefs / other)
+
+        if isinstance(other, np.ndarray):
+            return self._new(self.coefs / other[..., None])
+
+        return NotImplemented
+
+    def __add__(self, other: Any) -> Self:
+        other_coefs = self._other_coefs(other)
+
+        if other_coefs is None:
+            return NotImplemented
+
+        return self._new(self.coefs + other_coefs)
+
+    def __radd__(self, first: Any) -> Self:
+        return self + first
+
+    def __neg__(self) -> Self:
+        return self._new(-self.coefs)
+
+    def __sub__(self, other: Any) -> Self:
+        return self + (-other)
+
+    def __rsub__(self, first: Any) -> Self:
+        return (-self) + first
+
+    @property
+    def i(self) -> Self:
+        return self._new(self.alg.dense_kernels.involution(self.coefs, "i"))
+
+    @property
+    def r(self) -> Self:
+        return self._new(self.alg.dense_kernels.involution(self.coefs, "r"))
+
+    @property
+    def cl(self) -> Self:
+        return self._new(self.alg.dense_kernels.involution(self.coefs, "cl"))
+
+    @property
+    def scalar(self) -> np.ndarray:
+        return self.coefs[..., 0]
+
+    def take_grades(self, *grades) -> Self:
+        if grades and isinstance(grades[0], types.FunctionType):
+            grade_test_func = grades[0]
+        else:
+            grade_test_func = lambda g: g in grades
+
+        return self._new(
+            np.where(self.alg.dense_kernels.grade_mask(grade_test_func), self.coefs, 0)
+        )
+
+    @property
+    def grades(self) -> frozenset[int]:
+        """
+        grades present anywhere in the batch
+        """
+        used = np.any(self.coefs != 0, axis=tuple(range(self.coefs.ndim - 1)))
+
+        return frozenset(self.alg.dense_kernels.grades[used].tolist())
+
+    def scalar_product(self, other: Any) -> np.ndarray:
+        """
+        scalar part of self * other
+        """
+        other_coefs = self._other_coefs(other)
+
+        if other_coefs is None:
+            raise ValueError(f"Cannot take scalar product with {other}")
+
+        return self.alg.dense_kernels.scalar_product(self.coefs, other_coefs)
+
+    @property
+    def norm_sqr(self) -> np.ndarray:
+        """
+        scalar part of A * A.r (may be negative or zero for non-Euclidean signatures)
+        """
+        return self.scalar_product(self.r)
+
+    @property
+    def norm(self) -> np.ndarray:
+        return np.sqrt(np.abs(self.norm_sqr))
+
+    @property
+    def coef_norm(self) -> np.ndarray:
+        """
+        Euclidean norm of the coefficients
+        """
+        return np.linalg.norm(self.coefs, axis=-1)
+
+    def exp(self) -> Self:
+        """
+        vectorized closed form for batches of bivectors (up to two commuting planes)
+        """
+        return exp_batch(self)
+
+    def log(self) -> Self:
+        """
+        vectorized closed form for batches of rotors (up to two commuting planes)
+        """
+        return log_batch(self)
+
+    def sqrt(self) -> Self:
+        return sqrt_batch(self)
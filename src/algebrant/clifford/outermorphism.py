@@ -0,0 +1,137 @@
+import operator
+from functools import cached_property, reduce
+from itertools import combinations
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+
+from algebrant.algebra.algebra import Algebra
+
+if TYPE_CHECKING:
+    from algebrant.clifford.clifford_algebra import CliffordAlgebra
+
+"""
+Versor sandwich X -> V * X * V^-1 compiled to its grade-preserving linear map
+
+the map on vectors is an n x n matrix M; on grade k blades it is the k-th compound matrix
+(all k x k minors of M), since the sandwich is an outermorphism
+
+blades are ordered by grade and then like itertools.combinations of the vectors,
+i.e. the order of VecBasis/ClMat (grade_1_to_all) and ClAlg.grade_masks
+"""
+
+
+class Outermorphism:
+    def __init__(self, matrix: np.ndarray, vecs: Sequence["CliffordAlgebra"]) -> None:
+        """
+        matrix: column j are the coefficients of the image of vecs[j]
+        """
+        self.matrix = matrix
+        self.vecs = list(vecs)
+        self.dim = len(vecs)
+
+        self.blocks = [compound_matrix(matrix, grade) for grade in range(self.dim + 1)]
+
+    @classmethod
+    def from_versor(
+        cls, versor: "CliffordAlgebra", vecs: Sequence["CliffordAlgebra"]
+    ) -> "Outermorphism":
+        inverse = 1 / versor
+        vec_index = _blade_index(vecs)
+
+        matrix = np.zeros((len(vecs), len(vecs)), dtype=complex)
+
+        for j, vec in enumerate(vecs):
+            image = versor * vec * inverse
+
+            for basis, factor in image.basis_factor:
+                if basis not in vec_index:
+                    raise ValueError(f"{versor} is not a versor: {vec} is mapped to {image}")
+
+                i, vec_factor = vec_index[basis]
+                matrix[i, j] = factor / vec_factor
+
+        if not np.any(matrix.imag):
+            matrix = matrix.real
+
+        return cls(matrix, vecs)
+
+    @cached_property
+    def full_matrix(self) -> np.ndarray:
+        """
+        block diagonal (2**n, 2**n) matrix in blade order
+        """
+        size = 1 << self.dim
+        result = np.zeros((size, size), dtype=self.matrix.dtype)
+
+        start = 0
+        for block in self.blocks:
+            end = start + len(block)
+            result[start:end, start:end] = block
+            start = end
+
+        return result
+
+    def apply_vecs(self, coefs: Any) -> np.ndarray:
+        """
+        vector coefficients of shape (..., n)
+        """
+        return np.asarray(coefs) @ self.matrix.T
+
+    def apply_coefs(self, coefs: Any) -> np.ndarray:
+        """
+        coefficients of shape (..., 2**n) in blade order (e.g. VecBasis.to_coef of ClMat)
+        """
+        return np.asarray(coefs) @ self.full_matrix.T
+
+    @cached_property
+    def blades(self) -> list["CliffordAlgebra"]:
+        unity = self.vecs[0] ** 0
+
+        return [
+            reduce(operator.mul, vecs, unity)
+            for grade in range(self.dim + 1)
+            for vecs in combinations(self.vecs, grade)
+        ]
+
+    def __call__(self, elem: "CliffordAlgebra") -> "CliffordAlgebra":
+        blade_index = _blade_index(self.blades)
+
+        coefs = np.zeros(len(self.blades), dtype=complex)
+
+        for basis, factor in elem.basis_factor:
+            if basis not in blade_index:
+                raise ValueError(f"{elem} is not spanned by the vectors {self.vecs}")
+
+            i, blade_factor = blade_index[basis]
+            coefs[i] = factor / blade_factor
+
+        return Algebra.linear_combination(self.apply_coefs(coefs), self.blades)
+
+    def __repr__(self) -> str:
+        return f"Outermorphism(dim={self.dim})"
+
+
+def compound_matrix(matrix: np.ndarray, grade: int) -> np.ndarray:
+    """
+    k-th compound matrix; entry (I, J) is the minor det(matrix[I, J]) for index combinations I, J
+    """
+    if grade == 0:
+        return np.ones((1, 1), dtype=matrix.dtype)
+
+    idxs = np.array(list(combinations(range(len(matrix)), grade)))
+
+    return np.linalg.det(matrix[idxs[:, None, :, None], idxs[None, :, None, :]])
+
+
+def _blade_index(blades: Sequence["CliffordAlgebra"]) -> dict[Any, tuple[int, Any]]:
+    """
+    basis -> (position, factor) for single term blade elements
+    """
+    result = {}
+
+    for i, blade in enumerate(blades):
+        ((basis, factor),) = blade.basis_factor
+        result[basis] = (i, factor)
+
+    return result
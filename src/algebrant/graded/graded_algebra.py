@@ -1,5 +1,5 @@
 import types
-from typing import Self, TypeVar
+from typing import Any, Self, TypeVar
 
 from algebrant.algebra.algebra import Algebra
 from algebrant.algebra.algebra_data import AlgebraData
@@ -12,8 +12,32 @@ Factor = TypeVar("Factor")
 class GradedAlgebra[Basis: GradedProtocol](Algebra):
     """
     basis elements must be CliffordBases with tuples
+
+    terms are indexed by grade on first use, so that grade queries only touch the selected grades
     """
 
+    _grade_index: dict[int | None, dict[Basis, Any]] | None = None
+
+    @property
+    def grade_index(self) -> dict[int | None, dict[Basis, Any]]:
+        """
+        basis_factor bucketed by grade (do not modify)
+        """
+        if self._grade_index is None:
+            grade_index: dict[int | None, dict[Basis, Any]] = {}
+
+            for basis, factor in self.basis_factor:
+                bucket = grade_index.get(basis.grade)
+
+                if bucket is None:
+                    grade_index[basis.grade] = {basis: factor}
+                else:
+                    bucket[basis] = factor
+
+            self._grade_index = grade_index
+
+        return self._grade_index
+
     @property
     def i(self) -> Self:
         """
@@ -68,7 +92,7 @@ class GradedAlgebra[Basis: GradedProtocol](Algebra):
         """
         Returns the scalar part of the algebra, which is the part with grade 0.
         """
-        result = [factor for basis, factor in self.basis_factor if basis.grade == 0]
+        result = list(self.grade_index.get(0, {}).values())
 
         if len(result) > 1:
             raise ValueError(f"Expected only one scalar part, got {len(result)}: {result}")
@@ -84,25 +108,40 @@ class GradedAlgebra[Basis: GradedProtocol](Algebra):
         else:
             grade_test_func = lambda g: g in grades  # noqa: E731
 
-        return self._new(  # TODO: generalize
+        basis_factor: dict[Basis, Any] = {}
+
+        for grade, bucket in self.grade_index.items():
+            if grade_test_func(grade):
+                basis_factor.update(bucket)
+
+        return self._new(AlgebraData(basis_factor))  # TODO: generalize
+
+    def flip_grade_signs(self, grade_test_func) -> Self:
+        """
+        negates the terms whose grade passes grade_test_func
+        """
+        return self._new(
             AlgebraData(
                 {
-                    basis: factor
-                    for basis, factor in self.basis_factor
-                    if grade_test_func(basis.grade)
+                    basis: -factor if grade_test_func(grade) else factor
+                    for grade, bucket in self.grade_index.items()
+                    for basis, factor in bucket.items()
                 }
             )
         )
 
     @property
     def grades(self) -> frozenset[int | None]:  # TODO: remove somehow?
-        return frozenset(basis.grade for basis, _ in self.basis_factor)
+        return frozenset(self.grade_index)
 
     def split_into_grades(self) -> dict[int | None, Self]:
         """
         Split the algebra into grades
         """
-        return {grade: self.take_grades(grade) for grade in self.grades}
+        return {
+            grade: self._new(AlgebraData(dict(bucket)))
+            for grade, bucket in self.grade_index.items()
+        }
 
     @property
     def sqr(self):
@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Self
@@ -8,9 +9,13 @@ from algebrant.symbols.nc_symbols import NCSymbols
 from algebrant.utils import all_not_none
 
 
-@dataclass(unsafe_hash=True, repr=False)
+@dataclass(eq=False, repr=False)
 class GradedSymbols(NCSymbols[GradedSymbol]):
-    @property
+    """
+    instances are interned, so cached properties are computed once per distinct basis
+    """
+
+    @functools.cached_property
     def sort_key(self) -> BasisSortKey:
         names = tuple(sym.name for sym in self.symbols)
 
@@ -24,18 +29,18 @@ class GradedSymbols(NCSymbols[GradedSymbol]):
         else:
             return ((10000, len(self.symbols)), names)
 
-    @property
+    @functools.cached_property
     def is_odd(self) -> bool:
         return sum(s.is_odd for s in self.symbols) % 2 == 1
 
-    @property
+    @functools.cached_property
     def grade(self) -> int | None:
         if len(self.symbols) == 1:
             return self.symbols[0].grade
 
         return None
 
-    @property
+    @functools.cached_property
     def grades(self) -> tuple[int | None, ...]:
         return tuple(sym.grade for sym in self.symbols)
 
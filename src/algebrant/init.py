@@ -1,6 +1,7 @@
 from .algebra.algebra import dot_product
 from .clifford.clalg import ClAlg
 from .clifford.clifford_algebra import Cl_vec as E
+from .clifford.multivector_array import MultivectorArray
 from .graded.graded_symbol_algebra import MV
 from .graded.pseudoscalar import Sym_ps, make_I
 from .mv_mat import ClMat, clalg_mat_conv, make_mats_from_paulis
@@ -23,4 +24,5 @@ __all__ = [
     "dot_product",
     "make_mats_from_paulis",
     "ClMat",
+    "MultivectorArray",
 ]
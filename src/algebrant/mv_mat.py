@@ -1,13 +1,19 @@
+import functools
+import operator
+import os
+from dataclasses import dataclass
 from functools import reduce
 from itertools import combinations
 from math import prod
+from pathlib import Path
 
 import numpy as np
 
-from algebrant.algebra.algebra import dot_product
+from algebrant.algebra.algebra import Algebra, dot_product
 from algebrant.clifford.cl_utils import cl_dot
 from algebrant.clifford.clalg import ClAlg
 from algebrant.clifford.clifford_algebra import Cl_vec
+from algebrant.clifford.dense_clifford_algebra import DenseCliffordAlgebra
 
 from .vector_basis import ConvertVecBasis, VecBasis
 
@@ -19,11 +25,166 @@ Paulis = [
 ]
 
 
-def make_mats_from_paulis(indices):
+def make_mats_from_paulis(indices, *, monomial=False):
+    """
+    monomial: MonomialMat instead of dense matrices (Kronecker products of Paulis are monomial)
+    """
+    if monomial:
+        return [MonomialMat.from_paulis(e_idx) for e_idx in indices]
+
     return [reduce(np.kron, [Paulis[i] for i in e_idx]) for e_idx in indices]
 
 
-def grade_1_to_all(es, *, create_func=prod):
+class MonomialMat:
+    def __init__(self, perm, phase):
+        """
+        matrix with the single non-zero entry phase[i] at column perm[i] in each row i
+        products and application to vectors are O(d)
+        """
+        self.perm = np.asarray(perm)
+        self.phase = np.asarray(phase)
+
+    @classmethod
+    def from_dense(cls, mat) -> "MonomialMat | None":
+        """
+        None if mat is not a permutation matrix with phases
+        """
+        mat = np.asarray(mat)
+
+        if mat.ndim != 2 or mat.shape[0] != mat.shape[1]:
+            return None
+
+        nonzero = mat != 0
+        if not np.all(np.count_nonzero(nonzero, axis=1) == 1):
+            return None
+
+        perm = np.argmax(nonzero, axis=1)
+        if len(np.unique(perm)) != len(perm):
+            return None
+
+        return cls(perm, mat[np.arange(len(perm)), perm])
+
+    @classmethod
+    def from_paulis(cls, e_idx) -> "MonomialMat":
+        """
+        Kronecker product of Paulis[i] for i in e_idx
+        """
+        result = cls(np.zeros(1, dtype=int), np.ones(1, dtype=int))
+
+        for i in e_idx:
+            result = result.kron(_PAULI_MONOMIALS[i])
+
+        return result
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.perm), len(self.perm)
+
+    def kron(self, other: "MonomialMat") -> "MonomialMat":
+        size = len(other.perm)
+        return MonomialMat(
+            (self.perm[:, np.newaxis] * size + other.perm).ravel(),
+            np.outer(self.phase, other.phase).ravel(),
+        )
+
+    def direct_sum(self, other: "MonomialMat") -> "MonomialMat":
+        """
+        block diagonal matrix with blocks self and other
+        """
+        return MonomialMat(
+            np.concatenate([self.perm, other.perm + len(self.perm)]),
+            np.concatenate([self.phase, other.phase]),
+        )
+
+    def to_dense(self) -> np.ndarray:
+        result = np.zeros(self.shape, dtype=self.phase.dtype)
+        result[np.arange(len(self.perm)), self.perm] = self.phase
+        return result
+
+    def __array__(self, dtype=None, copy=None):
+        result = self.to_dense()
+        return result if dtype is None else result.astype(dtype)
+
+    def __matmul__(self, other):
+        if isinstance(other, MonomialMat):
+            return MonomialMat(other.perm[self.perm], self.phase * other.phase[self.perm])
+
+        other = np.asarray(other)
+        phase = self.phase if other.ndim == 1 else self.phase[:, np.newaxis]
+        return phase * other[self.perm]
+
+    def __rmatmul__(self, other):
+        other = np.asarray(other)
+        result = np.zeros(other.shape, dtype=np.result_type(other, self.phase))
+        result[..., self.perm] = other * self.phase
+        return result
+
+    def __mul__(self, factor):
+        if isinstance(factor, MonomialMat | np.ndarray):
+            return NotImplemented
+
+        return MonomialMat(self.perm, self.phase * factor)
+
+    def __rmul__(self, factor):
+        return self.__mul__(factor)
+
+    def __neg__(self):
+        return MonomialMat(self.perm, -self.phase)
+
+    def equals(self, other: "MonomialMat") -> bool:
+        return bool(np.array_equal(self.perm, other.perm) and np.all(self.phase == other.phase))
+
+    def is_scalar(self, value) -> bool:
+        """
+        whether equal to value * identity
+        """
+        return bool(
+            np.array_equal(self.perm, np.arange(len(self.perm))) and np.all(self.phase == value)
+        )
+
+    def trace(self):
+        return self.phase[self.perm == np.arange(len(self.perm))].sum()
+
+    def __repr__(self):
+        return f"MonomialMat(perm={self.perm.tolist()}, phase={self.phase.tolist()})"
+
+
+_PAULI_MONOMIALS = [MonomialMat.from_dense(pauli) for pauli in Paulis]
+
+
+def as_monomials(mats) -> list[MonomialMat] | None:
+    """
+    all mats as MonomialMat or None if any of them is not monomial
+    """
+    result = []
+
+    for mat in mats:
+        if not isinstance(mat, MonomialMat):
+            mat = MonomialMat.from_dense(mat)
+
+            if mat is None:
+                return None
+
+        result.append(mat)
+
+    return result
+
+
+def grade_1_to_all(es, *, create_func=prod, mul=None):
+    """
+    products of all subsets of es, ordered by size and then like itertools.combinations
+    mul: each product is mul(prefix product, last element) with the prefix taken from the
+    products already built (one product per element); create_func then only creates the unity
+    """
+    if mul is not None:
+        products = {(): create_func(())}
+
+        for grade in range(1, len(es) + 1):
+            for idx in combinations(range(len(es)), r=grade):
+                products[idx] = mul(products[idx[:-1]], es[idx[-1]])
+
+        return list(products.values())
+
     return [
         create_func(grade_es)
         for grade in range(len(es) + 1)
@@ -31,7 +192,7 @@ def grade_1_to_all(es, *, create_func=prod):
     ]
 
 
-def make_anti_comm_mats(n: int):
+def make_anti_comm_mats(n: int, *, monomial=False):
     """
     for 2n dimensional Clifford algebra
     will create 2n+1 anti-commuting matrices (incl. one for the pseudoscalar)
@@ -46,109 +207,532 @@ def make_anti_comm_mats(n: int):
 
     indices.append((3,) * n)  # extra matrix to choose from
 
-    return make_mats_from_paulis(indices)
+    return make_mats_from_paulis(indices, monomial=monomial)
 
 
-def make_cl_mats(dim: int):
-    if not dim % 2 == 0:
-        raise ValueError(
-            "Only even dimensions supported (odd dimensions require a direct product of 2 matrices)"
-        )
+def make_cl_mats(dim: int, *, sqrs=None):
+    """
+    sqrs: squares (+1 or -1) of the basis vectors (default all +1)
+    odd dimensions are represented by direct sums of 2 blocks (see cl_mat_rep)
+    """
+    if sqrs is None:
+        sqrs = (1,) * dim
+    elif len(sqrs) != dim:
+        raise ValueError(f"Number of squares {len(sqrs)} does not equal dimension {dim}")
 
-    n = dim // 2
-    vec_mats = make_anti_comm_mats(n)[:dim]
-    return vec_mats
+    return [mat.to_dense() for mat in cl_mat_rep(sqrs).vec_mats]
 
 
 def make_cl_vec_basis_from_dim(dim, start_idx=1):
-    return VecBasis(
-        grade_1_to_all(range(start_idx, start_idx + dim), create_func=lambda x: Cl_vec(*x)),
-        dot=cl_dot,
-    )
+    """
+    shared per dimension and start index (through the ClAlg registry)
+    """
+    clalg = ClAlg.from_dim(dim, start_idx=start_idx)
+
+    return clalg.shared("vec_basis", lambda: VecBasis(clalg.get_bases(), dot=cl_dot))
 
 
 def make_cl_vec_basis_from_vec(basis_vecs):
     return VecBasis(
-        grade_1_to_all(basis_vecs, create_func=lambda x: prod(x) if x else Cl_vec()),
+        make_cl_blades(basis_vecs),
         dot=cl_dot,
     )
 
 
-def make_mat_vec_basis_from_mats(vec_mats):
+def make_cl_blades(basis_vecs, *, unity=None):
+    """
+    unity: by default taken from the basis vectors, so that it has the same kind of basis
+    (e.g. bitmask); pass the unity of the ClAlg (ClAlg.one) to key the scalar blade on it
+    """
+    if unity is None:
+        unity = basis_vecs[0] ** 0 if basis_vecs else Cl_vec()
+
+    return grade_1_to_all(basis_vecs, create_func=lambda x: unity, mul=operator.mul)
+
+
+def make_blade_monomials(vec_mats) -> list[MonomialMat] | None:
+    """
+    MonomialMat of all blades (None if vec_mats are not monomial)
+    """
+    monomials = as_monomials(vec_mats)
+
+    if monomials is None:
+        return None
+
+    mat_dim = vec_mats[0].shape[0]
+    identity = MonomialMat(np.arange(mat_dim), np.ones(mat_dim))
+
+    return grade_1_to_all(monomials, create_func=lambda mats: identity, mul=operator.matmul)
+
+
+def make_blade_mats(vec_mats):
+    """
+    dense matrices of all blades; the products are taken of MonomialMat where possible
+    """
+    monomials = make_blade_monomials(vec_mats)
+    if monomials is not None:
+        return [mat.to_dense() for mat in monomials]
+
     mat_dim = vec_mats[0].shape[0]
     identity = np.identity(mat_dim)
 
-    mat_basis = VecBasis(
-        grade_1_to_all(
-            vec_mats,
-            create_func=lambda mats: reduce(np.dot, mats) if mats else identity,
-        ),
-        dot=dot_product,
-    )
+    return grade_1_to_all(vec_mats, create_func=lambda mats: identity, mul=np.dot)
+
+
+def make_mat_vec_basis_from_mats(vec_mats):
+    mat_basis = VecBasis(make_blade_mats(vec_mats), dot=dot_product)
 
     return mat_basis
 
 
 def validate_cl_mats(cl_bases, mat_bases):
+    validate_mat_sqrs(
+        [(base**2).scalar for base in cl_bases],  # TODO
+        mat_bases,
+        names=[str(base) for base in cl_bases],
+    )
+
+
+def validate_mat_sqrs(sqrs, mat_bases, *, names=None):
+    """
+    mat_bases need to square to sqrs and anti-commute pairwise
+    """
+    if names is None:
+        names = [f"e{i}" for i in range(1, len(sqrs) + 1)]
+
+    monomials = as_monomials(mat_bases)  # O(d) products instead of O(d^3)
+    if monomials is not None:
+        mat_bases = monomials
+
     # validate matrices
-    for i, (base, mat) in enumerate(zip(cl_bases, mat_bases)):
-        base_sqr = (base**2).scalar  # TODO
+    for i, (name, base_sqr, mat) in enumerate(zip(names, sqrs, mat_bases)):
         mat_sqr = mat @ mat
 
-        if not np.all(base_sqr * np.eye(mat.shape[0]) == mat_sqr):
+        if not _is_scalar_mat(mat_sqr, base_sqr):
             raise ValueError(
-                f"At index {i}: {base}^2 = {base_sqr} must be equal to square of matrix {mat}^2 = {mat_sqr}"
+                f"At index {i}: {name}^2 = {base_sqr} must be equal to square of matrix {mat}^2 = {mat_sqr}"
             )
 
     for (i, mat1), (j, mat2) in combinations(enumerate(mat_bases), 2):
-        if not np.all(mat1 @ mat2 + mat2 @ mat1 == 0):
+        if not _anti_commute(mat1, mat2):
             raise ValueError(
                 f"At indices {i}, {j}: Matrix {mat1} does not anti-commute with {mat2}"
             )
 
 
+def _is_scalar_mat(mat, value) -> bool:
+    if isinstance(mat, MonomialMat):
+        return mat.is_scalar(value)
+
+    return bool(np.all(value * np.eye(mat.shape[0]) == mat))
+
+
+def _anti_commute(mat1, mat2) -> bool:
+    if isinstance(mat1, MonomialMat):
+        return (mat1 @ mat2).equals(-(mat2 @ mat1))
+
+    return bool(np.all(mat1 @ mat2 + mat2 @ mat1 == 0))
+
+
 class ClMat:
-    def __init__(self, *, vec_mats, vec_cls):
+    def __init__(self, *, vec_mats, vec_cls, min_abs=1e-7, blade_mats=None, unity=None):
+        """
+        the matrices of all blades (in the order of grade_1_to_all) are kept as a stack, so that
+        conversions are single tensor contractions
+        blade_mats: precomputed matrices of all blades (e.g. from cl_mat_rep)
+        unity: scalar blade of the Clifford side (e.g. ClAlg.one; default from vec_cls)
+        """
         validate_cl_mats(vec_cls, vec_mats)
 
         self.dim = len(vec_mats)  # currently only for __repr__
         self.vec_mats = vec_mats  # only for reference of creation
         self.vec_cl = vec_cls
+        self.min_abs = min_abs
+
+        self.cl_basis_vecs = make_cl_blades(vec_cls, unity=unity)
+        if blade_mats is None:
+            blade_mats = make_blade_monomials(vec_mats)
+
+            if blade_mats is None:
+                blade_mats = make_blade_mats(vec_mats)
+
+        monomials = as_monomials(blade_mats)
+
+        if monomials is not None:
+            self.mat_stack = np.array([mat.to_dense() for mat in monomials])
+            gram_matrix = _monomial_gram(monomials)
+        else:
+            self.mat_stack = np.array(blade_mats)
+            gram_matrix = np.einsum("iab,jab->ij", self.mat_stack.conj(), self.mat_stack)
+
+        # dual basis under the Frobenius product (for the Pauli representation conj(M)/d)
+        self.dual_stack = np.tensordot(_inv_gram(gram_matrix), self.mat_stack.conj(), axes=1)
+
+        self._blade_index = _blade_index(self.cl_basis_vecs)
+        self._dense_gather = _dense_gather(self._blade_index)
+
+    @functools.cached_property
+    def convert(self) -> ConvertVecBasis:
+        """
+        conversion through dot products (only needed if vec_cls are not single blades)
+        """
+        c_basis = VecBasis(self.cl_basis_vecs, dot=cl_dot, min_abs=self.min_abs)
+        m_basis = make_mat_vec_basis_from_mats(self.vec_mats)
+        return ConvertVecBasis(c_basis, m_basis)
+
+    def cl_coefs(self, elem, *, verify=True) -> np.ndarray:
+        """
+        coefficients of elem in the order of cl_basis_vecs
+        """
+        if self._blade_index is None:
+            return self.convert.vec_basis_list[0].to_coef(elem, verify=verify)
+
+        if (
+            isinstance(elem, DenseCliffordAlgebra)
+            and self._dense_gather is not None
+            and elem.alg is self._dense_gather[0]
+        ):
+            _, masks, factors = self._dense_gather
+
+            if verify and np.any(np.delete(elem.coefs, masks) != 0):
+                raise ValueError(f"Missing basis for {elem}")
+
+            return elem.coefs[masks] / factors
+
+        coefs = [0] * len(self.cl_basis_vecs)
+
+        for basis, factor in elem.basis_factor:
+            if basis not in self._blade_index:
+                if verify:
+                    raise ValueError(f"Missing basis {basis} for {elem}")
+                continue
+
+            idx, basis_factor = self._blade_index[basis]
+            coefs[idx] = factor / basis_factor if basis_factor != 1 else factor
+
+        return np.array(coefs)
+
+    def to_mat(self, elem, *, verify=True):
+        return np.tensordot(self.cl_coefs(elem, verify=verify), self.mat_stack, axes=1)
+
+    def to_cl(self, elem, *, verify=True):
+        coefs = self.to_cl_many(np.asarray(elem)[np.newaxis], verify=verify)[0]
+
+        return Algebra.linear_combination(coefs, self.cl_basis_vecs)
+
+    def to_mat_many(self, elems, *, verify=True) -> np.ndarray:
+        """
+        elems: coefficient array (N, 2**n) in the order of cl_basis_vecs or list of CliffordAlgebra
+        returns matrices (N, d, d)
+        """
+        if isinstance(elems, np.ndarray):
+            coefs = elems
+        else:
+            coefs = np.array([self.cl_coefs(elem, verify=verify) for elem in elems])
+
+        if coefs.ndim != 2 or coefs.shape[1] != len(self.mat_stack):
+            raise ValueError(
+                f"Coefficients of shape {coefs.shape} do not fit (N, {len(self.mat_stack)})"
+            )
+
+        return np.tensordot(coefs, self.mat_stack, axes=1)
+
+    def to_cl_many(self, mats, *, verify=True, as_cl=False) -> np.ndarray | list:
+        """
+        mats: matrices (N, d, d)
+        returns coefficients (N, 2**n) in the order of cl_basis_vecs (or CliffordAlgebra if as_cl)
+        verify: residual norm of the re-synthesized matrices relative to the norm of the matrices
+        """
+        mats = np.asarray(mats)
+
+        if mats.ndim != 3 or mats.shape[1:] != self.mat_stack.shape[1:]:
+            raise ValueError(
+                f"Matrices of shape {mats.shape} do not fit (N, {', '.join(map(str, self.mat_stack.shape[1:]))})"
+            )
+
+        coefs = np.einsum("kab,nab->nk", self.dual_stack, mats)
+        coefs[np.isclose(coefs, 0, atol=self.min_abs)] = 0
 
-        c_basis = make_cl_vec_basis_from_vec(vec_cls)
-        m_basis = make_mat_vec_basis_from_mats(vec_mats)
-        self.convert = ConvertVecBasis(c_basis, m_basis)
+        if verify:
+            self._verify_residual(coefs, mats)
 
-    def to_mat(self, elem, **params):
-        return self.convert(elem, 0, 1, **params)
+        if as_cl:
+            return [Algebra.linear_combination(row, self.cl_basis_vecs) for row in coefs]
 
-    def to_cl(self, elem, **params):
-        return self.convert(elem, 1, 0, **params)
+        return coefs
+
+    def _verify_residual(self, coefs, mats):
+        residual = np.linalg.norm(np.tensordot(coefs, self.mat_stack, axes=1) - mats, axis=(1, 2))
+        bound = self.min_abs * np.maximum(1, np.linalg.norm(mats, axis=(1, 2)))
+
+        (bad,) = np.nonzero(residual > bound)
+
+        if len(bad):
+            i = bad[np.argmax(residual[bad])]
+            raise ValueError(
+                f"Missing basis for {len(bad)} of {len(mats)} matrices; largest residual norm "
+                f"{residual[i]} at index {i} for coefs {coefs[i]} of\n{mats[i]}"
+            )
 
     @classmethod
     def from_dim(cls, dim):
-        mats = make_cl_mats(dim)
-        return cls(mats, [Cl_vec(i + 1) for i in range(dim)])
+        return clalg_mat_conv(ClAlg.from_dim(dim))
+
+    @classmethod
+    def from_pq(cls, p, q):
+        return clalg_mat_conv(ClAlg.from_pq(p, q))
 
     def __repr__(self):
         return f"ClMat({self.dim})"
 
 
 def clalg_mat_conv(clalg: ClAlg, *, mats=None) -> ClMat:
+    """
+    the default representation is built once per ClAlg
+    """
+    if mats is None:
+        return clalg.shared("mat_conv", lambda: _make_clalg_mat_conv(clalg))
+
+    return ClMat(vec_mats=mats, vec_cls=clalg.get_bases(1), unity=clalg.one)  # validates mats
+
+
+def _make_clalg_mat_conv(clalg: ClAlg) -> ClMat:
     bases = clalg.get_bases(1)
 
-    if mats is None:
-        mats0 = make_anti_comm_mats((len(bases) + 1) // 2)
-
-        mats = []
-        for base, mat in zip(bases, mats0):
-            if base**2 == 1:
-                mats.append(mat)
-            elif base**2 == -1:
-                mats.append(1j * mat)
-            else:
-                raise ValueError(f"Base {base} not supported")
+    sqrs = []
+    for base in bases:
+        if base**2 == 1:
+            sqrs.append(1)
+        elif base**2 == -1:
+            sqrs.append(-1)
+        else:
+            raise ValueError(f"Base {base} not supported")
+
+    rep = cl_mat_rep(sqrs)
+
+    return ClMat(
+        vec_mats=list(rep.vec_mats),
+        vec_cls=bases,
+        blade_mats=list(rep.blade_mats),
+        unity=clalg.one,
+    )
+
+
+@dataclass
+class MatRepConfig:
+    """
+    cache_dir: directory for .npz files of generated representations (None: only kept in memory)
+    """
+
+    cache_dir: str | os.PathLike | None = None
+
+
+MAT_REP_CONFIG = MatRepConfig()
+
+_MAT_REPS: dict[tuple[int, ...], "ClMatRep"] = {}
+
+
+@dataclass(frozen=True)
+class ClMatRep:
+    """
+    matrix representation of the Clifford algebra with basis vectors squaring to sqrs
+    matrices of the basis vectors and of all blades (in the order of grade_1_to_all)
+    """
+
+    sqrs: tuple[int, ...]
+    vec_mats: tuple[MonomialMat, ...]
+    blade_mats: tuple[MonomialMat, ...]
+
+    @property
+    def mat_dim(self) -> int:
+        return self.blade_mats[0].shape[0]
+
+    def save(self, path) -> None:
+        """
+        written to a temporary file first, so that concurrent readers never see partial files
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        with open(tmp_path, "wb") as file:
+            np.savez(
+                file,
+                sqrs=np.array(self.sqrs, dtype=int),
+                vec_perms=np.array([mat.perm for mat in self.vec_mats]).reshape(-1, self.mat_dim),
+                vec_phases=np.array([mat.phase for mat in self.vec_mats]).reshape(-1, self.mat_dim),
+                blade_perms=np.array([mat.perm for mat in self.blade_mats]),
+                blade_phases=np.array([mat.phase for mat in self.blade_mats]),
+            )
+
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path) -> "ClMatRep":
+        with np.load(path) as data:
+            return cls(
+                sqrs=tuple(data["sqrs"].tolist()),
+                vec_mats=tuple(map(MonomialMat, data["vec_perms"], data["vec_phases"])),
+                blade_mats=tuple(map(MonomialMat, data["blade_perms"], data["blade_phases"])),
+            )
+
+
+def cl_mat_rep(sqrs, *, cache_dir=None) -> ClMatRep:
+    """
+    representation for basis vectors squaring to sqrs (+1 or -1), e.g. (1, 1, -1) for Cl(2, 1)
+    cached in memory and as .npz in cache_dir (default MAT_REP_CONFIG.cache_dir)
+
+    even dimensions 2n: anti-commuting Pauli products of size 2**n (times 1j for squares -1)
+    odd dimensions 2n+1: all 2n+1 anti-commuting Pauli products as blocks M + (-M) of size 2**(n+1),
+    since a single block would represent the pseudoscalar as a multiple of the identity
+    """
+    sqrs = tuple(sqrs)
+
+    if not all(sqr in (1, -1) for sqr in sqrs):
+        raise ValueError(f"Only squares +1 and -1 supported, not {sqrs}")
+
+    sqrs = tuple(int(sqr) for sqr in sqrs)
+
+    if sqrs in _MAT_REPS:
+        return _MAT_REPS[sqrs]
+
+    if cache_dir is None:
+        cache_dir = MAT_REP_CONFIG.cache_dir
+
+    path = Path(cache_dir) / _mat_rep_filename(sqrs) if cache_dir is not None else None
+
+    if path is not None and path.exists():
+        rep = ClMatRep.load(path)
+
+        if rep.sqrs != sqrs:
+            raise ValueError(f"Cache file {path} is for squares {rep.sqrs}, not {sqrs}")
+
+        _validate_mat_rep(rep, path)
+    else:
+        rep = _make_mat_rep(sqrs)
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            rep.save(path)
+
+    _MAT_REPS[sqrs] = rep
+
+    return rep
+
+
+def _mat_rep_filename(sqrs: tuple[int, ...]) -> str:
+    p = sqrs.count(1)
+    signs = "".join("+" if sqr == 1 else "-" for sqr in sqrs)
+    return f"cl_mats_{p}_{len(sqrs) - p}_{signs}.npz"
+
+
+def _validate_mat_rep(rep: ClMatRep, path) -> None:
+    """
+    the blades are rebuilt from the vector matrices with prefix products (O(2**n d))
+    """
+    dim = len(rep.sqrs)
+
+    if len(rep.vec_mats) != dim or len(rep.blade_mats) != 2**dim:
+        raise ValueError(
+            f"Cache file {path} has {len(rep.vec_mats)} vector and {len(rep.blade_mats)} blade "
+            f"matrices for dimension {dim}"
+        )
+
+    if any(mat.shape != (rep.mat_dim, rep.mat_dim) for mat in rep.vec_mats + rep.blade_mats):
+        raise ValueError(f"Cache file {path} has matrices of different shapes")
+
+    validate_mat_sqrs(rep.sqrs, rep.vec_mats)
+
+    blade_mats = make_blade_monomials(rep.vec_mats)
+
+    if blade_mats is None or not all(
+        mat.equals(blade_mat) for mat, blade_mat in zip(rep.blade_mats, blade_mats)
+    ):
+        raise ValueError(f"Cache file {path} has blade matrices which differ from the products")
+
+
+def _make_mat_rep(sqrs: tuple[int, ...]) -> ClMatRep:
+    dim = len(sqrs)
+    mats = make_anti_comm_mats(dim // 2, monomial=True)
+
+    if dim % 2 == 1:
+        mats = [mat.direct_sum(-mat) for mat in mats]
+
+    vec_mats = [mat if sqr == 1 else 1j * mat for sqr, mat in zip(sqrs, mats)]
+
+    validate_mat_sqrs(sqrs, vec_mats)
+
+    return ClMatRep(
+        sqrs=sqrs, vec_mats=tuple(vec_mats), blade_mats=tuple(make_blade_monomials(vec_mats))
+    )
+
+
+def _inv_gram(gram_matrix: np.ndarray) -> np.ndarray:
+    """
+    diagonal for orthogonal bases (e.g. Pauli products), which skips the SVD and inversion
+    """
+    diag = np.diagonal(gram_matrix)
+
+    if np.count_nonzero(gram_matrix) == np.count_nonzero(diag):
+        rank = np.count_nonzero(diag)
+        if rank == len(diag):
+            return np.diag(1 / diag)
     else:
-        validate_cl_mats(bases, mats)
+        rank = np.linalg.matrix_rank(gram_matrix)
+        if rank == len(diag):
+            return np.linalg.inv(gram_matrix)
+
+    raise ValueError(f"Matrix basis is rank-deficient: {rank} < {len(diag)}")
+
+
+def _monomial_gram(monomials: list[MonomialMat]) -> np.ndarray:
+    """
+    Frobenius products of all pairs; only entries in the same row and column contribute
+    """
+    perms = np.array([mat.perm for mat in monomials])
+    phases = np.array([mat.phase for mat in monomials])
+
+    result = np.zeros((len(monomials), len(monomials)), dtype=np.result_type(phases, float))
+
+    for row in range(perms.shape[1]):
+        same_column = perms[:, row, np.newaxis] == perms[np.newaxis, :, row]
+        result += same_column * np.outer(phases[:, row].conj(), phases[:, row])
+
+    return result
+
+
+def _dense_gather(blade_index: dict | None) -> tuple[ClAlg, np.ndarray, np.ndarray] | None:
+    """
+    (ClAlg, blade masks, blade factors) in the order of the basis for reading the coefficients of
+    dense elements directly; None if the blades are not bitmask blades of a single ClAlg
+    """
+    if blade_index is None:
+        return None
+
+    bases = sorted(blade_index, key=lambda basis: blade_index[basis][0])
+    algs = {getattr(basis, "alg", None) for basis in bases if getattr(basis, "mask", 0) != 0}
+
+    if len(algs) != 1 or None in algs or not all(hasattr(basis, "mask") for basis in bases):
+        return None
+
+    masks = np.array([basis.mask for basis in bases])
+    factors = np.array([blade_index[basis][1] for basis in bases])
+
+    return algs.pop(), masks, factors
+
+
+def _blade_index(basis_vecs) -> dict | None:
+    """
+    basis -> (index, factor) if each element is a single blade
+    """
+    result = {}
+
+    for i, vec in enumerate(basis_vecs):
+        terms = list(vec.basis_factor)
+
+        if len(terms) != 1 or terms[0][0] in result:
+            return None
+
+        basis, factor = terms[0]
+        result[basis] = (i, factor)
 
-    return ClMat(vec_mats=mats, vec_cls=bases)
+    return result
@@ -1,9 +1,9 @@
-import functools
-import operator
 from typing import Sequence, TypeVar
 
 import numpy as np
 
+from algebrant.algebra.algebra import Algebra
+
 
 def random_coef(dim, *, complex=True, int_only=False, min_int=2, max_int=1000) -> np.ndarray:
     match complex, int_only:
@@ -37,19 +37,13 @@ def random_from_basis(
     min_int=2,
     max_int=1000,
 ) -> AlgebraType:
-    return functools.reduce(
-        operator.add,
-        [
-            coef * b
-            for coef, b in zip(
-                bases,
-                random_coef(
-                    len(bases),
-                    complex=complex,
-                    int_only=int_only,
-                    min_int=min_int,
-                    max_int=max_int,
-                ),
-            )
-        ],
+    return Algebra.linear_combination(
+        random_coef(
+            len(bases),
+            complex=complex,
+            int_only=int_only,
+            min_int=min_int,
+            max_int=max_int,
+        ),
+        bases,
     )
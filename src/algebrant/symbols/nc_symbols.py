@@ -1,18 +1,23 @@
 import dataclasses
 import itertools
 from dataclasses import dataclass, field
-from typing import Self, TypeVar
+from typing import Any, Self, TypeVar
 
 from algebrant.algebra.basis import BasisSortKey
+from algebrant.algebra.interning import Interned
 from algebrant.repr_printer import PlainReprMixin
 
 Symbol = TypeVar("Symbol")
 
 
-@dataclass(unsafe_hash=True, repr=False)  # TODO: not dataclass?
-class NCSymbols[Symbol](PlainReprMixin):
+@dataclass(eq=False, repr=False)  # TODO: not dataclass?
+class NCSymbols[Symbol](Interned, PlainReprMixin):
     symbols: tuple[Symbol, ...] = field(default_factory=tuple)
 
+    @classmethod
+    def _intern_key(cls, symbols: tuple[Symbol, ...] = ()) -> Any:
+        return tuple(symbols)
+
     @classmethod
     def unity(cls) -> Self:
         return cls(tuple())
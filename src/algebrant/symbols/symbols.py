@@ -4,21 +4,39 @@ from fractions import Fraction
 from typing import Any, Self
 
 from algebrant.algebra.basis import BasisSortKey
+from algebrant.algebra.interning import Interned
 from algebrant.repr_printer import PlainReprMixin
 from algebrant.symbols.symbol import Symbol
+from algebrant.utils import calculated_field
 
 # SymbolType = TypeVar("SymbolType", bound=Symbol)
 
 
-@dataclass(repr=False)
-class Symbols[SymbolType: Symbol](PlainReprMixin):
+@dataclass(eq=False, repr=False)
+class Symbols[SymbolType: Symbol](Interned, PlainReprMixin):
     symbol_powers: dict[SymbolType, Any]  # TODO: int?
+    sort_key: BasisSortKey = calculated_field()
 
     def __post_init__(self) -> None:
-        if any(x == 0 for x in self.symbol_powers.values()):
-            self.symbol_powers = {
-                symbol: power for symbol, power in self.symbol_powers.items() if power != 0
-            }
+        # own copy since the instance is shared
+        self.symbol_powers = {
+            symbol: power for symbol, power in dict(self.symbol_powers).items() if power != 0
+        }
+
+        degree = sum(abs(power) for _sym, power in self.symbol_powers.items())
+        sorted_symbols = sorted(self.symbol_powers.keys(), key=lambda x: (x.name, x.is_conjugate))
+
+        self.sort_key = (
+            (degree, len(self.symbol_powers))
+            + tuple(self.symbol_powers[sym] for sym in sorted_symbols),
+            tuple(sym.name for sym in sorted_symbols),
+        )
+
+    @classmethod
+    def _intern_key(cls, symbol_powers: dict[SymbolType, Any]) -> Any:
+        return frozenset(
+            (symbol, power) for symbol, power in dict(symbol_powers).items() if power != 0
+        )
 
     @classmethod
     def unity(cls) -> Self:
@@ -34,23 +52,6 @@ class Symbols[SymbolType: Symbol](PlainReprMixin):
             symbol_powers={sym.conjugate(): cnt for sym, cnt in self.symbol_powers.items()},
         )
 
-    def __hash__(self) -> int:
-        """
-        dict is unhashable
-        """
-        return hash(frozenset(self.symbol_powers.items()))
-
-    @property
-    def sort_key(self) -> BasisSortKey:
-        degree = sum(abs(power) for _sym, power in self.symbol_powers.items())
-        sorted_symbols = sorted(self.symbol_powers.keys(), key=lambda x: (x.name, x.is_conjugate))
-
-        return (
-            (degree, len(self.symbol_powers))
-            + tuple(self.symbol_powers[sym] for sym in sorted_symbols),
-            tuple(sym.name for sym in sorted_symbols),
-        )
-
     def _repr_pretty_(self, printer, cycle):
         if cycle:
             printer.text("...")
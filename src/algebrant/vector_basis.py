@@ -2,6 +2,8 @@ from typing import Counter
 
 import numpy as np
 
+from algebrant.algebra.algebra import Algebra
+
 # from IPython import get_ipython
 
 """
@@ -55,10 +57,7 @@ class VecBasis:
         self.inv_gram_matrix = np.linalg.inv(self.gram_matrix)
 
         self.dual_basis_vecs = [  # currently used only for .trace()
-            sum(
-                coef * vec
-                for coef, vec in zip(self.inv_gram_matrix[i, :], self.basis_vecs, strict=True)
-            )
+            Algebra.linear_combination(self.inv_gram_matrix[i, :], self.basis_vecs)
             for i in range(self.dim)
         ]
 
@@ -135,7 +134,7 @@ class VecBasis:
                 f"Number of coefficients {len(coefs)} does not equal dimension of basis {len(self.basis_vecs)}"
             )
 
-        return sum(coef * b for coef, b in zip(coefs, self.basis_vecs, strict=True))
+        return Algebra.linear_combination(coefs, self.basis_vecs)
 
     def to_matrix(self, op):
         """
@@ -154,7 +153,7 @@ class VecBasis:
         trace
         such that V.trace(lambda x: m @ x) == np.trace(m)
         """
-        return sum(
+        return Algebra.sum(
             self._dot(b_d, op(b))
             for b_d, b in zip(self.dual_basis_vecs, self.basis_vecs, strict=True)
         )
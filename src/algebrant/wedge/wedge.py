@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Iterable, Protocol, Self
 
 from algebrant.algebra.basis import BasisSortKey
+from algebrant.algebra.interning import Interned
 from algebrant.graded.graded_symbol import GradedSymbol
 from algebrant.repr_printer import PlainReprMixin
 from algebrant.utils import all_not_none, calculated_field
@@ -78,8 +79,8 @@ class WedgeableSymbol(PlainReprMixin):
 BasisFactor = tuple["Wedge", Any]
 
 
-@dataclass(unsafe_hash=True, repr=False)
-class Wedge(PlainReprMixin):
+@dataclass(eq=False, repr=False)
+class Wedge(Interned, PlainReprMixin):
     elems: tuple[Wedgeable, ...] = tuple()
     grade: int = calculated_field()
     is_unity: bool = calculated_field()
@@ -118,6 +119,10 @@ class Wedge(PlainReprMixin):
         else:
             self.sort_key = ((1, len(self.elems)), names)
 
+    @classmethod
+    def _intern_key(cls, elems: tuple[Wedgeable, ...] = ()) -> Any:
+        return tuple(elems)
+
     @classmethod
     def xor(
         cls, basis_factor1: BasisFactor, basis_factor2: BasisFactor
@@ -6,7 +6,7 @@ from typing import Any, Self, Sequence, Type, TypeVar
 
 import colorful as cf
 from algebrant.algebra.algebra_utils import MultiplicationMixin
-from algebrant.algebra.algebra_data import AlgebraData, algebra_mul
+from algebrant.algebra.algebra_data import MUL_CACHE, AlgebraData, algebra_mul
 from algebrant.graded.graded_algebra import GradedAlgebra, commute
 from algebrant.graded.graded_symbol import GradedSymbol
 from algebrant.operation_prios import WEDGE_CONTR_OP_PRIO
@@ -27,7 +27,7 @@ def _(basis1: Wedge, factor1: Any, basis2: Wedge, factor2: Any) -> AlgebraData[W
     for basis1, factor2 in commute(basis1, factor2):
         if len(basis1.elems) == 1:
             if basis1.elems[0].grade == 1:
-                result += AlgebraData.make_single(Wedge(), factor1 * factor2) * (
+                result += AlgebraData.make_single(Wedge(), factor2) * (
                     _vector_contr(Wedge, basis1.elems[0], basis2)
                     + _make_wedge(Wedge, basis1, basis2)
                 )
@@ -50,9 +50,13 @@ def _(basis1: Wedge, factor1: Any, basis2: Wedge, factor2: Any) -> AlgebraData[W
 
         basis_result = (vec * (remaining * other) + remaining.i * (vec * other)).basis_factor
 
-        result += AlgebraData.make_single(Wedge(), factor2) * basis_result
+        result += AlgebraData.make_single(Wedge(), 0.5 * factor2) * basis_result
 
-    return result.left_mul(0.5 * factor1)
+    return result.left_mul(factor1)
+
+
+# factors must be scalars in WedgeAlgebra (see WedgeAlgebra._wedge), which the cache does not check
+MUL_CACHE.exclude(Wedge)
 
 
 def permutation_parity(perm: Sequence[WedgeableSortKey]) -> int:
@@ -0,0 +1,29 @@
+import pytest
+
+from algebrant.algebra.algebra import Algebra
+from algebrant.clifford.clalg import ClAlg
+from algebrant.symbols.symbol_algebra import Sym
+
+
+def test_sum_merges_elements_and_numbers():
+    alg = ClAlg.from_pq(3, 0)
+    e1, e2, e3 = alg.get_bases(1)
+
+    assert Algebra.sum([e1, 2, e2, e1, 0.5]) == 2.5 + 2 * e1 + e2
+    assert Algebra.sum([e1, Sym("a")]) == e1 + Sym("a")
+    assert Algebra.sum([e3]) == e3
+
+
+def test_linear_combination():
+    alg = ClAlg.from_pq(3, 0)
+    e1, e2, e3 = alg.get_bases(1)
+
+    assert Algebra.linear_combination([1, 0, -2], [e1, e2, e3]) == e1 - 2 * e3
+    assert Algebra.linear_combination([Sym("a"), 2], [e1, e2]) == Sym("a") * e1 + 2 * e2
+
+
+def test_linear_combination_rejects_length_mismatch():
+    alg = ClAlg.from_pq(3, 0)
+
+    with pytest.raises(ValueError):
+        Algebra.linear_combination([1, 2], alg.get_bases(1))
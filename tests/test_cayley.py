@@ -0,0 +1,28 @@
+import pytest
+
+from algebrant.clifford.clalg import ClAlg
+
+
+@pytest.mark.parametrize("p, q", [(3, 0), (2, 1), (1, 3)])
+def test_table_matches_tuple_blade_products(p, q):
+    table = ClAlg.from_pq(p, q, bitmask=True).cayley
+    tuple_alg = ClAlg.from_pq(p, q)
+
+    for mask1 in range(table.size):
+        for mask2 in range(table.size):
+            expected = tuple_alg.blade_of(mask1) * tuple_alg.blade_of(mask2)
+            index = int(table.index[mask1, mask2])
+
+            assert expected == table.sign_rows[mask1][mask2] * tuple_alg.blade_of(index)
+
+
+def test_bitmask_products_use_table_entries():
+    alg = ClAlg.from_pq(2, 1, bitmask=True)
+    table = alg.cayley
+
+    for mask1 in range(table.size):
+        for mask2 in range(table.size):
+            ((basis, factor),) = (alg.blade_of(mask1) * alg.blade_of(mask2)).basis_factor
+
+            assert basis is table.blades[mask1 ^ mask2]
+            assert factor == table.sign_rows[mask1][mask2]
@@ -0,0 +1,43 @@
+import random
+
+import numpy as np
+import pytest
+
+from algebrant.clifford.cl_exp_log import _coef_norm
+from algebrant.clifford.clalg import ClAlg
+
+
+def random_rotor(alg, seed, scale):
+    np.random.seed(seed)
+    random.seed(seed)
+    return (alg.rand(2) * scale).exp()
+
+
+@pytest.mark.parametrize("seed", [1, 39, 81])
+def test_exp_log_rotor_with_negative_scalar(seed):
+    rotor = random_rotor(ClAlg.from_pq(6), seed, 0.5)
+
+    assert rotor.scalar < 0
+    assert _coef_norm(rotor.log().exp() - rotor) < 1e-7
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_exp_log_and_sqrt_rotor(seed):
+    rotor = random_rotor(ClAlg.from_pq(6), seed, 0.5)
+
+    assert _coef_norm(rotor.log().exp() - rotor) < 1e-7
+    assert _coef_norm(rotor.sqrt() * rotor.sqrt() - rotor) < 1e-7
+
+
+@pytest.mark.parametrize("seed", [30, 34])
+def test_log_rotor_with_small_plane_angle(seed):
+    rotor = random_rotor(ClAlg.from_pq(6, bitmask=True), seed, 0.3)
+
+    assert _coef_norm(rotor.log().exp() - rotor) < 1e-7
+
+
+def test_log_rotor_with_nearly_degenerate_split():
+    e1, e2, e3, e4, e5, e6 = ClAlg.from_pq(6, bitmask=True).get_bases(1)
+    bivector = 1.35 * e1 * e2 + 0.66 * e3 * e4 + 7e-4 * e5 * e6
+
+    assert _coef_norm(bivector.exp().log() - bivector) < 1e-7
@@ -0,0 +1,34 @@
+import pytest
+
+from algebrant.clifford.cl_inverse import cl_inverse
+from algebrant.clifford.clalg import ClAlg
+
+
+@pytest.mark.parametrize(
+    "p, q, path, products",
+    [
+        (3, 0, "cl*m3", 2),
+        (2, 3, "cl*m3*m14", 4),
+        (6, 0, "power-sums(N=8)", 4),
+        (3, 3, "power-sums(N=8)", 4),
+        (4, 3, "faddeev-leverrier/center(N=8)", 9),
+        (4, 4, "power-sums(N=16)", 8),
+    ],
+)
+def test_inverse_paths(p, q, path, products):
+    alg = ClAlg.from_pq(p, q, bitmask=True)
+    elem = alg.rand()
+
+    inverse, report = cl_inverse(elem)
+
+    assert (report.path, report.dimension, report.products) == (path, p + q, products)
+    assert abs(elem * inverse - 1) < 1e-8
+    assert abs(inverse * elem - 1) < 1e-8
+
+
+def test_singular_element_raises():
+    alg = ClAlg.from_pq(6, 0, bitmask=True)
+    e1, *_rest, e6 = alg.get_bases(1)
+
+    with pytest.raises(ZeroDivisionError):
+        cl_inverse((1 + e1) * (e6 + alg.I))
@@ -0,0 +1,32 @@
+from algebrant.clifford.clalg import ClAlg
+from algebrant.clifford.clifford_algebra import Cl_vec
+from algebrant.mv_mat import clalg_mat_conv, make_cl_vec_basis_from_dim
+
+
+def test_same_signature_same_algebra():
+    assert ClAlg.from_pq(3, 1) is ClAlg.from_pq(3, 1)
+    assert ClAlg.from_dim(4) is ClAlg.from_dim(4)
+    assert ClAlg.from_pq(3, 1, bitmask=True) is ClAlg.from_pq(3, 1, bitmask=True)
+
+    assert ClAlg.from_pq(3, 1) is not ClAlg.from_pq(3, 1, bitmask=True)
+    assert ClAlg.from_pq(3, 1) is not ClAlg.from_pq(1, 3)
+    assert ClAlg.from_dim(4) is not ClAlg.from_dim(4, start_idx=0)
+
+
+def test_blades_are_built_once():
+    alg = ClAlg.from_pq(3, 0)
+
+    assert alg.get_bases(1)[0] is alg.get_bases(1)[0]
+    assert alg.blades[3] is alg.blade_of(alg.blade_masks[3])
+    assert alg.one is alg.one and alg.I is alg.I
+    assert alg.blade_position[alg.blade_masks[5]] == 5
+
+
+def test_constructors_share_through_the_registry():
+    alg = ClAlg.from_dim(2)
+
+    assert Cl_vec(1, 2) is Cl_vec(1, 2)
+    assert Cl_vec(2, 1, alg=alg) == -alg.blade_of(3)
+    assert clalg_mat_conv(alg) is clalg_mat_conv(ClAlg.from_dim(2))
+    assert make_cl_vec_basis_from_dim(2) is make_cl_vec_basis_from_dim(2)
+    assert alg.shared("key", object) is alg.shared("key", object)
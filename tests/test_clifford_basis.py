@@ -0,0 +1,36 @@
+import gc
+
+from algebrant.clifford import clifford_basis
+from algebrant.clifford.clifford_basis import CliffordBasis
+from algebrant.clifford.clifford_basis_vec import CliffordBasisVec
+
+
+def test_vector_bits_are_reused_after_bases_are_freed():
+    kept = CliffordBasis((CliffordBasisVec("kept_a", 1), CliffordBasisVec("kept_b", 1)))
+    gc.collect()
+    num_bits = len(clifford_basis._VEC_BITS)
+
+    for i in range(100):
+        basis = CliffordBasis((CliffordBasisVec(f"tmp{i}_a", 1), CliffordBasisVec(f"tmp{i}_b", 1)))
+        assert basis.mask.bit_count() == 2 and not basis.mask & kept.mask
+        del basis
+
+    gc.collect()
+
+    assert len(clifford_basis._VEC_BITS) == num_bits
+    assert CliffordBasisVec("kept_a", 1) in clifford_basis._VEC_BITS
+
+
+def test_equal_vectors_share_a_bit():
+    vec1 = CliffordBasisVec("same", 1)
+    vec2 = CliffordBasisVec("same", 1)
+
+    basis1 = CliffordBasis((vec1,))
+    del basis1
+    gc.collect()
+
+    basis = CliffordBasis((vec2,))
+    other = CliffordBasis((vec1, CliffordBasisVec("zz_other", 1)))
+
+    assert basis.mask & other.mask == basis.mask
+    assert (basis.mask ^ other.mask).bit_count() == 1
@@ -0,0 +1,73 @@
+import pytest
+
+from algebrant.clifford import clifford_algebra
+from algebrant.clifford.clalg import ClAlg
+from algebrant.symbols.symbol_algebra import Sym
+
+
+def graded_reference(x, y, out_grade):
+    """
+    sum over grades r, s of <x_r y_s>_out_grade(r, s) from full products
+    """
+    result = 0
+    for grade1, part1 in x.split_into_grades().items():
+        for grade2, part2 in y.split_into_grades().items():
+            grade = out_grade(grade1, grade2)
+            if grade >= 0:
+                result = result + (part1 * part2).take_grades(grade)
+
+    return result
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}])
+def test_kernels_match_grade_projections(kind):
+    alg = ClAlg.from_pq(3, 2, **kind)
+
+    for _ in range(3):
+        x, y = alg.rand(int_only=True, max_int=9), alg.rand(int_only=True, max_int=9)
+
+        assert (x ^ y) == graded_reference(x, y, lambda r, s: r + s)
+        assert (x << y) == graded_reference(x, y, lambda r, s: s - r)
+        assert (x >> y) == graded_reference(x, y, lambda r, s: r - s)
+
+
+def test_kernels_with_symbolic_factors():
+    e1, e2, e3 = ClAlg.from_pq(3, 0).get_bases(1)
+    a, b = Sym("a"), Sym("b")
+    x = a * e1 + b * e2
+    y = e1 * e2 + b * e2 * e3
+
+    assert (x ^ y) == a * b * e1 * e2 * e3
+    assert (x << y) == graded_reference(x, y, lambda r, s: s - r)
+    assert (y >> x) == graded_reference(y, x, lambda r, s: r - s)
+    assert (x ^ x) == 0
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}])
+def test_grade_selective_products_match_projections(kind):
+    alg = ClAlg.from_pq(3, 1, **kind)
+    x, y = alg.rand(int_only=True, max_int=9), alg.rand(int_only=True, max_int=9)
+
+    assert x.product(y) == x * y
+    assert x.product(y, grades=2) == (x * y).take_grades(2)
+    assert x.product(y, grades=(0, 3)) == (x * y).take_grades(0, 3)
+    assert x.product(y, grades=lambda grade: grade % 2 == 1) == (x * y).take_grades(1, 3)
+    assert x.product(3, grades=1) == (3 * x).take_grades(1)
+    assert x.scalar_product(y) == (x * y).scalar
+    assert x.norm_sqr == (x * x.r).scalar
+
+
+def test_scalar_products_only_multiply_equal_blades(monkeypatch):
+    alg = ClAlg.from_pq(3, 0)
+    x, y = alg.rand(int_only=True), alg.rand(int_only=True)
+    calls = []
+
+    def counting_cache(*args):
+        calls.append(args)
+        return clifford_algebra.algebra_mul(*args)
+
+    monkeypatch.setattr(clifford_algebra, "MUL_CACHE", counting_cache)
+
+    assert len(x.basis_factor) == len(y.basis_factor) == 8
+    assert x.scalar_product(y) == (x * y).scalar
+    assert len(calls) == 8  # instead of 8 * 8 for the full product
@@ -0,0 +1,33 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from algebrant.clifford.clalg import ClAlg
+
+
+@pytest.mark.parametrize("bitmask", [False, True])
+def test_fraction_domain_stays_exact(bitmask):
+    alg = ClAlg.from_pq(2, 1, bitmask=bitmask, dtype="fraction")
+    e1, e2, _e3 = alg.get_bases(1)
+
+    assert ((e1 / 10**6) ** 2).scalar != 0  # == 0 compares with a tolerance
+
+    small = (e1 * Fraction(1, 10**6)) ** 2
+    assert abs(small.scalar) == Fraction(1, 10**12)
+    assert all(
+        isinstance(factor, Fraction)
+        for _basis, factor in ((e1 + e2) * (e1 - e2) * Fraction(1, 3)).basis_factor
+    )
+
+
+@pytest.mark.parametrize("bitmask", [False, True])
+def test_float32_domain_prunes_at_its_resolution(bitmask):
+    alg = ClAlg.from_pq(3, 0, bitmask=bitmask, dtype="float32")
+    e1, e2, _e3 = alg.get_bases(1)
+
+    x = e1 + e2 * 3e-8  # below the resolution of float32
+
+    assert alg.bitmask
+    assert alg.zero_pruning.abs_tol >= np.finfo(np.float32).eps
+    assert list(x.basis_factor) == list(e1.basis_factor)
@@ -0,0 +1,43 @@
+import pytest
+
+from algebrant.clifford.clalg import ClAlg
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}])
+def test_grade_queries_match_the_terms(kind):
+    alg = ClAlg.from_pq(4, 0, **kind)
+    x = alg.rand(0, 1, 3, int_only=True)
+
+    by_grade = {}
+    for basis, factor in x.basis_factor:
+        by_grade.setdefault(basis.grade, {})[basis] = factor
+
+    assert x.grades == frozenset(by_grade)
+    assert x.scalar == sum(by_grade[0].values())
+    assert {
+        grade: elem.basis_factor.basis_factor for grade, elem in x.split_into_grades().items()
+    } == by_grade
+    assert x.take_grades(1, 3).basis_factor.basis_factor == {**by_grade[1], **by_grade[3]}
+    assert x.take_grades(lambda grade: grade % 2 == 0).grades == {0}
+    assert x.take_grades(2) == 0
+
+
+def test_index_is_built_once():
+    x = ClAlg.from_pq(3, 0).rand()
+
+    assert x.grade_index is x.grade_index
+
+
+def test_in_place_updates_keep_both_indexes():
+    e1, e2, e3 = ClAlg.from_pq(3, 0).get_bases(1)
+    x = 1 + e1
+    y = x
+
+    assert y.grades == {0, 1}
+
+    x += e2 * e3
+    x -= 1
+
+    assert x.grades == {1, 2}
+    assert y.grades == {0, 1}
+    assert y.take_grades(1) == e1
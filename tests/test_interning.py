@@ -0,0 +1,61 @@
+import copy
+import gc
+import pickle
+
+from algebrant.clifford.clifford_basis import CliffordBasis
+from algebrant.clifford.clifford_basis_vec import CliffordBasisVec
+from algebrant.graded.graded_symbol import GradedSymbol
+from algebrant.graded.graded_symbols import GradedSymbols
+from algebrant.symbols.nc_symbols import NCSymbols
+from algebrant.symbols.symbol import Symbol
+from algebrant.symbols.symbol_algebra import Sym
+from algebrant.symbols.symbols import Symbols
+
+
+def test_equal_bases_are_identical():
+    e1, e2 = CliffordBasisVec("e1", 1), CliffordBasisVec("e2", 1)
+    a, b = Symbol("a"), Symbol("b")
+
+    assert CliffordBasis((e1, e2)) is CliffordBasis((CliffordBasisVec("e1", 1), e2))
+    assert Symbols({a: 1, b: 2}) is Symbols({b: 2, a: 1, Symbol("c"): 0})
+    assert NCSymbols((a, b)) is NCSymbols((a, b)) and NCSymbols((a, b)) is not NCSymbols((b, a))
+
+
+def test_subclasses_are_interned_separately():
+    x = GradedSymbol("x", base_grade=1)
+
+    assert type(NCSymbols((x,))) is NCSymbols
+    assert type(GradedSymbols((x,))) is GradedSymbols
+    assert GradedSymbols((x,)) is GradedSymbols((x,))
+
+
+def test_copies_and_pickles_are_the_interned_instance():
+    basis = CliffordBasis((CliffordBasisVec("e1", 1), CliffordBasisVec("e3", -1)))
+
+    assert copy.copy(Symbols({Symbol("a"): 2})) is Symbols({Symbol("a"): 2})
+    assert copy.deepcopy(basis) is basis
+    assert pickle.loads(pickle.dumps(basis)) is basis
+
+
+def test_products_share_bases():
+    a, b = Sym("a"), Sym("b")
+
+    ((basis1, _),) = (a * b).basis_factor
+    ((basis2, _),) = (b * a).basis_factor
+
+    assert basis1 is basis2
+    assert basis1.sort_key is basis2.sort_key
+
+
+def test_unused_bases_are_freed():
+    instances = CliffordBasis._instances
+    gc.collect()
+    num_instances = len(instances)
+
+    basis = CliffordBasis((CliffordBasisVec("interned_tmp", 1),))
+    assert len(instances) == num_instances + 1
+
+    del basis
+    gc.collect()
+
+    assert len(instances) == num_instances
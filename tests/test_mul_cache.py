@@ -0,0 +1,37 @@
+import pytest
+
+from algebrant.algebra.algebra_data import MUL_CACHE
+from algebrant.clifford.clalg import ClAlg
+from algebrant.wedge.wedge import Wedge
+from algebrant.wedge.wedge_algebra import MVw
+
+
+@pytest.fixture
+def mul_cache():
+    MUL_CACHE.clear()
+    MUL_CACHE.resize(1000)
+    yield MUL_CACHE
+    MUL_CACHE.resize(0)
+    MUL_CACHE.clear()
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}])
+def test_cached_products_are_equal(mul_cache, kind):
+    alg = ClAlg.from_pq(3, 1, **kind)
+    x, y = alg.rand(), alg.rand()
+
+    cached = [x * y, x * y]
+    mul_cache.resize(0)
+
+    assert cached[0] == x * y and cached[1] == x * y
+    assert mul_cache.stats.hits > 0
+
+
+def test_wedge_products_are_not_cached(mul_cache):
+    a, b, c = MVw("a"), MVw("b"), MVw("c")
+
+    result = repr(a * b * c)
+
+    assert not any(isinstance(basis1, Wedge) for basis1, _basis2 in mul_cache._terms)
+    mul_cache.resize(0)
+    assert repr(a * b * c) == result
@@ -0,0 +1,18 @@
+import pytest
+
+from algebrant.clifford.clalg import ClAlg
+from algebrant.clifford.multivector_array import MultivectorArray
+
+
+@pytest.mark.parametrize("bitmask", [False, True])
+def test_list_round_trip(bitmask):
+    alg = ClAlg.from_pq(3, bitmask=bitmask)
+    elems = [alg.rand(), alg.rand(1, 2), alg.one]
+
+    arr = MultivectorArray.from_list(elems, alg=alg)
+
+    for elem, result in zip(elems, arr.to_list()):
+        assert result == elem
+        assert repr(result)  # sort keys of the blades are valid
+
+    assert arr[0] == elems[0]
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from algebrant.clifford.clalg import ClAlg
+from algebrant.mv_mat import (
+    ClMatRep,
+    _make_mat_rep,
+    _mat_rep_filename,
+    cl_mat_rep,
+    clalg_mat_conv,
+    make_cl_blades,
+)
+
+
+def test_cl_blades_of_bitmask_alg():
+    alg = ClAlg.from_pq(2, 1, bitmask=True)
+
+    blades = make_cl_blades(alg.get_bases(1))
+
+    assert [blade.grades for blade in blades] == [{0}, {1}, {1}, {1}, {2}, {2}, {2}, {3}]
+    assert blades[-1] == alg.I
+    assert all(blade**2 in (1, -1) for blade in blades)
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}, {"dense": True}])
+@pytest.mark.parametrize("p, q", [(2, 0), (2, 1), (1, 3)])
+def test_clalg_mat_conv_round_trip(p, q, kind):
+    alg = ClAlg.from_pq(p, q, **kind)
+    conv = clalg_mat_conv(alg)
+    x, y = alg.rand(), alg.rand()
+
+    assert abs(conv.to_cl(conv.to_mat(x)) - x) < 1e-9
+    assert np.allclose(conv.to_mat(x * y), conv.to_mat(x) @ conv.to_mat(y))
+    assert abs(conv.to_cl(conv.to_mat(alg.one)) - alg.one) < 1e-9
+
+
+def test_dense_coefs_are_gathered_by_mask():
+    alg = ClAlg.from_pq(2, 1, dense=True)
+    conv = clalg_mat_conv(alg)
+    x = alg.rand()
+
+    factors = dict(x.basis_factor)
+    expected = [
+        factors.get(basis, 0) / blade_factor
+        for blade in conv.cl_basis_vecs
+        for basis, blade_factor in blade.basis_factor
+    ]
+
+    assert conv._dense_gather is not None
+    assert np.allclose(conv.cl_coefs(x), expected)
+
+
+@pytest.mark.parametrize("corrupt", ["missing", "swapped"])
+def test_cached_mat_rep_is_validated(tmp_path, corrupt):
+    sqrs = (-1, -1, 1, -1)  # not used elsewhere, so not in the in-memory cache
+    rep = _make_mat_rep(sqrs)
+    blade_mats = list(rep.blade_mats)
+
+    if corrupt == "missing":
+        blade_mats.pop()
+    else:
+        blade_mats[1], blade_mats[2] = blade_mats[2], blade_mats[1]
+
+    path = tmp_path / _mat_rep_filename(sqrs)
+    ClMatRep(sqrs, rep.vec_mats, tuple(blade_mats)).save(path)
+
+    with pytest.raises(ValueError, match="Cache file"):
+        cl_mat_rep(sqrs, cache_dir=tmp_path)
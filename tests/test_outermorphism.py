@@ -0,0 +1,57 @@
+import math
+
+import numpy as np
+import pytest
+
+from algebrant.clifford.clalg import ClAlg
+
+
+def rotor(alg):
+    e1, e2, e3 = alg.get_bases(1)[:3]
+    return (1 + e1 * e2) / math.sqrt(2) * (math.cos(0.3) + math.sin(0.3) * e2 * e3)
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}])
+def test_matches_the_sandwich(kind):
+    alg = ClAlg.from_pq(3, 0, **kind)
+    r = rotor(alg)
+    om = r.outermorphism(alg.get_bases(1))
+
+    for _ in range(3):
+        x = alg.rand()
+        assert abs(om(x) - r * x * r.r) < 1e-9
+
+
+def test_vector_sets_are_one_matmul():
+    alg = ClAlg.from_pq(3, 0, bitmask=True)
+    vecs = alg.get_bases(1)
+    r = rotor(alg)
+    om = r.outermorphism()
+
+    coefs = np.random.default_rng(0).normal(size=(5, 3))
+    images = om.apply_vecs(coefs)
+
+    for coef, image in zip(coefs, images, strict=True):
+        x = alg.one.linear_combination(coef, vecs)
+        expected = r * x * r.r
+        assert np.allclose(image, [(expected << vec).scalar for vec in vecs])
+
+
+def test_blocks_are_compound_matrices():
+    alg = ClAlg.from_pq(4, 0, bitmask=True)
+    om = rotor(alg).outermorphism()
+
+    assert [len(block) for block in om.blocks] == [math.comb(4, k) for k in range(5)]
+    assert np.isclose(om.blocks[4][0, 0], np.linalg.det(om.matrix))
+    assert om.full_matrix.shape == (16, 16)
+
+
+def test_non_versors_raise():
+    alg = ClAlg.from_pq(3, 0)
+    e1, e2, _e3 = alg.get_bases(1)
+
+    with pytest.raises(ValueError):
+        (2 + e1).outermorphism(alg.get_bases(1))
+
+    with pytest.raises(ValueError):
+        (1 + e1 * e2).outermorphism()
@@ -0,0 +1,86 @@
+import pytest
+
+from algebrant.clifford.clalg import ClAlg
+from algebrant.clifford.clifford_algebra import Cl_vec
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}])
+def test_cached_elements_are_not_mutated(kind):
+    alg = ClAlg.from_pq(3, 0, **kind)
+    e1, e2, _e3 = alg.get_bases(1)
+
+    acc = alg.one
+    acc += e1
+    acc -= e2
+    acc *= 2
+
+    assert alg.one == 1
+    assert alg.blade_of(1) == e1
+    assert abs(acc - 2 * (1 + e1 - e2)) < 1e-12
+
+
+def test_aliases_keep_their_value():
+    e1, e2 = Cl_vec(1), Cl_vec(2)
+
+    x = e1 + e2
+    y = x
+    elems = [x]
+    x += e1
+
+    assert y == e1 + e2 and elems[0] == e1 + e2
+    assert x == 2 * e1 + e2
+
+    y -= e2  # older version is restored and updated
+
+    assert y == e1
+    assert x == 2 * e1 + e2
+    assert elems[0] == e1 + e2
+
+
+def test_elements_in_sets_are_found():
+    e1, e2 = Cl_vec(1), Cl_vec(2)
+
+    x = e1 + e2
+    elems = {x}
+    x += e1
+
+    assert e1 + e2 in elems
+    assert x not in elems
+    assert hash(next(iter(elems))) == hash(e1 + e2)
+
+
+def test_results_of_plain_returns_are_not_mutated():
+    alg = ClAlg.from_pq(2, 0)
+    e1, e2 = alg.get_bases(1)
+    x = e1 + e2
+
+    for result in [x + 0, 1 * x, x * 1, sum([x]), x**1, x.powers(2)[0]]:
+        result += e1
+        assert x == e1 + e2
+
+
+def test_accumulation_matches_sum():
+    alg = ClAlg.from_pq(3, 0)
+    xs = [alg.rand() for _ in range(20)]
+
+    acc = 0
+    for x in xs:
+        acc += x
+
+    assert abs(acc - sum(xs[1:], xs[0])) < 1e-9
+    assert abs(xs[0] - (acc - sum(xs[1:], 0))) < 1e-9
+
+
+def test_claimed_data_is_copied():
+    elem = Cl_vec(1)
+    data = elem.basis_factor
+    data += Cl_vec(2).basis_factor
+
+    assert data is not elem.basis_factor
+    assert elem == Cl_vec(1)
+
+    same = data
+    data += Cl_vec(3).basis_factor
+
+    assert data is same
+    assert len(data.basis_factor) == 3
@@ -0,0 +1,65 @@
+import functools
+import operator
+
+import pytest
+
+from algebrant.algebra.algebra import Algebra
+from algebrant.clifford.clalg import ClAlg
+from algebrant.symbols.symbol_algebra import Sym
+
+
+@pytest.fixture
+def count_products(monkeypatch):
+    counts = {"products": 0}
+    mul = Algebra.__mul__
+
+    def counting_mul(self, other):
+        if isinstance(other, Algebra):
+            counts["products"] += 1
+        return mul(self, other)
+
+    monkeypatch.setattr(Algebra, "__mul__", counting_mul)
+    return counts
+
+
+def test_powers_match_repeated_products():
+    alg = ClAlg.from_pq(3, 1)
+    x = alg.rand(int_only=True, max_int=5)
+    s = Sym("a") + 2 * Sym("b")
+
+    for elem in [x, s]:
+        for n in range(1, 10):
+            assert elem**n == functools.reduce(operator.mul, [elem] * n)
+
+        assert elem**0 == 1
+        assert elem.powers(5) == [elem**n for n in range(1, 6)]
+
+
+def test_squaring_needs_logarithmic_products(count_products):
+    x = Sym("a") + Sym("b")
+
+    x**16
+    assert count_products["products"] == 4
+
+    count_products["products"] = 0
+    x**15
+    assert count_products["products"] == 6
+
+
+def test_negative_powers_invert():
+    alg = ClAlg.from_pq(3, 0)
+    e1, e2, e3 = alg.get_bases(1)
+    x = 2 + e1 + e2 * e3
+
+    assert abs(x**-3 * x**3 - 1) < 1e-9
+    assert abs(x**-1 - 1 / x) < 1e-12
+
+
+def test_invalid_powers_raise():
+    x = Sym("a")
+
+    with pytest.raises(ValueError):
+        x**0.5
+
+    with pytest.raises(ValueError):
+        x.powers(0)
@@ -0,0 +1,45 @@
+import math
+
+import pytest
+
+from algebrant.clifford.clalg import ClAlg
+from algebrant.symbols.symbol_algebra import Sym
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}, {"dense": True}])
+def test_sandwich_matches_the_products(kind):
+    alg = ClAlg.from_pq(3, 1, **kind)
+    e1, e2, e3, e4 = alg.get_bases(1)
+
+    for r in [e1 + 2 * e3, (1 + e1 * e2) * (3 + e3 * e4), alg.rand()]:
+        for x in [e2 + e4, alg.rand(1, 2), alg.rand()]:
+            assert abs(r.sandwich(x, grades=range(5)) - r * x * r.r) < 1e-9
+            assert abs(r.twisted_sandwich(x, grades=range(5)) - r.i * x * r.r) < 1e-9
+
+
+@pytest.mark.parametrize("kind", [{}, {"bitmask": True}])
+def test_versors_keep_exactly_the_grades(kind):
+    alg = ClAlg.from_pq(3, 0, **kind)
+    e1, e2, _e3 = alg.get_bases(1)
+    r = math.cos(0.7) + math.sin(0.7) * e1 * e2
+    x = alg.rand(1) + alg.rand(3)
+
+    result = r.sandwich(x)
+
+    assert result.grades <= {1, 3}
+    assert abs(result - (r * x * r.r).take_grades(1, 3)) < 1e-12
+    assert r.sandwich(x, grades=3).grades <= {3}
+
+
+def test_reflection_in_a_hyperplane():
+    e1, e2, e3 = ClAlg.from_pq(3, 0).get_bases(1)
+
+    assert e1.twisted_sandwich(2 * e1 + e2 + 3 * e3) == -2 * e1 + e2 + 3 * e3
+
+
+def test_symbolic_factors():
+    e1, e2, e3 = ClAlg.from_pq(3, 0).get_bases(1)
+    a, b = Sym("a"), Sym("b")
+    r = a + b * e1 * e2
+
+    assert r.sandwich(e1 + e3) == (r * (e1 + e3) * r.r).take_grades(1)
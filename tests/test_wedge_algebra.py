@@ -0,0 +1,18 @@
+from algebrant.wedge.wedge_algebra import MVw
+
+
+def test_vector_product_is_dot_plus_wedge():
+    a, b = MVw("a"), MVw("b")
+
+    assert a * b == (a << b) + (a ^ b)
+    assert (2 * a) * b == 2 * (a * b)
+    assert a * (3 * b) == 3 * (a * b)
+
+
+def test_product_of_three_vectors():
+    a, b, c = MVw("a"), MVw("b"), MVw("c")
+
+    expected = (b << c) * a - (a << c) * b + (a << b) * c + (a ^ b ^ c)
+
+    assert a * b * c == expected
+    assert (a * b) * c == a * (b * c)
@@ -0,0 +1,45 @@
+from fractions import Fraction
+
+from algebrant.algebra.algebra_data import AlgebraData
+from algebrant.algebra.zero_prune import PRUNE_CONFIG, ZeroPruning, prune_rules
+from algebrant.clifford.clalg import ClAlg
+
+
+def test_from_seq_prunes_only_at_the_end():
+    data = AlgebraData.from_seq([("a", 1), ("a", -1), ("b", 2), ("a", 3), ("b", -2)])
+
+    assert data.basis_factor == {"a": 3}
+
+
+def test_tolerance_applies_to_numbers_only():
+    pruning = ZeroPruning(abs_tol=1e-10)
+
+    assert pruning.prune({"a": 1e-12, "b": 1.0, "c": 0j}) == {"b": 1.0}
+    assert ZeroPruning().prune({"a": Fraction(1, 10**20), "b": Fraction(0)}) == {
+        "a": Fraction(1, 10**20)
+    }
+
+
+def test_bulk_operations_cancel_terms():
+    data = AlgebraData({"a": 1, "b": 2})
+
+    assert data.map(lambda basis, factor: [("c", factor), (basis, -factor)]).basis_factor == {
+        "c": 3,
+        "a": -1,
+        "b": -2,
+    }
+    assert data.replace(lambda basis: [("c", 1 if basis == "a" else -0.5)]).basis_factor == {}
+
+
+def test_products_use_the_configured_clip():
+    e1, e2 = ClAlg.from_pq(2, 0).get_bases(1)
+
+    assert (e1 + e2) * (e1 - e2) == -2 * e1 * e2
+    small = e1 * 1e-6
+
+    assert small.basis_factor and not (small * small).basis_factor
+
+    with prune_rules(clip=0):
+        assert (small * small).basis_factor
+
+    assert PRUNE_CONFIG.clip.abs_tol == 1e-10